@@ -11,6 +11,7 @@ class MongoDB:
         self.db_name = os.getenv("MONGODB_DB_NAME", "tender_insight")
         self.client = None
         self.db = None
+        self.connected = False  # Set only once a ping succeeds
     
     async def connect(self):
         """Connect to MongoDB"""
@@ -21,6 +22,7 @@ class MongoDB:
             
             # Test the connection
             await self.db.command('ping')
+            self.connected = True
             print("✅ MongoDB connected successfully!")
             
             # Create indexes for better performance
@@ -28,6 +30,7 @@ class MongoDB:
             return self.db
             
         except Exception as e:
+            self.connected = False
             print(f"❌ MongoDB connection failed: {e}")
             print("💡 Make sure MongoDB is running: mongod")
             print("💡 Or install MongoDB: https://www.mongodb.com/try/download/community")
@@ -39,12 +42,17 @@ class MongoDB:
             # Index for AI analysis results
             await self.db.ai_analysis_results.create_index("tender_id")
             await self.db.ai_analysis_results.create_index("created_at")
+            await self.db.ai_analysis_results.create_index("values.deadline_date")
+            await self.db.ai_analysis_results.create_index("values.budget_amount")
             
             # Index for match results
             await self.db.match_results.create_index("tender_id")
             await self.db.match_results.create_index("company_profile_id")
             await self.db.match_results.create_index("created_at")
             
+            # Summary cache: documents are removed by MongoDB once expires_at passes
+            await self.db.summary_cache.create_index("expires_at", expireAfterSeconds=0)
+            
             # Index for user activities
             await self.db.user_activities.create_index("user_id")
             await self.db.user_activities.create_index("created_at")
@@ -57,6 +65,7 @@ class MongoDB:
     
     async def close(self):
         """Close MongoDB connection"""
+        self.connected = False
         if self.client:
             self.client.close()
             print("🔌 MongoDB connection closed")
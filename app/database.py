@@ -1,4 +1,5 @@
 from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from pymongo import MongoClient
@@ -25,6 +26,21 @@ except Exception as e:
     print(f"MongoDB connection failed: {e}. Using in-memory storage for development.")
     mongodb = None
 
+# INSERT constructs with ON CONFLICT DO UPDATE, used by the stores that upsert
+UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+def check_upsert_support(bind=engine):
+    """Fail at startup on a backend the upserting stores cannot write to"""
+    if bind.dialect.name not in UPSERT_INSERTS:
+        raise RuntimeError(f"Unsupported database backend '{bind.dialect.name}': "
+                           f"upserts need one of {', '.join(UPSERT_INSERTS)}")
+
+def upsert_insert(db, table):
+    """INSERT ... ON CONFLICT construct for the session's backend"""
+    bind = db.get_bind()
+    check_upsert_support(bind)
+    return UPSERT_INSERTS[bind.dialect.name](table)
+
 def get_db():
     db = SessionLocal()
     try:
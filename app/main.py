@@ -3,7 +3,8 @@ from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy.orm import Session
 from app.mongodb import mongodb 
-from app.database import get_db, Base, engine
+from app.Mongodatabase.mongodb import mongodb as service_mongodb
+from app.database import get_db, Base, engine, check_upsert_support
 from contextlib import asynccontextmanager
 import time
 import os
@@ -12,21 +13,19 @@ import shutil
 from fastapi.middleware.cors import CORSMiddleware
 
 # Import existing routers
-from app.routes import company, auth, tenders, tender_summarize, workspace
-
-# Import summarization services
-from app.services.tender_doc_services import (
-    extract_text_from_pdf,
-    extract_text_from_zip,
-    summarize_text,
-    highlight_key_points
-)
+from app.routes import company, auth, tenders, tender_summarize, workspace, readiness
+
+# Extraction pool is shut down with the app (uploads are handled in tender_summarize)
+from app.services.extraction_executor import extraction_executor
+from app.services.job_queue import job_queue
+from app.services.summary_inference import inference_worker
 
 
 # Create database tables
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Create SQL tables on startup
+    check_upsert_support(engine)
     print("Creating SQL database tables...")
     Base.metadata.create_all(bind=engine)
     print("SQL database tables created successfully!")
@@ -35,10 +34,23 @@ async def lifespan(app: FastAPI):
     print("Initializing MongoDB...")
     await mongodb.connect()
     
+    # Connection used by mongodb_service and the summary cache (also creates indexes)
+    await service_mongodb.connect()
+    
+    # Model inference worker (only when abstractive summaries are enabled)
+    inference_worker.start()
+    
+    # Background workers for auto-summarize jobs
+    job_queue.start_workers()
+    
     yield
     
     # Cleanup on shutdown
     await mongodb.close()
+    await service_mongodb.close()
+    job_queue.stop_workers()
+    inference_worker.stop()
+    extraction_executor.shutdown()
 
 app = FastAPI(
     title="Tender Insight Hub API",
@@ -80,6 +92,7 @@ app.include_router(tenders.router)
 app.include_router(company.router)
 app.include_router(auth.router)
 app.include_router(tender_summarize.router) 
+app.include_router(readiness.router)
 app.include_router(
     workspace.router, 
     prefix="/api/workspace", 
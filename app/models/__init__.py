@@ -1,2 +1,2 @@
-
-from .tender_match import TenderMatchScore
\ No newline at end of file
+from .tender_match import TenderMatchScore
+from .tender_requirements import TenderRequirements
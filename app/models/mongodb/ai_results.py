@@ -27,7 +27,7 @@ class AIAnalysisResult:
             # Processing Metadata
             "processing_time_ms": 0,
             "ai_model_used": "facebook/bart-large-cnn",
-            "extraction_method": "pypdf2",
+            "extraction_method": summary_data.get("extraction_method", "pypdfium2"),
             
             # Timestamps
             "created_at": datetime.utcnow(),
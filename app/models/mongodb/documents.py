@@ -23,7 +23,7 @@ class TenderDocument:
             "extracted_text": None,
             "extraction_status": "pending",  # pending, success, failed
             "extraction_date": None,
-            "extraction_method": None,  # pypdf2, pdfplumber, ocr
+            "extraction_method": None,  # pypdfium2, pdfplumber, pdfminer, pypdf2, ocr
             
             # Processing metadata
             "text_length": 0,
@@ -1,20 +1,29 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Index, UniqueConstraint
 from sqlalchemy.sql import func
 from app.database import Base
 
 class TenderMatchScore(Base):
     __tablename__ = "tender_match_scores"
+    __table_args__ = (
+        # One score per tender and company (upsert target), also serves match-score lookups
+        UniqueConstraint("tender_id", "company_id", name="uq_tender_match_scores_tender_company"),
+        # match-history: a company's scores, most recent first
+        Index("ix_tender_match_scores_company_updated", "company_id", "updated_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     tender_id = Column(String(255), nullable=False, index=True)
+    company_id = Column(Integer, nullable=False)  # CompanyProfile.id (NOT NULL: NULLs never conflict in the upsert key)
     user_id = Column(Integer, nullable=True)  # Add when user auth is ready
     suitability_score = Column(Integer, nullable=False)  # 0-100
     recommendation = Column(String(255), nullable=False)
     checklist = Column(Text, nullable=True)  # Store checklist as JSON string
     matched_criteria_count = Column(Integer, default=0)
     total_criteria_count = Column(Integer, default=0)
+    criteria = Column(Text, nullable=True)  # JSON {criterion: {"points", "checklist"}}, for partial rescoring
+    depends_mask = Column(Integer, nullable=True)  # bits of the criteria that depend on the company (readiness_engine.CRITERION_BITS)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     def __repr__(self):
-        return f"<TenderMatchScore tender_id={self.tender_id} score={self.suitability_score}>"
\ No newline at end of file
+        return f"<TenderMatchScore tender_id={self.tender_id} score={self.suitability_score}>"
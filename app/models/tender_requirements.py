@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, JSON
+from sqlalchemy.sql import func
+from app.database import Base
+
+class TenderRequirements(Base):
+    """Structured requirement record of one tender, extracted once and compared against company profiles"""
+    __tablename__ = "tender_requirements"
+
+    id = Column(Integer, primary_key=True, index=True)
+    tender_id = Column(String(255), nullable=False, unique=True, index=True)  # Tender.ocds_id
+    source = Column(String(20), nullable=False)  # posted | ingest | summary | documents
+    content_hash = Column(String(64), nullable=False)  # sha256 of the text the record was read from
+    extractor_version = Column(String(10), nullable=False)
+
+    industries = Column(JSON, default=list)
+    required_years = Column(Integer, default=0)
+    location = Column(String(255), default="")
+    province = Column(String(50), nullable=True, index=True)
+    certifications = Column(JSON, default=list)
+    cidb_grade = Column(Integer, nullable=True)
+    bbbee_level = Column(Integer, nullable=True)
+    requires_staff = Column(Boolean, default=False)
+    min_employees = Column(Integer, nullable=True)
+    requires_turnover = Column(Boolean, default=False)
+    min_turnover = Column(Float, nullable=True)
+    requires_bbbee = Column(Boolean, default=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), index=True)  # recommendations watch max(updated_at)
+
+    def __repr__(self):
+        return f"<TenderRequirements tender_id={self.tender_id} source={self.source}>"
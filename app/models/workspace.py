@@ -1,11 +1,11 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Boolean  # ADD Boolean here
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Boolean, Float  # ADD Boolean here
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship  # ADD this import
 from app.database import Base
 
 
 class WorkspaceTender(Base):
-    _tablename_ = "workspace_tenders"
+    __tablename__ = "workspace_tenders"
     
     id = Column(Integer, primary_key=True, index=True)
     tender_id = Column(String(255), nullable=False, index=True)
@@ -15,8 +15,9 @@ class WorkspaceTender(Base):
     # Tender details
     title = Column(String(500), nullable=False)
     description = Column(Text)
-    deadline = Column(DateTime)
+    deadline = Column(DateTime, index=True)
     budget = Column(String(100))
+    budget_amount = Column(Float, index=True)  # budget parsed to rands, for sorting/analytics
     province = Column(String(100))
     buyer_name = Column(String(255))
     
@@ -34,7 +35,7 @@ class WorkspaceTender(Base):
 
 
 class WorkspaceTenderNote(Base):
-    _tablename_ = "workspace_tender_notes"
+    __tablename__ = "workspace_tender_notes"
     
     id = Column(Integer, primary_key=True, index=True)
     workspace_tender_id = Column(Integer, ForeignKey('workspace_tenders.id'), nullable=False)
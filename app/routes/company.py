@@ -1,9 +1,14 @@
 # routes/company.py
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.user_models import CompanyProfile, Team, User, INDUSTRY_SECTORS, PROVINCES, CERTIFICATION_OPTIONS
 from app.auth import get_current_user
+from app.services.company_profiles import CompiledCompanyProfile, company_profile_cache
+from app.services.readiness_engine import changed_profile_criteria, rule_set_changed
+from app.services.recommendations import recommendation_service
+from app.services.rescoring import rescore_company
 from pydantic import BaseModel
 
 router = APIRouter(prefix="/company", tags=["company"])
@@ -50,6 +55,9 @@ async def create_company_profile(
         # Check if profile already exists
         existing_profile = db.query(CompanyProfile).filter(CompanyProfile.team_id == current_user.team_id).first()
         
+        # What scoring saw before the edit, to rescore only the criteria that change
+        previous = CompiledCompanyProfile(existing_profile) if existing_profile else None
+        
         if existing_profile:
             # Update existing profile
             for field, value in profile_data.dict().items():
@@ -64,7 +72,22 @@ async def create_company_profile(
             db.add(new_profile)
         
         db.commit()
-        return {"message": "Company profile saved successfully"}
+        # Scoring reads the compiled profile; recompile on next use
+        company_profile_cache.invalidate(current_user.team_id)
+        recommendation_service.invalidate(current_user.team_id)
+        
+        # Stored match scores: re-evaluate only the affected criteria of the dependent tenders
+        rescored = 0
+        if previous is not None:
+            try:
+                updated = CompiledCompanyProfile(existing_profile)
+                criteria = changed_profile_criteria(previous.data, updated.data)
+                rescored = await asyncio.to_thread(rescore_company, db, updated, criteria,
+                                                   rule_set_changed(previous.data, updated.data))
+            except Exception as e:
+                db.rollback()
+                print(f"⚠️ Could not rescore stored matches: {e}")
+        return {"message": "Company profile saved successfully", "scores_updated": rescored}
         
     except Exception as e:
         db.rollback()
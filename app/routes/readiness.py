@@ -0,0 +1,93 @@
+# routes/readiness.py
+import asyncio
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.auth import get_current_user_optional
+from app.database import get_db
+from app.models.user_models import User
+from app.services.company_profiles import get_compiled_profile
+from app.services.readiness_engine import rank_tenders
+from app.services.recommendations import recommendation_service
+
+router = APIRouter(prefix="/api/readiness", tags=["readiness"])
+
+MAX_BATCH_TENDERS = 1000
+
+
+class BatchTender(BaseModel):
+    tender_id: str
+    summary: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+
+
+class BatchReadinessRequest(BaseModel):
+    tenders: List[BatchTender]
+    limit: Optional[int] = None
+    min_score: int = 0
+
+
+@router.post("/batch")
+async def batch_readiness(
+    payload: BatchReadinessRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user_optional)
+):
+    """
+    Score many tenders against the team's company profile in one call.
+    Each tender needs a summary (or title/description); results are ranked best first.
+    """
+    if len(payload.tenders) > MAX_BATCH_TENDERS:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BATCH_TENDERS} tenders per batch")
+
+    tenders = []
+    for tender in payload.tenders:
+        text = tender.summary or f"{tender.title or ''}\n{tender.description or ''}"
+        if text.strip():
+            tenders.append({"tender_id": tender.tender_id, "text": text})
+
+    try:
+        profile = get_compiled_profile(db, current_user)
+        ranked = await asyncio.to_thread(
+            rank_tenders, tenders, profile.data, payload.limit, payload.min_score, profile.vector
+        )
+    except Exception as e:
+        print(f"❌ Batch readiness error: {e}")
+        raise HTTPException(status_code=500, detail=f"Batch readiness error: {str(e)}")
+
+    return {
+        "success": True,
+        "company_used": profile.name,
+        "tenders_scored": len(tenders),
+        "skipped": len(payload.tenders) - len(tenders),
+        "results": ranked
+    }
+
+
+@router.get("/recommended")
+async def recommended_tenders(
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user_optional)
+):
+    """
+    "Recommended for you": the open tenders that best match the team's company profile.
+    Cached per team until new tenders arrive or the profile changes.
+    """
+    try:
+        profile = get_compiled_profile(db, current_user)
+        recommended = await asyncio.to_thread(recommendation_service.recommend, db, profile, limit)
+    except Exception as e:
+        print(f"❌ Recommendation error: {e}")
+        raise HTTPException(status_code=500, detail=f"Recommendation error: {str(e)}")
+
+    return {
+        "success": True,
+        "company_used": profile.name,
+        "cached": recommended["cached"],
+        "results": recommended["results"]
+    }
@@ -1,14 +1,24 @@
 from fastapi import APIRouter, UploadFile, File, Request, HTTPException, Form,Depends
-from fastapi.responses import HTMLResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
-import shutil, os, json
+import shutil, os, json, asyncio
 from datetime import datetime
 from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import SessionLocal, get_db
+from app.models.tender_models import Tender
 from app.models.user_models import CompanyProfile, User
 from app.auth import get_current_user , get_current_user_optional
-from typing import Optional
+from typing import Dict, List, Optional
 from app.services.mongodb_service import mongodb_service
+from app.services.archive_reader import ArchiveTooLargeError
+from app.services.upload_service import upload_service, UploadTooLargeError, UnsupportedDocumentError
+from app.services.summary_cache import summarize_cached
+from app.services.company_profiles import find_team_company_profile, get_compiled_profile
+from app.services.match_score_store import match_score_store
+from app.services.rescoring import rescore_tenders
+from app.services.tender_requirements import tender_requirement_store
+from app.services.tender_analysis import SECTION_BANK, analyze_text
 
 from app.services.tender_doc_services import (
     extract_text_from_pdf,
@@ -21,13 +31,100 @@ from app.services.tender_doc_services import (
 router = APIRouter()
 templates = Jinja2Templates(directory="app/templates")
 
-# In-memory storage for match scores (replace with database later)
-match_scores_storage = {}
+async def _read_summarize_input(file: Optional[UploadFile], tender_data: Optional[str]) -> Dict:
+    """
+    Text to summarize from a file upload or JSON form data.
+    Returns {"text", "tender_id", "documents_processed", "file_uploaded"} or {"error"}.
+    """
+    tender_id = "file_upload"
+    documents_processed = 0
+    
+    # Handle file upload
+    if file and file.filename:
+        print(f"🔍 DEBUG: Processing file upload - {file.filename}")
+        try:
+            upload = await upload_service.extract_text(file)
+        except (UploadTooLargeError, ArchiveTooLargeError) as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except UnsupportedDocumentError as e:
+            raise HTTPException(status_code=415, detail=str(e))
+        
+        text = upload["text"]
+        tender_id = f"upload-{upload['sha256'][:16]}"
+        documents_processed = upload["documents_processed"]
+        print(f"🔍 DEBUG: Extracted {len(text)} characters from {upload['type']} upload ({upload['size']} bytes)")
+    
+    # Handle JSON data from form
+    elif tender_data:
+        print(f"🔍 DEBUG: Processing tender_data - {tender_data}")
+        try:
+            data = json.loads(tender_data)
+            tender_id = data.get('tender_id', 'unknown')
+            text = f"""
+            TENDER: {data.get('title', '')}
+            DESCRIPTION: {data.get('description', '')}
+            ADDITIONAL INFO: {data.get('text_content', '')}
+            """
+            print(f"🔍 DEBUG: Parsed JSON - Tender ID: {tender_id}")
+        except json.JSONDecodeError as e:
+            print(f"❌ DEBUG: JSON decode error - {e}")
+            return {"error": "Invalid JSON data"}
+    else:
+        print("❌ DEBUG: Neither file nor tender_data provided")
+        return {"error": "Either file or tender data must be provided"}
+
+    if not text.strip():
+        return {"error": "No text content to summarize"}
+    
+    return {
+        "text": text,
+        "tender_id": tender_id,
+        "documents_processed": documents_processed,
+        "file_uploaded": bool(file and file.filename)
+    }
+
+async def _store_summary(tender_id: str, summary: str, highlights: List[str], documents_processed: int,
+                         file_uploaded: bool, values: Dict = None) -> Dict:
+    """Store the analysis and log the activity; returns the MongoDB ids (None when storage failed)"""
+    summary_data = {
+        "summary": summary,
+        "highlights": highlights,
+        "tender_id": tender_id,
+        "documents_processed": documents_processed,
+        "values": values or {}
+    }
+    analysis_id = await mongodb_service.store_ai_analysis(tender_id, summary_data)
+    
+    # Log user activity
+    user_id = "anonymous"  # Replace with actual user ID when auth is available
+    activity_id = await mongodb_service.log_user_activity(user_id, "summarize", {
+        "tender_id": tender_id,
+        "file_uploaded": file_uploaded,
+        "summary_length": len(summary)
+    })
+    return {"analysis_id": analysis_id, "activity_id": activity_id}
+
+async def _store_requirements(db: Session, tender_id: str, text: str):
+    """
+    Persist a requirement record for matching from client-posted text. Only
+    tenders we ingested get one, and at the lowest source priority, so posted
+    text never replaces the ingest or document record every team scores against.
+    """
+    try:
+        if not db.query(Tender.id).filter(Tender.ocds_id == tender_id).first():
+            return
+        amended = tender_requirement_store.save(db, tender_id, text, "posted")
+        if amended:
+            await asyncio.to_thread(rescore_tenders, db, amended)
+    except Exception as e:
+        db.rollback()
+        print(f"⚠️ Could not store requirement record for {tender_id}: {e}")
 
 @router.post("/api/tenders/summarize")
 async def summarize_tender(
     file: UploadFile = File(None),
-    tender_data: str = Form(None)
+    tender_data: str = Form(None),
+    db: Session = Depends(get_db)
 ):
     """
     Summarize tender from either file upload or JSON data
@@ -35,72 +132,148 @@ async def summarize_tender(
     try:
         print(f"🔍 DEBUG: Received request - file: {file}, tender_data: {tender_data}")
         
-        text = ""
-        tender_id = "file_upload"
-        
-        # Handle file upload
-        if file and file.filename:
-            print(f"🔍 DEBUG: Processing file upload - {file.filename}")
-            # ... your existing file processing code ...
-        
-        # Handle JSON data from form
-        elif tender_data:
-            print(f"🔍 DEBUG: Processing tender_data - {tender_data}")
-            try:
-                data = json.loads(tender_data)
-                tender_id = data.get('tender_id', 'unknown')
-                text = f"""
-                TENDER: {data.get('title', '')}
-                DESCRIPTION: {data.get('description', '')}
-                ADDITIONAL INFO: {data.get('text_content', '')}
-                """
-                print(f"🔍 DEBUG: Parsed JSON - Tender ID: {tender_id}")
-            except json.JSONDecodeError as e:
-                print(f"❌ DEBUG: JSON decode error - {e}")
-                return {"error": "Invalid JSON data"}
-        else:
-            print("❌ DEBUG: Neither file nor tender_data provided")
-            return {"error": "Either file or tender data must be provided"}
+        source = await _read_summarize_input(file, tender_data)
+        if "error" in source:
+            return source
+        tender_id = source["tender_id"]
 
-        if not text.strip():
-            return {"error": "No text content to summarize"}
+        # Generate summary (cached by content + extractor/model version)
+        summarized = await summarize_cached(source["text"])
+        summary = summarized["summary"]
+        highlights = summarized["highlights"]
 
-        # Generate summary
-        summary = summarize_text(text)
-        highlights = highlight_key_points(text)
-
-        print(f"✅ DEBUG: Summary generated successfully for tender {tender_id}")
+        print(f"✅ DEBUG: Summary generated successfully for tender {tender_id} (cache: {summarized['cache']})")
 
         # STORE IN MONGODB
-        summary_data = {
-            "summary": summary,
-            "highlights": highlights,
-            "tender_id": tender_id,
-            "documents_processed": 1 if file else 0
-        }
-        
-        # Store in MongoDB
-        await mongodb_service.store_ai_analysis(tender_id, summary_data)
-        
-        # Log user activity
-        user_id = "anonymous"  # Replace with actual user ID when auth is available
-        await mongodb_service.log_user_activity(user_id, "summarize", {
-            "tender_id": tender_id,
-            "file_uploaded": bool(file),
-            "summary_length": len(summary)
-        })
+        await _store_summary(tender_id, summary, highlights, source["documents_processed"], source["file_uploaded"],
+                             summarized["values"])
+        await _store_requirements(db, tender_id, source["text"])
 
         return {
             "success": True,
             "summary": summary,
             "highlights": highlights,
+            "values": summarized["values"],
             "tender_id": tender_id
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"❌ DEBUG: Summarization error - {e}")
         raise HTTPException(status_code=500, detail=f"Summarization error: {str(e)}")
 
+def _sse(event: str, data: Dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(jsonable_encoder(data))}\n\n"
+
+STREAMED_SECTIONS = ('objective', 'scope', 'deadline', 'budget', 'location')
+
+async def _stream_summary(source: Dict):
+    """
+    Server-Sent Events for one summary: for uploads, each section as soon as
+    the page or document containing it is extracted; then the remaining
+    sections and highlights, the (slow) abstractive overview after them,
+    and a final "complete" event with the full result and storage ids.
+    The requirement record is stored as on the non-streaming routes.
+    """
+    sent = set()
+    try:
+        upload = source.get("upload")
+        if upload:
+            tender_id = f"upload-{upload['sha256'][:16]}"
+            yield _sse("status", {"stage": "extracting", "tender_id": tender_id})
+            try:
+                async for extracted in upload_service.iter_text(upload):
+                    if "page" in extracted:
+                        for name, content in SECTION_BANK.scan(extracted["page"]).items():
+                            if content and name in STREAMED_SECTIONS and name not in sent:
+                                sent.add(name)
+                                yield _sse("section", {"name": name, "content": content})
+                    else:
+                        text = extracted["text"]
+                        documents_processed = extracted["documents_processed"]
+            finally:
+                os.remove(upload["path"])
+            if not text.strip():
+                yield _sse("error", {"success": False, "error": "No text content to summarize"})
+                return
+            file_uploaded = True
+        else:
+            text, tender_id = source["text"], source["tender_id"]
+            documents_processed, file_uploaded = source["documents_processed"], source["file_uploaded"]
+        
+        yield _sse("status", {"stage": "analyzing", "tender_id": tender_id})
+        
+        # Cheap regex/keyword analysis first, so sections arrive before the overview
+        analysis = await asyncio.to_thread(analyze_text, text)
+        requirements = analysis.requirements
+        for name in STREAMED_SECTIONS:
+            if requirements[name] and name not in sent:
+                yield _sse("section", {"name": name, "content": requirements[name]})
+        if requirements['eligibility_criteria']:
+            yield _sse("section", {"name": "eligibility_criteria", "content": requirements['eligibility_criteria']})
+        if requirements['key_requirements']:
+            yield _sse("section", {"name": "key_requirements", "content": requirements['key_requirements'][:5]})
+        yield _sse("values", analysis.values)
+        
+        highlights = await asyncio.to_thread(highlight_key_points, text)
+        for highlight in highlights:
+            yield _sse("highlight", {"content": highlight})
+        
+        yield _sse("status", {"stage": "summarizing"})
+        summarized = await summarize_cached(text)
+        summary = summarized["summary"]
+        
+        ids = await _store_summary(tender_id, summary, summarized["highlights"], documents_processed, file_uploaded,
+                                   summarized["values"])
+        # The request's get_db session is already closed while the body streams
+        db = SessionLocal()
+        try:
+            await _store_requirements(db, tender_id, text)
+        finally:
+            db.close()
+        
+        yield _sse("complete", {
+            "success": True,
+            "summary": summary,
+            "highlights": summarized["highlights"],
+            "values": summarized["values"],
+            "tender_id": tender_id,
+            "cache": summarized["cache"],
+            **ids
+        })
+    except Exception as e:
+        print(f"❌ Streaming summarization error: {e}")
+        yield _sse("error", {"success": False, "error": f"Summarization error: {str(e)}"})
+
+@router.post("/api/tenders/summarize/stream")
+async def summarize_tender_stream(
+    file: UploadFile = File(None),
+    tender_data: str = Form(None)
+):
+    """
+    Streaming (Server-Sent Events) variant of /api/tenders/summarize.
+    Events: status, section, values, highlight, complete (or error).
+    Uploads are only checked and copied here; extraction runs inside the stream.
+    """
+    if file and file.filename:
+        try:
+            source = {"upload": await upload_service.detach(file)}
+        except UploadTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except UnsupportedDocumentError as e:
+            raise HTTPException(status_code=415, detail=str(e))
+    else:
+        source = await _read_summarize_input(None, tender_data)
+        if "error" in source:
+            raise HTTPException(status_code=400, detail=source["error"])
+    
+    return StreamingResponse(
+        _stream_summary(source),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.post("/api/tenders/{tender_id}/match")
 async def match_tender(
     tender_id: str, 
@@ -117,48 +290,15 @@ async def match_tender(
         
         print(f"🔍 Matching tender {tender_id} with company profile...")
         
-        if not summary:
+        # The tender's stored requirement record. Only ingest, summarize and document
+        # processing write records; the posted summary is read (not stored) when there is none.
+        requirements = tender_requirement_store.get(db, tender_id)
+        if requirements is None and not summary:
             return {"error": "No summary provided for matching"}
 
-        if current_user: 
-            company_profile = db.query(CompanyProfile).filter(
-            CompanyProfile.team_id == current_user.team_id
-        ).first()
-        else:
-            company_profile = db.query(CompanyProfile).first()
-        
-        if not company_profile:
-            company_profile = CompanyProfile(
-                company_name="Demo Construction Company",
-                industry_sector="Construction",
-                services_provided="Building Construction, Civil Engineering, Road Works",
-                years_of_experience=8,
-                cidb_grading="7CE",
-                bbbee_level="2",
-                operating_provinces="Gauteng, Western Cape, KwaZulu-Natal",
-                number_of_employees=45,
-                annual_turnover="R 50,000,000",
-                team_id=1  # Default team ID
-            )
-            db.add(company_profile)
-            db.commit()
-            db.refresh(company_profile)
-            print("🏢 Created default company profile for testing")
-            
-
-        # Convert company profile to the format expected by readiness_scoring
-        company_data = {
-            "name": company_profile.company_name,
-            "industry": company_profile.industry_sector,
-            "services": company_profile.services_provided.split(',') if company_profile.services_provided else [],
-            "certifications": _extract_certifications(company_profile),
-            "geographic_coverage": company_profile.operating_provinces.split(',') if company_profile.operating_provinces else [],
-            "years_of_experience": company_profile.years_of_experience,
-            "annual_turnover": _parse_turnover(company_profile.annual_turnover),
-            "employee_count": company_profile.number_of_employees,
-            "black_owned": _is_black_owned(company_profile.bbbee_level),
-            "sme": company_profile.number_of_employees < 50  # SME definition
-        }
+        # Compiled once per team (cached), already in the format expected by readiness_scoring
+        profile = get_compiled_profile(db, current_user)
+        company_data = profile.data
         
         print(f"🏢 Using company: {company_data['name']}")
         if current_user:
@@ -168,22 +308,17 @@ async def match_tender(
             
         
         # Calculate readiness score
-        match_result = readiness_scoring(summary, company_data)
+        match_result = readiness_scoring(summary, company_data, requirements)
         
-        company_profile_id = str(company_profile.id) if hasattr(company_profile, 'id') else "default"
+        company_profile_id = str(profile.id)
         await mongodb_service.store_match_result(tender_id, company_profile_id, match_result)
 
         
         
 
-        # Store the match result
-        match_scores_storage[tender_id] = {
-            **match_result,
-            "tender_id": tender_id,
-            "timestamp": datetime.now().isoformat(),
-            "company_used": company_data['name'],
-            "authenticated": current_user is not None
-        }
+        # Store the match result (one row per tender and company, shared by all workers)
+        match_score_store.upsert(db, tender_id, profile.id, match_result,
+                                 user_id=current_user.id if current_user else None)
 
         user_id = str(current_user.id) if current_user else "anonymous"
         await mongodb_service.log_user_activity(user_id, "match_tender", {
@@ -210,46 +345,23 @@ async def match_tender(
             "detail": f"Matching error: {str(e)}"
         }
 
-def _extract_certifications(company_profile):
-    """Extract certifications from company profile"""
-    certifications = []
-    if company_profile.cidb_grading:
-        certifications.append(f"CIDB {company_profile.cidb_grading}")
-    if company_profile.bbbee_level:
-        certifications.append(f"BBBEE {company_profile.bbbee_level}")
-    return certifications
-
-def _parse_turnover(turnover_str):
-    """Parse turnover string to numeric value"""
-    if not turnover_str:
-        return 0
-    try:
-        # Handle formats like "R 5,000,000" or "5 million"
-        turnover_str = turnover_str.upper().replace('R', '').replace(' ', '').replace(',', '')
-        if 'MILLION' in turnover_str:
-            return int(float(turnover_str.replace('MILLION', '')) * 1000000)
-        return int(turnover_str)
-    except:
-        return 0
-
-def _is_black_owned(bbbee_level):
-    """Determine if company is black-owned based on BBBEE level"""
-    if not bbbee_level:
-        return False
-    # Assume levels 1-3 indicate significant black ownership
-    return any(level in str(bbbee_level) for level in ['1', '2', '3'])
-
 @router.get("/api/tenders/{tender_id}/match-score")
-async def get_tender_match_score(tender_id: str):
+async def get_tender_match_score(
+    tender_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user_optional)
+):
     """
     Get stored match score for a tender
     """
     try:
-        if tender_id in match_scores_storage:
+        company_profile = find_team_company_profile(db, current_user)
+        stored = match_score_store.get(db, tender_id, company_profile.id) if company_profile else None
+        if stored:
             return {
                 "success": True,
-                "tender_id": tender_id,
-                **match_scores_storage[tender_id]
+                **stored,
+                "company_used": company_profile.company_name
             }
         else:
             return {
@@ -263,20 +375,25 @@ async def get_tender_match_score(tender_id: str):
         raise HTTPException(status_code=500, detail=f"Error fetching match score: {str(e)}")
 
 @router.get("/api/company/match-history")
-async def get_company_match_history():
+async def get_company_match_history(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user_optional)
+):
     """
     Get all tender match scores for the company
     """
     try:
+        company_profile = find_team_company_profile(db, current_user)
+        stored = match_score_store.history(db, company_profile.id) if company_profile else []
         results = []
-        for tender_id, score_data in match_scores_storage.items():
+        for score_data in stored:
             results.append({
-                "tender_id": tender_id,
+                "tender_id": score_data["tender_id"],
                 "suitability_score": score_data["suitability_score"],
                 "recommendation": score_data["recommendation"],
                 "matched_criteria": score_data.get("matched_criteria", 0),
                 "total_criteria": score_data.get("total_criteria", 0),
-                "last_updated": score_data.get("timestamp", "Unknown")
+                "last_updated": score_data.get("timestamp") or "Unknown"
             })
         
         return {
@@ -320,35 +437,59 @@ async def test_summarize():
     except Exception as e:
         return {"success": False, "error": str(e)}
 
-@router.post("/api/tenders/summarize-from-data")
-async def summarize_tender_from_data(tender_data: dict):
-    """
-    Summarize tender from provided data (not file upload)
-    """
-    try:
-        # Extract text from the tender data
-        text = f"""
+def _tender_data_text(tender_data: dict) -> str:
+    return f"""
         Tender Title: {tender_data.get('title', '')}
         Description: {tender_data.get('description', '')}
         Buyer: {tender_data.get('buyer', {}).get('name', '')}
         Province: {tender_data.get('province', '')}
         Budget: {tender_data.get('value', {}).get('amount', '')}
         """
+
+@router.post("/api/tenders/summarize-from-data")
+async def summarize_tender_from_data(tender_data: dict, db: Session = Depends(get_db)):
+    """
+    Summarize tender from provided data (not file upload)
+    """
+    try:
+        # Extract text from the tender data
+        text = _tender_data_text(tender_data)
         
         # Generate summary
-        summary = summarize_text(text)
-        highlights = highlight_key_points(text)
+        summarized = await summarize_cached(text)
+        summary = summarized["summary"]
+        highlights = summarized["highlights"]
+        if tender_data.get('tender_id'):
+            await _store_requirements(db, tender_data['tender_id'], text)
 
         return {
             "success": True,
             "summary": summary,
             "highlights": highlights,
+            "values": summarized["values"],
             "tender_id": tender_data.get('tender_id')
         }
     
     except Exception as e:
         return {"success": False, "error": str(e)}
 
+@router.post("/api/tenders/summarize-from-data/stream")
+async def summarize_tender_from_data_stream(tender_data: dict):
+    """
+    Streaming (Server-Sent Events) variant of /api/tenders/summarize-from-data
+    """
+    source = {
+        "text": _tender_data_text(tender_data),
+        "tender_id": tender_data.get('tender_id') or 'unknown',
+        "documents_processed": 0,
+        "file_uploaded": False
+    }
+    return StreamingResponse(
+        _stream_summary(source),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.post("/api/tenders/{tender_id}/summarize")
 async def summarize_specific_tender(tender_id: str):
     """
@@ -1,9 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import JSONResponse
 from typing import Optional
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.tender_models import Tender
 from app.services.ocds_service import ocds_service
+from app.services.job_queue import job_queue, FINISHED_STATUSES
+from app.services.rescoring import rescore_tenders
+from app.services.tender_requirements import tender_requirement_store
 
 router = APIRouter(prefix="/api/tenders", tags=["tenders"])
 
@@ -36,6 +41,7 @@ async def search_tenders(
         tenders = ocds_service.search_tenders(keywords, filters)
 
         processed_tenders = []
+        requirement_texts = {}  # ocid -> text the requirement record is read from
 
         # Process tender information from OCDS format
         for tender_data in tenders:
@@ -123,6 +129,8 @@ async def search_tenders(
 
                 }
                 processed_tenders.append(processed_tender)
+                if ocid:
+                    requirement_texts[ocid] = f"{title}\n{description}\n{location}"
 
                 # Store in database (if new)
                 if ocid and not db.query(Tender).filter(Tender.ocds_id == ocid).first():
@@ -147,6 +155,16 @@ async def search_tenders(
 
         db.commit()
 
+        # Requirement records for matching; unchanged tenders are skipped
+        try:
+            _, amended = tender_requirement_store.save_many(db, requirement_texts, "ingest")
+            if amended:
+                # Amended tenders: refresh only their own stored scores, only the criteria that moved
+                await asyncio.to_thread(rescore_tenders, db, amended)
+        except Exception as e:
+            db.rollback()
+            print(f"⚠️ Could not store requirement records: {e}")
+
         return {
             "count": len(processed_tenders),
             "results": processed_tenders,
@@ -275,52 +293,103 @@ async def debug_tender_structure():
         
     except Exception as e:
         return {"error": str(e)}
-@router.post("/api/tenders/{tender_id}/auto-summarize")
+@router.post("/{tender_id}/auto-summarize", status_code=202)
 async def auto_summarize_tender_documents(
     tender_id: str,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """
-    Automatically download, process, and summarize documents for a tender
+    Queue download, processing and summarization of a tender's documents.
+    Returns a job id immediately; poll the status URL for progress. Repeat
+    requests while a job is active attach to that job.
     """
     try:
-        # Get tender from database
         tender = db.query(Tender).filter(Tender.ocds_id == tender_id).first()
         if not tender:
             raise HTTPException(status_code=404, detail="Tender not found")
         
-        # Check if tender has documents
         documents = tender.documents or []
         if not documents:
+            response.status_code = 200
             return {
                 "success": False,
                 "message": "No documents found for this tender",
                 "tender_id": tender_id
             }
         
-        print(f"📄 Found {len(documents)} documents for tender {tender_id}")
-        
-        # Process all documents
-        from app.services.document_service import document_service
-        processing_result = await document_service.process_tender_documents(documents)
+        job = await asyncio.to_thread(job_queue.enqueue, "auto_summarize", tender_id)
+        status_url = f"/api/tenders/jobs/{job['id']}"
+        response.headers["Location"] = status_url
         
-        # Store the results (you might want to create a new table for this)
-        # For now, we'll return them directly
+        print(f"📥 Auto-summarize job {job['id']} {'reused' if job['deduplicated'] else 'queued'} for tender {tender_id}")
         
         return {
             "success": True,
             "tender_id": tender_id,
             "tender_title": tender.title,
             "total_documents": len(documents),
-            "processed_documents": processing_result["total_documents_processed"],
-            "overall_summary": processing_result["overall_summary"],
-            "overall_highlights": processing_result["overall_highlights"],
-            "document_summaries": processing_result["document_summaries"]
+            "job_id": job["id"],
+            "status": job["status"],
+            "deduplicated": job["deduplicated"],
+            "status_url": status_url,
+            "result_url": f"{status_url}/result"
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"❌ Auto-summarization error: {e}")
-        raise HTTPException(status_code=500, detail=f"Auto-summarization failed: {str(e)}")
+        print(f"❌ Auto-summarization queue error: {e}")
+        raise HTTPException(status_code=500, detail=f"Could not queue auto-summarization: {str(e)}")
+
+@router.get("/jobs/{job_id}")
+async def get_job_status(job_id: str):
+    """
+    Get the status of a background job
+    """
+    job = await asyncio.to_thread(job_queue.get, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    return {
+        "job_id": job["id"],
+        "kind": job["kind"],
+        "tender_id": job["tender_id"],
+        "status": job["status"],
+        "attempts": job["attempts"],
+        "error": job["error"],
+        "created_at": job["created_at"],
+        "started_at": job["started_at"],
+        "finished_at": job["finished_at"],
+        "result_url": f"/api/tenders/jobs/{job['id']}/result"
+    }
+
+@router.get("/jobs/{job_id}/result")
+async def get_job_result(job_id: str):
+    """
+    Get the result of a finished job (202 while it is still queued or running)
+    """
+    job = await asyncio.to_thread(job_queue.get, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    if job["status"] not in FINISHED_STATUSES:
+        return JSONResponse(
+            status_code=202,
+            content={"job_id": job["id"], "status": job["status"]},
+            headers={"Retry-After": "5"}
+        )
+    
+    if job["status"] == "failed":
+        return {
+            "success": False,
+            "job_id": job["id"],
+            "status": job["status"],
+            "message": job["error"],
+            "result": job["result"]
+        }
+    
+    return {"job_id": job["id"], "status": job["status"], **job["result"]}
 
 @router.get("/api/tenders/{tender_id}/documents")
 async def get_tender_documents(tender_id: str, db: Session = Depends(get_db)):
@@ -1,12 +1,20 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import and_, func
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
 from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
+import asyncio
+from app.auth import get_current_user_optional
 from app.database import get_db
+from app.models.tender_match import TenderMatchScore
+from app.models.user_models import User
 from app.models.workspace import WorkspaceTender, WorkspaceTenderNote
+from app.services.company_profiles import find_team_company_profile, get_compiled_profile
+from app.services.workspace_matching import match_workspace_tenders
+from app.services.value_normalizer import parse_date, parse_zar_amount
 
 class NoteCreate(BaseModel):
     content: str
@@ -45,13 +53,18 @@ async def save_tender_to_workspace(
                 "detail": "Tender already in workspace"
             }
         
-        # Parse deadline if provided
+        # Parse deadline if provided (ISO, or SA formats such as 15/03/2025 11h00)
         deadline = None
         if data.get('deadline'):
             try:
                 deadline = datetime.fromisoformat(data['deadline'].replace('Z', '+00:00'))
             except:
-                pass
+                deadline = parse_date(str(data['deadline']))
+        
+        # Budget in rands ("R 5,000,000", "R5 million"), unless the client already sent it typed
+        budget_amount = data.get('budget_amount')
+        if budget_amount is None and data.get('budget') is not None:
+            budget_amount = parse_zar_amount(str(data['budget']))
         
         # Create new workspace entry
         workspace_tender = WorkspaceTender(
@@ -62,6 +75,7 @@ async def save_tender_to_workspace(
             description=data.get('description', ''),
             deadline=deadline,
             budget=data.get('budget'),
+            budget_amount=budget_amount,
             province=data.get('province'),
             buyer_name=data.get('buyer_name'),
             ai_summary=data.get('ai_summary', ''),
@@ -88,25 +102,41 @@ async def save_tender_to_workspace(
             "detail": f"Error saving tender: {str(e)}"
         }
 
+# The current team's stored score, else the score sent when the tender was saved
+MATCH_SCORE = func.coalesce(TenderMatchScore.suitability_score, WorkspaceTender.match_score)
+MATCH_RECOMMENDATION = func.coalesce(TenderMatchScore.recommendation, WorkspaceTender.match_recommendation)
+
+WORKSPACE_SORTS = {
+    # Match score (highest first), then deadline (soonest first)
+    "match": (MATCH_SCORE.desc().nullslast(), WorkspaceTender.deadline.asc().nullslast()),
+    "deadline": (WorkspaceTender.deadline.asc().nullslast(), MATCH_SCORE.desc().nullslast()),
+    "budget": (WorkspaceTender.budget_amount.desc().nullslast(), WorkspaceTender.deadline.asc().nullslast()),
+}
+
 @router.get("/tenders")
 async def get_workspace_tenders(
     status: Optional[str] = None,
-    db: Session = Depends(get_db)
+    sort: str = "match",
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user_optional)
 ):
     """
-    Get all tenders in workspace, optionally filtered by status
+    Get all tenders in workspace, optionally filtered by status.
+    Match scores are the current team's stored scores (tender_match_scores),
+    falling back to the score sent when the tender was saved.
+    sort: match (default), deadline or budget
     """
     try:
-        query = db.query(WorkspaceTender)
+        company_profile = find_team_company_profile(db, current_user)
+        query = db.query(WorkspaceTender, MATCH_SCORE, MATCH_RECOMMENDATION).outerjoin(TenderMatchScore, and_(
+            TenderMatchScore.tender_id == WorkspaceTender.tender_id,
+            TenderMatchScore.company_id == (company_profile.id if company_profile else None)
+        ))
         
         if status:
             query = query.filter(WorkspaceTender.status == status)
         
-        # Sort by match score (highest first), then by deadline (soonest first)
-        workspace_tenders = query.order_by(
-            WorkspaceTender.match_score.desc().nullslast(),
-            WorkspaceTender.deadline.asc().nullslast()
-        ).all()
+        workspace_tenders = query.order_by(*WORKSPACE_SORTS.get(sort, WORKSPACE_SORTS["match"])).all()
         
         return {
             "success": True,
@@ -117,15 +147,16 @@ async def get_workspace_tenders(
                     "title": wt.title,
                     "deadline": wt.deadline.isoformat() if wt.deadline else None,
                     "budget": wt.budget,
+                    "budget_amount": wt.budget_amount,
                     "province": wt.province,
                     "buyer_name": wt.buyer_name,
                     "ai_summary": wt.ai_summary,
-                    "match_score": wt.match_score,
-                    "match_recommendation": wt.match_recommendation,
+                    "match_score": match_score,
+                    "match_recommendation": match_recommendation,
                     "status": wt.status,
                     "created_at": wt.created_at.isoformat() if wt.created_at else None
                 }
-                for wt in workspace_tenders
+                for wt, match_score, match_recommendation in workspace_tenders
             ],
             "total_count": len(workspace_tenders)
         }
@@ -137,6 +168,36 @@ async def get_workspace_tenders(
             "detail": f"Error fetching workspace tenders: {str(e)}"
         }
 
+@router.post("/tenders/match-all")
+async def match_all_workspace_tenders(
+    status: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user_optional)
+):
+    """
+    Score every workspace tender (optionally only one status) against the team's
+    company profile in one pass and store the team's scores, which sort=match reads.
+    """
+    try:
+        profile = get_compiled_profile(db, current_user)
+        matched = await asyncio.to_thread(
+            match_workspace_tenders, db, profile, status, current_user.id if current_user else None
+        )
+        
+        return {
+            "success": True,
+            "company_used": profile.name,
+            **matched
+        }
+        
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error matching workspace tenders: {e}")
+        return {
+            "success": False,
+            "detail": f"Error matching workspace tenders: {str(e)}"
+        }
+
 @router.put("/tenders/{workspace_tender_id}/status")
 async def update_tender_status(
     workspace_tender_id: int,
@@ -0,0 +1,197 @@
+# app/services/abstractive_summarizer.py
+"""
+Optional abstractive tender summaries on CPU (facebook/bart-large-cnn by default).
+
+torch and transformers are imported on first use only, so the app starts
+without them and with ABSTRACTIVE_SUMMARY_ENABLED unset nothing is loaded.
+Linear layers are dynamically quantized to int8. Long documents are packed
+into token-bounded chunks, summarized in batches (map) and the partial
+summaries are summarized again until one fits a single chunk (reduce).
+"""
+import importlib.util
+import os
+import re
+import threading
+from typing import List
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+
+def env_flag(name: str, default: str = "false") -> bool:
+    return os.getenv(name, default).strip().lower() in ("1", "true", "yes", "on")
+
+
+class AbstractiveSummarizer:
+    """Lazily loaded, int8-quantized seq2seq summarizer with chunked map-reduce"""
+
+    def __init__(self):
+        self.enabled = env_flag("ABSTRACTIVE_SUMMARY_ENABLED")
+        self.model_name = os.getenv("SUMMARY_MODEL", "facebook/bart-large-cnn")
+        self.quantize = env_flag("SUMMARY_QUANTIZE", "true")
+        self.chunk_tokens = int(os.getenv("SUMMARY_CHUNK_TOKENS", 900))  # BART reads at most 1024
+        self.batch_size = int(os.getenv("SUMMARY_BATCH_SIZE", 4))
+        self.max_words = int(os.getenv("SUMMARY_MAX_WORDS", 120))
+        self.num_beams = int(os.getenv("SUMMARY_NUM_BEAMS", 2))
+        self.threads = int(os.getenv("SUMMARY_THREADS", 0))  # 0 = torch default
+        self.max_reduce_rounds = 4  # each round shrinks the text ~4x
+        self._model = None
+        self._tokenizer = None
+        self._torch = None
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> str:
+        """Identifies the output of this configuration (used in cache keys)"""
+        return f"{self.model_name}-{'int8' if self.quantize else 'fp32'}-w{self.max_words}"
+
+    def is_available(self) -> bool:
+        if not self.enabled:
+            return False
+        return all(importlib.util.find_spec(name) is not None for name in ("torch", "transformers"))
+
+    # ---------------------------
+    # Model loading
+    # ---------------------------
+
+    def _load(self):
+        with self._lock:
+            if self._model is not None:
+                return
+
+            import torch
+            from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+            print(f"🤖 Loading summarization model {self.model_name}...")
+            if self.threads:
+                torch.set_num_threads(self.threads)
+
+            tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
+            model.eval()
+            if self.quantize:
+                model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+            self._torch = torch
+            self._tokenizer = tokenizer
+            self._model = model
+            print(f"✅ Summarization model ready ({'int8' if self.quantize else 'fp32'})")
+
+    # ---------------------------
+    # Chunking
+    # ---------------------------
+
+    def chunk(self, text: str) -> List[str]:
+        """Pack whole sentences into chunks of at most chunk_tokens tokens"""
+        sentences = [s.strip() for s in _SENTENCE_END.split(text) if s.strip()]
+        if not sentences:
+            return []
+
+        budget = self.chunk_tokens - 2  # room for <s> and </s>
+        token_ids = self._tokenizer(sentences, add_special_tokens=False)["input_ids"]
+
+        chunks = []
+        current, current_tokens = [], 0
+        for sentence, ids in zip(sentences, token_ids):
+            if len(ids) > budget:
+                # A single overlong "sentence" (tables, lists): split on token windows
+                if current:
+                    chunks.append(" ".join(current))
+                    current, current_tokens = [], 0
+                for start in range(0, len(ids), budget):
+                    chunks.append(self._tokenizer.decode(ids[start:start + budget]))
+                continue
+            if current_tokens + len(ids) > budget:
+                chunks.append(" ".join(current))
+                current, current_tokens = [], 0
+            current.append(sentence)
+            current_tokens += len(ids)
+        if current:
+            chunks.append(" ".join(current))
+        return chunks
+
+    # ---------------------------
+    # Generation
+    # ---------------------------
+
+    def generate(self, texts: List[str], max_tokens: int, min_tokens: int = 0) -> List[str]:
+        """Summarize texts in batches of batch_size"""
+        self._load()
+        outputs = []
+        for start in range(0, len(texts), self.batch_size):
+            batch = texts[start:start + self.batch_size]
+            inputs = self._tokenizer(
+                batch, truncation=True, max_length=self.chunk_tokens, padding=True, return_tensors="pt"
+            )
+            with self._torch.inference_mode():
+                summary_ids = self._model.generate(
+                    **inputs,
+                    num_beams=self.num_beams,
+                    max_length=max_tokens,
+                    min_length=min_tokens,
+                    no_repeat_ngram_size=3,
+                    early_stopping=True
+                )
+            outputs.extend(self._tokenizer.batch_decode(summary_ids, skip_special_tokens=True))
+        return [output.strip() for output in outputs]
+
+    def summarize(self, text: str, max_words: int = None) -> str:
+        """Map-reduce summary of arbitrarily long text, capped at max_words words"""
+        return self.summarize_many([text], max_words)[0]
+
+    def summarize_many(self, texts: List[str], max_words: int = None) -> List[str]:
+        """
+        Summarize several documents together: every map/reduce round batches
+        the chunks of all documents still above one chunk, and the final pass
+        batches one input per document.
+        """
+        max_words = max_words or self.max_words
+        summaries = [""] * len(texts)
+        if not any(text and text.strip() for text in texts):
+            return summaries
+
+        self._load()
+        # Roughly 1.4 BPE tokens per English word
+        final_tokens = int(max_words * 1.4)
+        partial_tokens = min(final_tokens, 200)
+
+        doc_chunks = [self.chunk(text) if text and text.strip() else [] for text in texts]
+        for _ in range(self.max_reduce_rounds):
+            pending = [i for i, chunks in enumerate(doc_chunks) if len(chunks) > 1]
+            if not pending:
+                break
+            flat = [chunk for i in pending for chunk in doc_chunks[i]]
+            partials = self.generate(flat, max_tokens=partial_tokens, min_tokens=min(40, partial_tokens // 2))
+            position = 0
+            for i in pending:
+                count = len(doc_chunks[i])
+                doc_chunks[i] = self.chunk(" ".join(partials[position:position + count]))
+                position += count
+
+        ready = [i for i, chunks in enumerate(doc_chunks) if chunks]
+        # Anything still past one chunk after the reduce rounds is truncated by the tokenizer
+        finals = self.generate(
+            [" ".join(doc_chunks[i]) for i in ready],
+            max_tokens=final_tokens,
+            min_tokens=min(60, final_tokens // 2)
+        )
+        for i, summary in zip(ready, finals):
+            summaries[i] = self._truncate_words(summary, max_words)
+        return summaries
+
+    @staticmethod
+    def _truncate_words(summary: str, max_words: int) -> str:
+        """Trim to max_words, ending on a sentence boundary when one is available"""
+        words = summary.split()
+        if len(words) <= max_words:
+            return summary
+        clipped = " ".join(words[:max_words])
+        last_stop = max(clipped.rfind("."), clipped.rfind("!"), clipped.rfind("?"))
+        return clipped[:last_stop + 1] if last_stop > len(clipped) // 2 else clipped + "..."
+
+
+# Global instance (nothing is loaded until the first summary is requested)
+abstractive_summarizer = AbstractiveSummarizer()
@@ -0,0 +1,87 @@
+# app/services/archive_reader.py
+import io
+import logging
+import os
+import zipfile
+from typing import IO, Iterator, Tuple, Union
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Members with these extensions are read; everything else is skipped unopened
+DOCUMENT_EXTENSIONS = ('.pdf', '.docx')
+ARCHIVE_EXTENSIONS = ('.zip',)
+
+
+class ArchiveTooLargeError(Exception):
+    """Raised when an archive decompresses past the configured size limit (zip bomb guard)"""
+
+
+class ArchiveReader:
+    """Streams document members straight out of ZIP tender packs without extracting to disk"""
+
+    def __init__(self):
+        self.max_total_bytes = int(os.getenv("ARCHIVE_MAX_TOTAL_BYTES", 200 * 1024 * 1024))  # 200MB decompressed
+        self.max_depth = int(os.getenv("ARCHIVE_MAX_DEPTH", 3))  # nested ZIP levels
+        self.chunk_size = 64 * 1024
+
+    def iter_documents(self, source: Union[str, IO[bytes]]) -> Iterator[Tuple[str, bytes]]:
+        """
+        Yield (member_path, bytes) for every document in the archive, descending
+        into nested ZIPs. The decompressed total across all levels is capped.
+        """
+        budget = {"remaining": self.max_total_bytes}
+        yield from self._iter_archive(source, "", 0, budget)
+
+    def _iter_archive(self, source, prefix: str, depth: int, budget: dict) -> Iterator[Tuple[str, bytes]]:
+        with zipfile.ZipFile(source, 'r') as zip_ref:
+            for info in zip_ref.infolist():
+                if info.is_dir():
+                    continue
+
+                extension = os.path.splitext(info.filename.lower())[1]
+                is_archive = extension in ARCHIVE_EXTENSIONS
+                if extension not in DOCUMENT_EXTENSIONS and not is_archive:
+                    continue
+                if info.flag_bits & 0x1:
+                    logger.warning(f"Skipping encrypted archive member: {prefix}{info.filename}")
+                    continue
+                if is_archive and depth >= self.max_depth:
+                    logger.warning(f"Skipping nested archive beyond depth {self.max_depth}: {prefix}{info.filename}")
+                    continue
+
+                # Declared sizes can lie, so this is only a cheap early rejection
+                if info.file_size > budget["remaining"]:
+                    raise ArchiveTooLargeError(
+                        f"{prefix}{info.filename} would exceed the {self.max_total_bytes} byte archive limit"
+                    )
+
+                data = self._read_member(zip_ref, info, prefix, budget)
+
+                if is_archive:
+                    yield from self._iter_archive(io.BytesIO(data), f"{prefix}{info.filename}/", depth + 1, budget)
+                else:
+                    yield f"{prefix}{info.filename}", data
+
+    def _read_member(self, zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo, prefix: str, budget: dict) -> bytes:
+        """Decompress one member in chunks, enforcing the remaining size budget as bytes arrive"""
+        buffer = io.BytesIO()
+        with zip_ref.open(info) as member:
+            while True:
+                chunk = member.read(self.chunk_size)
+                if not chunk:
+                    break
+                budget["remaining"] -= len(chunk)
+                if budget["remaining"] < 0:
+                    raise ArchiveTooLargeError(
+                        f"{prefix}{info.filename} exceeded the {self.max_total_bytes} byte archive limit"
+                    )
+                buffer.write(chunk)
+        return buffer.getvalue()
+
+
+# Global instance
+archive_reader = ArchiveReader()
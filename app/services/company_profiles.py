@@ -0,0 +1,225 @@
+# app/services/company_profiles.py
+import os
+import re
+import threading
+import time
+from typing import Dict, FrozenSet, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+
+from app.models.user_models import CompanyProfile, Team, User
+from app.services.readiness_engine import company_vector
+from app.services.scoring_rules import rule_set_for
+from app.services.value_normalizer import parse_zar_amount
+
+load_dotenv()
+
+# "7CE", "CIDB 7 CE", "Grade 7", "7 GB/CE"
+_CIDB_GRADE = re.compile(r'(?P<grade>[1-9])\s*(?P<classes>(?:[A-Z]{2}\s*[/,&]?\s*)*)', re.IGNORECASE)
+_CIDB_CLASS = re.compile(r'[A-Z]{2}', re.IGNORECASE)
+_LEVEL = re.compile(r'[1-8]')
+
+
+def _extract_certifications(company_profile) -> list:
+    """Extract certifications from company profile"""
+    certifications = []
+    if company_profile.cidb_grading:
+        certifications.append(f"CIDB {company_profile.cidb_grading}")
+    if company_profile.bbbee_level:
+        certifications.append(f"BBBEE {company_profile.bbbee_level}")
+    return certifications
+
+
+def _parse_turnover(turnover_str) -> int:
+    """Parse turnover string to numeric value"""
+    if not turnover_str:
+        return 0
+    try:
+        # Handle formats like "R 5,000,000" or "5 million"
+        turnover_str = turnover_str.upper().replace('R', '').replace(' ', '').replace(',', '')
+        if 'MILLION' in turnover_str:
+            return int(float(turnover_str.replace('MILLION', '')) * 1000000)
+        return int(turnover_str)
+    except:
+        return 0
+
+
+def _is_black_owned(bbbee_level) -> bool:
+    """Determine if company is black-owned based on BBBEE level"""
+    if not bbbee_level:
+        return False
+    # Assume levels 1-3 indicate significant black ownership
+    return any(level in str(bbbee_level) for level in ['1', '2', '3'])
+
+
+def find_team_company_profile(db: Session, current_user: Optional[User]) -> Optional[CompanyProfile]:
+    """The current team's profile (any profile in demo mode), or None"""
+    if current_user:
+        return db.query(CompanyProfile).filter(CompanyProfile.team_id == current_user.team_id).first()
+    return db.query(CompanyProfile).first()
+
+
+def get_team_company_profile(db: Session, current_user: Optional[User]) -> CompanyProfile:
+    """The current team's profile (any profile in demo mode), creating a demo profile when none exists"""
+    company_profile = find_team_company_profile(db, current_user)
+
+    if not company_profile:
+        company_profile = CompanyProfile(
+            company_name="Demo Construction Company",
+            industry_sector="Construction",
+            services_provided="Building Construction, Civil Engineering, Road Works",
+            years_of_experience=8,
+            cidb_grading="7CE",
+            bbbee_level="2",
+            operating_provinces="Gauteng, Western Cape, KwaZulu-Natal",
+            number_of_employees=45,
+            annual_turnover="R 50,000,000",
+            team_id=1  # Default team ID
+        )
+        db.add(company_profile)
+        db.commit()
+        db.refresh(company_profile)
+        print("🏢 Created default company profile for testing")
+
+    return company_profile
+
+
+def _split(value: Optional[str]) -> FrozenSet[str]:
+    """Comma-separated profile field as a set of lowercased, trimmed entries"""
+    if not value:
+        return frozenset()
+    return frozenset(item.strip().lower() for item in value.split(',') if item.strip())
+
+
+def parse_cidb_grading(grading: Optional[str]):
+    """'7CE' -> (7, {'ce'}); (None, empty set) when no grade is given"""
+    if not grading:
+        return None, frozenset()
+    match = _CIDB_GRADE.search(grading)
+    if not match:
+        return None, frozenset()
+    return int(match.group('grade')), frozenset(c.lower() for c in _CIDB_CLASS.findall(match.group('classes')))
+
+
+def parse_bbbee_level(level: Optional[str]) -> Optional[int]:
+    """'Level 2' / '2' -> 2"""
+    match = _LEVEL.search(str(level)) if level else None
+    return int(match.group(0)) if match else None
+
+
+def _other_certifications(certifications) -> list:
+    """Free-form certifications JSON (list, or dict of option group -> list) as a flat list"""
+    if not certifications:
+        return []
+    if isinstance(certifications, dict):
+        items = []
+        for value in certifications.values():
+            items.extend(value if isinstance(value, list) else [value])
+        return [str(item) for item in items if item]
+    if isinstance(certifications, list):
+        return [str(item) for item in certifications if item]
+    return []
+
+
+class CompiledCompanyProfile:
+    """
+    A CompanyProfile parsed once for scoring: normalized sets, numeric
+    turnover, CIDB grade and classes, BBBEE level, the scoring rule set for
+    its sector and plan tier, the readiness_scoring dict and the batch
+    engine's company vector.
+    """
+
+    def __init__(self, profile: CompanyProfile):
+        self.id = profile.id
+        self.team_id = profile.team_id
+        self.name = profile.company_name
+        self.industry = (profile.industry_sector or '').lower()
+        self.services = _split(profile.services_provided)
+        self.provinces = _split(profile.operating_provinces)
+        self.years_of_experience = profile.years_of_experience or 0
+        self.employee_count = profile.number_of_employees or 0
+        turnover = parse_zar_amount(profile.annual_turnover) if profile.annual_turnover else None
+        self.annual_turnover = int(turnover) if turnover is not None else _parse_turnover(profile.annual_turnover)
+        self.cidb_grade, self.cidb_classes = parse_cidb_grading(profile.cidb_grading)
+        self.bbbee_level = parse_bbbee_level(profile.bbbee_level)
+        self.black_owned = _is_black_owned(profile.bbbee_level)
+        self.plan_tier = profile.team.plan_tier if profile.team else None
+        self.rule_set = rule_set_for(self.plan_tier, self.industry)
+
+        certifications = _extract_certifications(profile) + _other_certifications(profile.certifications)
+        self.certifications = frozenset(cert.lower() for cert in certifications)
+
+        # Shapes the scorers consume, built once
+        self.data = {
+            "name": self.name,
+            "industry": profile.industry_sector,
+            "services": profile.services_provided.split(',') if profile.services_provided else [],
+            "certifications": certifications,
+            "geographic_coverage": profile.operating_provinces.split(',') if profile.operating_provinces else [],
+            "years_of_experience": self.years_of_experience,
+            "annual_turnover": self.annual_turnover,
+            "employee_count": self.employee_count,
+            "black_owned": self.black_owned,
+            "cidb_grade": self.cidb_grade,
+            "bbbee_level": self.bbbee_level,
+            "rule_set": self.rule_set,
+            "sme": self.employee_count < 50  # SME definition
+        }
+        self.vector = company_vector(self.data)
+
+
+def _profile_stamp(db: Session, current_user: Optional[User]) -> Optional[tuple]:
+    """(id, updated_at, plan tier) of the team's profile: one indexed lookup, the same in every worker"""
+    query = db.query(CompanyProfile.id, CompanyProfile.updated_at, Team.plan_tier).outerjoin(
+        Team, CompanyProfile.team_id == Team.id
+    )
+    if current_user:
+        query = query.filter(CompanyProfile.team_id == current_user.team_id)
+    row = query.first()
+    return tuple(row) if row else None
+
+
+class CompanyProfileCache:
+    """
+    Compiled profiles per team (None = demo mode). Each read compares the
+    profile's updated_at and the team's plan tier with the compiled copy, so
+    an edit saved through any worker is picked up on the next read there.
+    POST /company/profiles also invalidates its team in this process;
+    COMPANY_PROFILE_CACHE_TTL only bounds how long an entry is trusted.
+    """
+
+    def __init__(self):
+        self.ttl = float(os.getenv("COMPANY_PROFILE_CACHE_TTL", 300))  # seconds
+        self._entries: Dict[Optional[int], tuple] = {}  # team_id -> (expires_at, stamp, profile)
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, current_user: Optional[User]) -> CompiledCompanyProfile:
+        team_id = current_user.team_id if current_user else None
+        stamp = _profile_stamp(db, current_user)
+        with self._lock:
+            entry = self._entries.get(team_id)
+        if entry is not None and entry[0] >= time.monotonic() and entry[1] == stamp:
+            return entry[2]
+
+        compiled = CompiledCompanyProfile(get_team_company_profile(db, current_user))
+        if stamp is None:
+            stamp = _profile_stamp(db, current_user)  # The demo profile was just created
+        with self._lock:
+            self._entries[team_id] = (time.monotonic() + self.ttl, stamp, compiled)
+        return compiled
+
+    def invalidate(self, team_id: Optional[int] = None):
+        """Drop a team's compiled profile (and the demo-mode entry, which may be the same profile)"""
+        with self._lock:
+            self._entries.pop(team_id, None)
+            self._entries.pop(None, None)
+
+
+# Global instance
+company_profile_cache = CompanyProfileCache()
+
+
+def get_compiled_profile(db: Session, current_user: Optional[User]) -> CompiledCompanyProfile:
+    """Cached compiled profile of the current team (demo profile without auth)"""
+    return company_profile_cache.get(db, current_user)
@@ -0,0 +1,220 @@
+# app/services/document_cache.py
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentCache:
+    """Content-addressed on-disk store for downloaded tender documents and their extracted text.
+
+    Layout under ``cache_dir``:
+        blobs/<sha256>.bin              raw document body
+        blobs/<sha256>.<variant>.json   extracted page texts for one extraction variant
+        urls/<sha256(url)>.json         url -> sha256 plus ETag / Last-Modified validators
+    """
+
+    def __init__(self):
+        self.cache_dir = os.getenv("DOCUMENT_CACHE_DIR", "./document_cache")
+        self.max_bytes = int(os.getenv("DOCUMENT_CACHE_MAX_BYTES", 512 * 1024 * 1024))  # 512MB quota
+        self.max_age = int(os.getenv("DOCUMENT_CACHE_MAX_AGE", 24 * 60 * 60))  # seconds before revalidating
+        self.blob_dir = os.path.join(self.cache_dir, "blobs")
+        self.url_dir = os.path.join(self.cache_dir, "urls")
+        self._lock = threading.Lock()
+
+    # ---------------------------
+    # Keys and paths
+    # ---------------------------
+
+    @staticmethod
+    def content_hash(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def _blob_path(self, sha256: str) -> str:
+        return os.path.join(self.blob_dir, f"{sha256}.bin")
+
+    def _pages_path(self, sha256: str, variant: str) -> str:
+        return os.path.join(self.blob_dir, f"{sha256}.{variant}.json")
+
+    def _url_path(self, url: str) -> str:
+        url_key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.url_dir, f"{url_key}.json")
+
+    def _write_atomic(self, path: str, data: bytes):
+        """Write via a temp file + rename so concurrent workers never see partial files"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _touch(path: str):
+        """Bump mtime so LRU eviction sees the entry as recently used"""
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+    # ---------------------------
+    # URL index and revalidation
+    # ---------------------------
+
+    def lookup_url(self, url: str) -> Optional[Dict]:
+        """Return the cached entry for a URL, or None if unknown or its blob was evicted"""
+        try:
+            with open(self._url_path(url), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not os.path.exists(self._blob_path(entry.get("sha256", ""))):
+            return None
+        return entry
+
+    def is_fresh(self, entry: Dict) -> bool:
+        """Fresh entries are served without any network round trip"""
+        return time.time() - entry.get("fetched_at", 0) < self.max_age
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for revalidating a stale entry"""
+        headers = {}
+        if not entry:
+            return headers
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def mark_revalidated(self, url: str, entry: Dict):
+        """Server answered 304 Not Modified - restart the freshness window"""
+        entry["fetched_at"] = time.time()
+        self._write_atomic(self._url_path(url), json.dumps(entry).encode("utf-8"))
+        self._touch(self._blob_path(entry["sha256"]))
+
+    def store_download(self, url: str, data: bytes, headers=None) -> str:
+        """Store a downloaded body and point the URL at it. Returns the content hash."""
+        headers = headers or {}
+        sha256 = self.put_blob(data)
+        entry = {
+            "url": url,
+            "sha256": sha256,
+            "size": len(data),
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "fetched_at": time.time(),
+        }
+        try:
+            self._write_atomic(self._url_path(url), json.dumps(entry).encode("utf-8"))
+        except OSError as e:
+            logger.warning(f"Could not index cached document for {url}: {e}")
+        return sha256
+
+    # ---------------------------
+    # Content-addressed blobs
+    # ---------------------------
+
+    def get_blob(self, sha256: str) -> Optional[bytes]:
+        path = self._blob_path(sha256)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        self._touch(path)
+        return data
+
+    def put_blob(self, data: bytes) -> str:
+        sha256 = self.content_hash(data)
+        path = self._blob_path(sha256)
+        try:
+            if os.path.exists(path):
+                self._touch(path)
+            else:
+                self._write_atomic(path, data)
+                self.evict()
+        except OSError as e:
+            logger.warning(f"Could not cache document {sha256}: {e}")
+        return sha256
+
+    def get_pages(self, sha256: str, variant: str) -> Optional[Dict]:
+        """Return a previously stored extraction result for this content and extraction variant"""
+        path = self._pages_path(sha256, variant)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            return None
+        self._touch(path)
+        return result
+
+    def put_pages(self, sha256: str, variant: str, result: Dict):
+        try:
+            self._write_atomic(self._pages_path(sha256, variant), json.dumps(result).encode("utf-8"))
+            self.evict()
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not cache extracted text for {sha256}: {e}")
+
+    # ---------------------------
+    # LRU eviction
+    # ---------------------------
+
+    def evict(self):
+        """Drop least recently used content until the store fits in the disk quota"""
+        with self._lock:
+            try:
+                names = os.listdir(self.blob_dir)
+            except OSError:
+                return
+
+            # Group a raw body with its extracted-text files so they are evicted together
+            groups: Dict[str, Dict] = {}
+            for name in names:
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(self.blob_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                sha256 = name.split(".", 1)[0]
+                group = groups.setdefault(sha256, {"paths": [], "size": 0, "last_used": 0.0})
+                group["paths"].append(path)
+                group["size"] += stat.st_size
+                group["last_used"] = max(group["last_used"], stat.st_mtime)
+
+            total = sum(g["size"] for g in groups.values())
+            if total <= self.max_bytes:
+                return
+
+            for sha256, group in sorted(groups.items(), key=lambda item: item[1]["last_used"]):
+                for path in group["paths"]:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                total -= group["size"]
+                logger.info(f"Evicted cached document {sha256} ({group['size']} bytes)")
+                if total <= self.max_bytes:
+                    break
+
+
+# Global instance
+document_cache = DocumentCache()
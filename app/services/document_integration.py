@@ -1,6 +1,9 @@
 # app/services/document_integration.py
+import asyncio
 from app.services.document_processor import document_processor
-from app.services.tender_doc_services import summarize_text, highlight_key_points
+from app.services.rescoring import rescore_tenders
+from app.services.summary_cache import summarize_cached
+from app.services.tender_requirements import tender_requirement_store
 from typing import Dict, List, Optional
 
 class DocumentIntegrationService:
@@ -69,8 +72,18 @@ class DocumentIntegrationService:
             
             print(f"🤖 Generating AI summary from {len(extracted_text)} characters of text")
             
-            summary = summarize_text(extracted_text)
-            highlights = highlight_key_points(extracted_text)
+            summarized = await summarize_cached(extracted_text)
+            summary = summarized["summary"]
+            highlights = summarized["highlights"]
+            
+            # 5. Requirement record from the full documents, used by matching
+            try:
+                amended = tender_requirement_store.save(db_session, tender_id, extracted_text, "documents")
+                if amended:
+                    await asyncio.to_thread(rescore_tenders, db_session, amended)
+            except Exception as e:
+                db_session.rollback()
+                print(f"⚠️ Could not store requirement record for {tender_id}: {e}")
             
             return {
                 "success": True,
@@ -78,6 +91,7 @@ class DocumentIntegrationService:
                 "tender_title": tender.title,
                 "overall_summary": summary,
                 "overall_highlights": highlights,
+                "values": summarized["values"],
                 "documents_processed": doc_result["documents_processed"],
                 "extracted_text_length": len(extracted_text)
             }
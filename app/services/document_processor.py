@@ -2,12 +2,13 @@
 import httpx
 import logging
 from typing import Optional, Dict, List
-from io import BytesIO
-import PyPDF2
 from datetime import datetime
 import asyncio
-import re
 import os
+from app.services.document_cache import document_cache
+from app.services.extraction_executor import extraction_executor
+from app.services.pdf_extraction import backend_signature
+from app.services.tender_doc_services import extract_key_document
 
 logger = logging.getLogger(__name__)
 
@@ -17,14 +18,33 @@ class DocumentProcessor:
     def __init__(self):
         self.max_file_size = 10 * 1024 * 1024  # 10MB limit
         self.timeout = 120.0
+        self.max_pages = 15  # Eligibility is usually stated in the first pages
+        self.extraction_variant = f"{backend_signature()}-key{self.max_pages}"
     
     async def download_document(self, url: str) -> Optional[bytes]:
-        """Download document from URL"""
+        """Download document from URL, serving from the document cache when possible"""
+        cached_entry = document_cache.lookup_url(url)
+        if cached_entry and document_cache.is_fresh(cached_entry):
+            cached = document_cache.get_blob(cached_entry["sha256"])
+            if cached is not None:
+                print(f"♻️ Using cached document for: {url}")
+                return cached
+
         try:
             print(f"📥 Downloading document from: {url}")
             
             async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url)
+                response = await client.get(url, headers=document_cache.conditional_headers(cached_entry))
+                
+                # Not modified since we cached it - no body transferred
+                if response.status_code == 304 and cached_entry:
+                    cached = document_cache.get_blob(cached_entry["sha256"])
+                    if cached is not None:
+                        document_cache.mark_revalidated(url, cached_entry)
+                        print(f"♻️ Document not modified, using cached copy: {url}")
+                        return cached
+                    response = await client.get(url)
+                
                 response.raise_for_status()
                 
                 # Check file size
@@ -33,6 +53,7 @@ class DocumentProcessor:
                     logger.warning(f"Document too large: {content_length} bytes")
                     return None
                 
+                document_cache.store_download(url, response.content, response.headers)
                 print(f"✅ Downloaded {len(response.content)} bytes")
                 return response.content
                 
@@ -41,48 +62,15 @@ class DocumentProcessor:
             return None
     
     def extract_text_from_pdf(self, pdf_bytes: bytes) -> Dict:
-        """Extract text from PDF bytes"""
-        result = {
-            "text": "",
-            "page_count": 0,
-            "method": "pypdf2",
-            "success": False,
-            "error": None
-        }
-        
-        try:
-            # Check if it's actually a PDF
-            if not pdf_bytes.startswith(b'%PDF'):
-                result["error"] = "File is not a PDF document"
-                return result
-            
-            pdf_file = BytesIO(pdf_bytes)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            
-            result["page_count"] = len(pdf_reader.pages)
-            
-            # Extract text from all pages (prioritize early pages where eligibility is usually stated)
-            text_parts = []
-            for i, page in enumerate(pdf_reader.pages[:15]):  # First 15 pages
-                page_text = page.extract_text()
-                if page_text.strip():
-                    # Clean up common PDF extraction artifacts
-                    page_text = re.sub(r'\s+', ' ', page_text)  # Normalize whitespace
-                    page_text = re.sub(r'(\w)-\s+(\w)', r'\1\2', page_text)  # Fix hyphenation
-                    text_parts.append(page_text)
-            
-            result["text"] = "\n\n".join(text_parts)
-            result["success"] = True if result["text"].strip() else False
-            
-            # If no text extracted, it might be scanned PDF
-            if not result["text"].strip():
-                result["error"] = "No text found - document may be scanned/image-based"
-            
-        except Exception as e:
-            result["error"] = str(e)
-            logger.error(f"PDF extraction failed: {e}")
-        
-        return result
+        """
+        Extract text from PDF bytes (runs in the calling process). Stops reading
+        pages once objective, scope, deadline and eligibility have been found.
+        """
+        return extract_key_document(pdf_bytes, self.max_pages)
+    
+    async def extract_text_from_pdf_async(self, pdf_bytes: bytes) -> Dict:
+        """Extract text from PDF bytes in the extraction process pool"""
+        return await extraction_executor.run(extract_key_document, pdf_bytes, self.max_pages)
     
     async def process_tender_documents(self, tender_id: str, documents: List[Dict]) -> Dict:
         """Process all documents for a tender and return combined text"""
@@ -119,8 +107,15 @@ class DocumentProcessor:
                     errors.append(f"Failed to download: {doc.get('title', 'Unknown')}")
                     continue
                 
-                # Extract text
-                extraction = self.extract_text_from_pdf(pdf_bytes)
+                # Extract text (reuse the cached page texts for identical content)
+                content_sha = document_cache.content_hash(pdf_bytes)
+                extraction = document_cache.get_pages(content_sha, self.extraction_variant)
+                if extraction:
+                    print(f"♻️ Using cached extracted text for: {doc.get('title', 'Unknown')}")
+                else:
+                    extraction = await self.extract_text_from_pdf_async(pdf_bytes)
+                    if extraction["success"]:
+                        document_cache.put_pages(content_sha, self.extraction_variant, extraction)
                 
                 if extraction["success"] and extraction["text"].strip():
                     extracted_texts.append(extraction["text"])
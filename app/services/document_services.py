@@ -1,28 +1,36 @@
 import requests
-import PyPDF2
-import io
 from typing import Optional, List, Dict
 import logging
+from app.services.document_cache import document_cache
+from app.services.extraction_executor import extraction_executor
+from app.services.pdf_extraction import extract_pdf_pages, backend_signature
 
 logger = logging.getLogger(__name__)
 
 class DocumentService:
     def __init__(self):
         self.timeout = 30
+        self.extraction_variant = f"{backend_signature()}-all"
     
     async def download_and_extract_text(self, document_url: str) -> Optional[str]:
         """
         Download document and extract text content
         """
         try:
-            print(f"📥 Downloading document from: {document_url}")
-            
-            response = requests.get(document_url, timeout=self.timeout)
-            response.raise_for_status()
+            content, content_type = self._fetch_document(document_url)
             
             # Check if it's a PDF
-            if document_url.lower().endswith('.pdf') or 'application/pdf' in response.headers.get('content-type', ''):
-                return await self._extract_pdf_text(response.content)
+            if document_url.lower().endswith('.pdf') or 'application/pdf' in content_type or content.startswith(b'%PDF'):
+                content_sha = document_cache.content_hash(content)
+                cached = document_cache.get_pages(content_sha, self.extraction_variant)
+                if cached:
+                    print(f"♻️ Using cached extracted text for: {document_url}")
+                    return cached["text"]
+                
+                text = await self._extract_pdf_text(content)
+                if text:
+                    document_cache.put_pages(content_sha, self.extraction_variant, {"text": text})
+                return text
             else:
                 print(f"⚠️ Unsupported document format: {document_url}")
                 return None
@@ -31,17 +39,42 @@ class DocumentService:
             print(f"❌ Error downloading document: {e}")
             return None
     
+    def _fetch_document(self, document_url: str):
+        """
+        Fetch document bytes, revalidating cached copies with ETag / Last-Modified
+        """
+        cached_entry = document_cache.lookup_url(document_url)
+        if cached_entry and document_cache.is_fresh(cached_entry):
+            cached = document_cache.get_blob(cached_entry["sha256"])
+            if cached is not None:
+                print(f"♻️ Using cached document for: {document_url}")
+                return cached, ""
+        
+        print(f"📥 Downloading document from: {document_url}")
+        
+        response = requests.get(
+            document_url,
+            timeout=self.timeout,
+            headers=document_cache.conditional_headers(cached_entry)
+        )
+        if response.status_code == 304 and cached_entry:
+            cached = document_cache.get_blob(cached_entry["sha256"])
+            if cached is not None:
+                document_cache.mark_revalidated(document_url, cached_entry)
+                return cached, ""
+            response = requests.get(document_url, timeout=self.timeout)
+        
+        response.raise_for_status()
+        document_cache.store_download(document_url, response.content, response.headers)
+        return response.content, response.headers.get('content-type', '')
+    
     async def _extract_pdf_text(self, pdf_content: bytes) -> Optional[str]:
         """
-        Extract text from PDF content
+        Extract text from PDF content in the extraction process pool
         """
         try:
-            pdf_file = io.BytesIO(pdf_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
+            extraction = await extraction_executor.run(extract_pdf_pages, pdf_content)
+            text = "".join(page + "\n" for page in extraction["pages"])
             
             print(f"✅ Extracted {len(text)} characters from PDF")
             return text.strip()
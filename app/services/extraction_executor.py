@@ -0,0 +1,134 @@
+# app/services/extraction_executor.py
+import asyncio
+import collections
+import concurrent.futures
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionTimeoutError(Exception):
+    """Raised when a document extraction job exceeds its time budget"""
+
+
+class ExtractionExecutor:
+    """Process pool that keeps CPU-heavy document parsing off the event loop"""
+
+    def __init__(self):
+        self.max_workers = int(os.getenv("EXTRACTION_WORKERS", os.cpu_count() or 2))
+        self.timeout = float(os.getenv("EXTRACTION_TIMEOUT", 120))  # seconds per job
+        self._pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # spawn avoids forking a process that holds event loop and DB connection state
+                self._pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+                print(f"⚙️ Started extraction pool with {self.max_workers} workers")
+            return self._pool
+
+    def _reset_pool(self, pool: concurrent.futures.ProcessPoolExecutor):
+        """
+        A running job cannot be cancelled, so a timed-out or crashed pool is
+        torn down and replaced. Other jobs in flight on it fail and are reported
+        by their callers like any other extraction error.
+        """
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        processes = list((getattr(pool, "_processes", None) or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    def _submit(self, fn: Callable, *args):
+        pool = self._get_pool()
+        try:
+            return pool, pool.submit(fn, *args)
+        except BrokenProcessPool:
+            self._reset_pool(pool)
+            pool = self._get_pool()
+            return pool, pool.submit(fn, *args)
+
+    def submit(self, fn: Callable, *args) -> concurrent.futures.Future:
+        """Queue a job on the pool, recreating the pool if a worker has died"""
+        return self._submit(fn, *args)[1]
+
+    async def run(self, fn: Callable, *args, timeout: Optional[float] = None) -> Any:
+        """Run fn(*args) in the pool and await its result without blocking the event loop"""
+        pool, future = self._submit(fn, *args)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout or self.timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Extraction job {getattr(fn, '__name__', fn)} timed out")
+            self._reset_pool(pool)
+            raise ExtractionTimeoutError(f"Extraction exceeded {timeout or self.timeout:g}s")
+        except BrokenProcessPool:
+            self._reset_pool(pool)
+            raise
+
+    def run_sync(self, fn: Callable, *args, timeout: Optional[float] = None) -> Any:
+        """Blocking variant for synchronous callers (scripts, worker threads)"""
+        pool, future = self._submit(fn, *args)
+        try:
+            return future.result(timeout=timeout or self.timeout)
+        except concurrent.futures.TimeoutError:
+            logger.error(f"Extraction job {getattr(fn, '__name__', fn)} timed out")
+            self._reset_pool(pool)
+            raise ExtractionTimeoutError(f"Extraction exceeded {timeout or self.timeout:g}s")
+        except BrokenProcessPool:
+            self._reset_pool(pool)
+            raise
+
+    def _result_or_error(self, fn: Callable, pool, future) -> Any:
+        try:
+            return future.result(timeout=self.timeout)
+        except concurrent.futures.TimeoutError:
+            logger.error(f"Extraction job {getattr(fn, '__name__', fn)} timed out")
+            self._reset_pool(pool)
+            return ExtractionTimeoutError(f"Extraction exceeded {self.timeout:g}s")
+        except Exception as e:
+            return e
+
+    def iter_many_sync(self, fn: Callable, items: Iterable) -> Iterator[Any]:
+        """
+        Submit fn(item) for each item as soon as the iterable produces it, so
+        jobs run concurrently while later items are still being prepared.
+        Results are yielded in order, each as soon as it and the ones before
+        it are done; a failed job yields its exception instance.
+        """
+        pending = collections.deque()
+        for item in items:
+            pending.append(self._submit(fn, item))
+            while pending and pending[0][1].done():
+                yield self._result_or_error(fn, *pending.popleft())
+        while pending:
+            yield self._result_or_error(fn, *pending.popleft())
+
+    def run_many_sync(self, fn: Callable, items: Iterable) -> List[Any]:
+        """iter_many_sync() collected into a list"""
+        return list(self.iter_many_sync(fn, items))
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Global instance
+extraction_executor = ExtractionExecutor()
@@ -0,0 +1,151 @@
+# app/services/extractive_ranker.py
+"""
+Extractive sentence ranking: TF-IDF sentence vectors scored with TextRank.
+
+Terms are collected as sparse (sentence, term) coordinates and scattered
+into a float32 matrix with np.add.at. Cosine similarity is a single
+matrix product, and TextRank is a vectorized power iteration over the
+row-normalized similarity graph. Sentences that many others resemble
+(the substance of the tender) outrank cover-page boilerplate.
+
+The TF-IDF matrix is dense rather than scipy.sparse: scipy is not a
+dependency, the matrix is capped at EXTRACTIVE_MAX_SENTENCES x
+EXTRACTIVE_MAX_TERMS, and the sentence similarity matrix TextRank walks
+is dense anyway.
+"""
+import os
+import re
+from typing import List
+
+import numpy as np
+from dotenv import load_dotenv
+
+load_dotenv()
+
+_TERM = re.compile(r"[a-z][a-z0-9\-]{2,}")
+
+STOPWORDS = frozenset("""
+the and for with that this from are was were will shall must have has had not but all any can may
+such their there which who whom whose into onto upon than then them they these those its our your
+per via also been being each other more most some only own same very out off over under again
+""".split())
+
+MIN_SENTENCE_WORDS = 5
+MAX_SENTENCE_WORDS = 120  # longer "sentences" are usually tables flattened into one line
+
+
+def estimate_tokens(sentence: str) -> int:
+    """Rough subword token count (about 4 tokens per 3 English words)"""
+    return (len(sentence.split()) * 4 + 2) // 3
+
+
+class ExtractiveRanker:
+    """TF-IDF + TextRank sentence ranking with a token-budgeted selection"""
+
+    def __init__(self):
+        self.max_sentences = int(os.getenv("EXTRACTIVE_MAX_SENTENCES", 1500))
+        self.max_terms = int(os.getenv("EXTRACTIVE_MAX_TERMS", 4096))
+        self.damping = 0.85
+        self.iterations = 50
+        self.tolerance = 1e-6
+        self.duplicate_similarity = 0.9
+
+    def _candidates(self, sentences: List[str]) -> List[int]:
+        """Indices of sentences worth ranking (document order, capped)"""
+        candidates = [
+            i for i, sentence in enumerate(sentences)
+            if MIN_SENTENCE_WORDS <= len(sentence.split()) <= MAX_SENTENCE_WORDS
+        ]
+        return candidates[:self.max_sentences]
+
+    def tfidf(self, sentences: List[str]) -> np.ndarray:
+        """L2-normalized TF-IDF matrix, one row per sentence"""
+        rows, terms = [], []
+        for row, sentence in enumerate(sentences):
+            for term in _TERM.findall(sentence.lower()):
+                if term not in STOPWORDS:
+                    rows.append(row)
+                    terms.append(term)
+        if not terms:
+            return np.zeros((len(sentences), 0), dtype=np.float32)
+
+        vocabulary, term_ids = np.unique(np.array(terms), return_inverse=True)
+        rows = np.array(rows)
+
+        # Document frequency per term, counting each sentence once
+        pairs = np.unique(rows * len(vocabulary) + term_ids)
+        document_frequency = np.bincount(pairs % len(vocabulary), minlength=len(vocabulary))
+
+        # Keep the most widespread terms when the vocabulary is too large
+        if len(vocabulary) > self.max_terms:
+            keep = np.argsort(-document_frequency, kind="stable")[:self.max_terms]
+            remap = np.full(len(vocabulary), -1)
+            remap[keep] = np.arange(len(keep))
+            term_ids = remap[term_ids]
+            mask = term_ids >= 0
+            rows, term_ids = rows[mask], term_ids[mask]
+            document_frequency = document_frequency[keep]
+
+        matrix = np.zeros((len(sentences), len(document_frequency)), dtype=np.float32)
+        np.add.at(matrix, (rows, term_ids), 1.0)
+
+        idf = np.log((1 + len(sentences)) / (1 + document_frequency)).astype(np.float32) + 1.0
+        matrix *= idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def textrank(self, similarity: np.ndarray) -> np.ndarray:
+        """PageRank over the weighted similarity graph (power iteration)"""
+        n = similarity.shape[0]
+        graph = similarity.copy()
+        np.fill_diagonal(graph, 0.0)
+        out_weight = graph.sum(axis=1, keepdims=True)
+        # Isolated sentences spread their rank evenly
+        transition = np.where(out_weight > 0, graph / np.where(out_weight > 0, out_weight, 1.0), 1.0 / n)
+
+        scores = np.full(n, 1.0 / n, dtype=np.float32)
+        teleport = (1.0 - self.damping) / n
+        for _ in range(self.iterations):
+            updated = teleport + self.damping * (transition.T @ scores)
+            if np.abs(updated - scores).sum() < self.tolerance:
+                return updated
+            scores = updated
+        return scores
+
+    def _score(self, sentences: List[str]):
+        """(candidate indices, their TF-IDF rows, their TextRank scores)"""
+        candidates = self._candidates(sentences)
+        vectors = self.tfidf([sentences[i] for i in candidates])
+        if len(candidates) <= 1:
+            return candidates, vectors, np.ones(len(candidates), dtype=np.float32)
+        return candidates, vectors, self.textrank(vectors @ vectors.T)
+
+    def rank(self, sentences: List[str]) -> List[int]:
+        """Candidate sentence indices, best first"""
+        candidates, _, scores = self._score(sentences)
+        return [candidates[i] for i in np.argsort(-scores, kind="stable")]
+
+    def select(self, sentences: List[str], token_budget: int) -> List[str]:
+        """Top-ranked sentences that fit the token budget, in document order, without near-duplicates"""
+        candidates, vectors, scores = self._score(sentences)
+        min_cost = estimate_tokens(" ".join(["w"] * MIN_SENTENCE_WORDS))
+
+        chosen, chosen_rows, used = [], [], 0
+        for row in np.argsort(-scores, kind="stable"):
+            index = candidates[row]
+            cost = estimate_tokens(sentences[index])
+            if used + cost > token_budget:
+                continue
+            if chosen_rows and float(np.max(vectors[chosen_rows] @ vectors[row])) > self.duplicate_similarity:
+                continue
+            chosen.append(index)
+            chosen_rows.append(row)
+            used += cost
+            if token_budget - used < min_cost:
+                break
+        return [sentences[i] for i in sorted(chosen)]
+
+
+# Global instance
+extractive_ranker = ExtractiveRanker()
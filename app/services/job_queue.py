@@ -0,0 +1,289 @@
+# app/services/job_queue.py
+"""
+Persistent SQLite job queue for long-running tender work (auto-summarize).
+
+Jobs survive restarts. A claimed job carries its worker's owner id and a
+lease that the worker renews while the job runs. A job whose lease has
+expired belongs to a dead worker: the next claim requeues it (or fails it
+after max_attempts). Jobs held by live workers in sibling processes are
+never touched. A partial unique index allows at most one active (queued
+or running) job per tender, so repeat requests attach to it.
+"""
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+FINISHED_STATUSES = ("completed", "failed")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    tender_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT,
+    owner TEXT,
+    lease_expires_at REAL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ix_jobs_active_tender
+    ON jobs (kind, tender_id) WHERE status IN ('queued', 'running');
+CREATE INDEX IF NOT EXISTS ix_jobs_status_created ON jobs (status, created_at);
+"""
+
+# Added after the first release; init_db adds them to existing queue databases
+LEASE_COLUMNS = {"owner": "TEXT", "lease_expires_at": "REAL"}
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat()
+
+
+class JobQueue:
+    """SQLite-backed queue shared by the API process and the worker processes"""
+
+    def __init__(self):
+        self.db_path = os.getenv("JOB_QUEUE_DB", "./tender_jobs.db")
+        self.worker_count = int(os.getenv("JOB_WORKERS", 2))
+        self.poll_interval = float(os.getenv("JOB_POLL_INTERVAL", 1.0))  # seconds
+        self.max_attempts = int(os.getenv("JOB_MAX_ATTEMPTS", 3))
+        self.lease_seconds = float(os.getenv("JOB_LEASE_SECONDS", 60))  # renewed every third of this
+        self._workers = []
+        self._stop_event = None
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def init_db(self):
+        conn = self._connect()
+        try:
+            conn.executescript(SCHEMA)
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for column, column_type in LEASE_COLUMNS.items():
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {column_type}")
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Dict:
+        job = dict(row)
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def enqueue(self, kind: str, tender_id: str) -> Dict:
+        """Queue a job, or return the tender's active job if one exists (deduplicated=True)"""
+        conn = self._connect()
+        try:
+            job_id = uuid.uuid4().hex
+            try:
+                conn.execute(
+                    "INSERT INTO jobs (id, kind, tender_id, status, created_at) VALUES (?, ?, ?, 'queued', ?)",
+                    (job_id, kind, tender_id, _now())
+                )
+                deduplicated = False
+            except sqlite3.IntegrityError:
+                # Unique active-job index hit: attach to the existing job
+                row = conn.execute(
+                    "SELECT id FROM jobs WHERE kind = ? AND tender_id = ? AND status IN ('queued', 'running')",
+                    (kind, tender_id)
+                ).fetchone()
+                if row is None:  # Finished between the insert and the lookup
+                    return self.enqueue(kind, tender_id)
+                job_id = row["id"]
+                deduplicated = True
+        finally:
+            conn.close()
+
+        job = self.get(job_id)
+        job["deduplicated"] = deduplicated
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        finally:
+            conn.close()
+        return self._row_to_job(row) if row else None
+
+    def _expire_leases(self, conn: sqlite3.Connection) -> int:
+        """Requeue running jobs whose lease has expired; give up after max_attempts"""
+        now = time.time()
+        conn.execute(
+            "UPDATE jobs SET status = 'failed', error = 'Interrupted too many times', finished_at = ?, owner = NULL "
+            "WHERE status = 'running' AND (lease_expires_at IS NULL OR lease_expires_at < ?) AND attempts >= ?",
+            (_now(), now, self.max_attempts)
+        )
+        cursor = conn.execute(
+            "UPDATE jobs SET status = 'queued', owner = NULL, lease_expires_at = NULL "
+            "WHERE status = 'running' AND (lease_expires_at IS NULL OR lease_expires_at < ?)",
+            (now,)
+        )
+        if cursor.rowcount:
+            print(f"♻️ Requeued {cursor.rowcount} jobs with expired leases")
+        return cursor.rowcount
+
+    def claim(self, owner: str) -> Optional[Dict]:
+        """Atomically requeue expired jobs, then lease the oldest queued job to owner"""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            self._expire_leases(conn)
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, started_at = ?, owner = ?, "
+                "lease_expires_at = ? WHERE id = ?",
+                (_now(), owner, time.time() + self.lease_seconds, row["id"])
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return self._row_to_job(row)
+
+    def renew(self, job_id: str, owner: str) -> bool:
+        """Extend owner's lease on a running job; False if the lease was lost"""
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires_at = ? WHERE id = ? AND owner = ? AND status = 'running'",
+                (time.time() + self.lease_seconds, job_id, owner)
+            )
+            return cursor.rowcount == 1
+        finally:
+            conn.close()
+
+    def finish(self, job_id: str, owner: str, result: Optional[Dict] = None, error: Optional[str] = None) -> bool:
+        """Record the outcome, unless the lease expired and the job was requeued meanwhile"""
+        status = "failed" if error else "completed"
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, owner = NULL, "
+                "lease_expires_at = NULL WHERE id = ? AND owner = ?",
+                (status, json.dumps(result, default=str) if result is not None else None, error, _now(),
+                 job_id, owner)
+            )
+            return cursor.rowcount == 1
+        finally:
+            conn.close()
+
+    def start_workers(self):
+        """Start this process's worker processes (jobs of dead workers are requeued as their leases expire)"""
+        self.init_db()
+
+        # Not daemonic: workers start their own extraction process pools
+        context = multiprocessing.get_context("spawn")
+        self._stop_event = context.Event()
+        for index in range(self.worker_count):
+            process = context.Process(
+                target=worker_main, args=(self._stop_event,), name=f"job-worker-{index}", daemon=False
+            )
+            process.start()
+            self._workers.append(process)
+        print(f"⚙️ Started {self.worker_count} job workers")
+
+    def stop_workers(self, timeout: float = 10):
+        if self._stop_event is not None:
+            self._stop_event.set()
+        for process in self._workers:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        self._workers = []
+
+
+def run_job(job: Dict) -> Dict:
+    """Execute one job in a worker process"""
+    if job["kind"] == "auto_summarize":
+        return asyncio.run(_auto_summarize(job["tender_id"]))
+    raise ValueError(f"Unknown job kind: {job['kind']}")
+
+
+async def _auto_summarize(tender_id: str) -> Dict:
+    from app.database import SessionLocal
+    from app.Mongodatabase.mongodb import mongodb
+    from app.services.document_integration import document_integration
+
+    # Motor clients are bound to an event loop, so each job connects its own (summary cache tier 2)
+    await mongodb.connect()
+    db = SessionLocal()
+    try:
+        return await document_integration.auto_summarize_tender(tender_id, db)
+    finally:
+        db.close()
+        await mongodb.close()
+        mongodb.db = None
+
+
+def _heartbeat(job_id: str, owner: str, done: threading.Event):
+    """Renew the job's lease until it finishes"""
+    while not done.wait(job_queue.lease_seconds / 3):
+        if not job_queue.renew(job_id, owner):
+            print(f"⚠️ Job {job_id} lost its lease")
+            return
+
+
+def worker_main(stop_event):
+    """Worker process loop: claim, run, record, repeat until stopped"""
+    from app.services.extraction_executor import extraction_executor
+
+    owner = f"{socket.gethostname()}:{os.getpid()}"
+    try:
+        while not stop_event.is_set():
+            job = job_queue.claim(owner)
+            if job is None:
+                stop_event.wait(job_queue.poll_interval)
+                continue
+
+            print(f"🛠️ Job {job['id']} ({job['kind']}) started for tender {job['tender_id']}")
+            started = time.perf_counter()
+            done = threading.Event()
+            heartbeat = threading.Thread(target=_heartbeat, args=(job["id"], owner, done), daemon=True)
+            heartbeat.start()
+            try:
+                result = run_job(job)
+                error = None if result.get("success", True) else result.get("message", "Job failed")
+                recorded = job_queue.finish(job["id"], owner, result=result, error=error)
+            except Exception as e:
+                recorded = job_queue.finish(job["id"], owner, error=str(e))
+            finally:
+                done.set()
+                heartbeat.join()
+            if not recorded:
+                print(f"⚠️ Job {job['id']} was requeued while running; result discarded")
+            print(f"✅ Job {job['id']} finished in {time.perf_counter() - started:.1f}s")
+    finally:
+        extraction_executor.shutdown()
+
+
+# Global instance
+job_queue = JobQueue()
@@ -0,0 +1,207 @@
+# app/services/match_score_store.py
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from dotenv import load_dotenv
+from sqlalchemy import delete, func, or_
+from sqlalchemy.orm import Session
+
+from app.database import upsert_insert
+from app.models.tender_match import TenderMatchScore
+from app.services.readiness_engine import CRITERIA, dependency_mask
+
+load_dotenv()
+
+# Rows per INSERT statement (11 columns each, under SQLite's 999 variable limit)
+UPSERT_BATCH_ROWS = 80
+# Ids per IN (...) lookup
+LOOKUP_BATCH_IDS = 500
+
+
+def _row_to_dict(row) -> Dict:
+    return {
+        "tender_id": row.tender_id,
+        "company_id": row.company_id,
+        "suitability_score": row.suitability_score,
+        "recommendation": row.recommendation,
+        "checklist": json.loads(row.checklist) if row.checklist else [],
+        "matched_criteria": row.matched_criteria_count,
+        "total_criteria": row.total_criteria_count,
+        "criteria": json.loads(row.criteria) if row.criteria else None,
+        "timestamp": (row.updated_at or row.created_at).isoformat() if (row.updated_at or row.created_at) else None
+    }
+
+
+class MatchScoreStore:
+    """
+    Match results persisted in tender_match_scores, one row per (tender, company).
+
+    Writes are single-statement upserts (INSERT ... ON CONFLICT DO UPDATE),
+    so concurrent uvicorn workers never create duplicates. Reads go through
+    a bounded in-process LRU. Entries expire after MATCH_SCORE_CACHE_TTL
+    seconds, which bounds how stale a score written by another worker can be.
+    """
+
+    def __init__(self):
+        self.max_entries = int(os.getenv("MATCH_SCORE_CACHE_SIZE", 1024))
+        self.ttl = float(os.getenv("MATCH_SCORE_CACHE_TTL", 30))  # seconds
+        self._entries: "OrderedDict[Tuple[str, int], tuple]" = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    # ---------------------------
+    # Read cache
+    # ---------------------------
+
+    def _cache_get(self, key) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _cache_put(self, key, value: Dict):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _cache_drop(self, keys: Iterable[Tuple[str, int]]):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def invalidate(self, tender_id: str = None, company_id: int = None):
+        """Drop cached scores for a tender, a company, or everything"""
+        with self._lock:
+            if tender_id is None and company_id is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries
+                        if (tender_id is None or key[0] == tender_id) and (company_id is None or key[1] == company_id)]:
+                del self._entries[key]
+
+    # ---------------------------
+    # Storage
+    # ---------------------------
+
+    def _values(self, tender_id: str, company_id: int, result: Dict, user_id: Optional[int]) -> Dict:
+        criteria = result.get("criteria")
+        # Results without a dependency list (errors, older scorers) count as depending on everything
+        depends_on = result.get("depends_on", list(CRITERIA))
+        return {
+            "tender_id": tender_id,
+            "company_id": company_id,
+            "user_id": user_id,
+            "suitability_score": result["suitability_score"],
+            "recommendation": result["recommendation"][:255],
+            "checklist": json.dumps(result.get("checklist", [])),
+            "matched_criteria_count": result.get("matched_criteria", 0),
+            "total_criteria_count": result.get("total_criteria", 0),
+            "criteria": json.dumps(criteria) if criteria else None,
+            "depends_mask": dependency_mask(depends_on),
+            "updated_at": func.now(),  # set on insert too, so history can walk the (company_id, updated_at) index
+        }
+
+    def store_many(self, db: Session, scores: List[Tuple[str, int, Dict, Optional[int]]]):
+        """Store [(tender_id, company_id, match result, user_id), ...] with multi-row upserts in one transaction"""
+        if not scores:
+            return
+        rows = [self._values(*score) for score in scores]
+        for start in range(0, len(rows), UPSERT_BATCH_ROWS):
+            statement = upsert_insert(db, TenderMatchScore).values(rows[start:start + UPSERT_BATCH_ROWS])
+            statement = statement.on_conflict_do_update(
+                index_elements=["tender_id", "company_id"],
+                set_={
+                    "user_id": statement.excluded.user_id,
+                    "suitability_score": statement.excluded.suitability_score,
+                    "recommendation": statement.excluded.recommendation,
+                    "checklist": statement.excluded.checklist,
+                    "matched_criteria_count": statement.excluded.matched_criteria_count,
+                    "total_criteria_count": statement.excluded.total_criteria_count,
+                    "criteria": statement.excluded.criteria,
+                    "depends_mask": statement.excluded.depends_mask,
+                    "updated_at": func.now(),
+                }
+            )
+            db.execute(statement)
+        db.commit()
+        self._cache_drop((row["tender_id"], row["company_id"]) for row in rows)
+
+    def upsert_many(self, db: Session, company_id: int, results: Dict[str, Dict], user_id: int = None):
+        """Store {tender_id: match result} for one company"""
+        self.store_many(db, [(tender_id, company_id, result, user_id) for tender_id, result in results.items()])
+
+    def upsert(self, db: Session, tender_id: str, company_id: int, result: Dict, user_id: int = None):
+        self.upsert_many(db, company_id, {tender_id: result}, user_id)
+
+    def get(self, db: Session, tender_id: str, company_id: int) -> Optional[Dict]:
+        key = (tender_id, company_id)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        row = db.query(TenderMatchScore).filter(
+            TenderMatchScore.tender_id == tender_id,
+            TenderMatchScore.company_id == company_id
+        ).first()
+        if row is None:
+            return None
+        value = _row_to_dict(row)
+        self._cache_put(key, value)
+        return value
+
+    def dependent_scores(self, db: Session, company_id: int, criteria: Iterable[str]) -> List[TenderMatchScore]:
+        """
+        A company's stored scores that a change to `criteria` can move: rows
+        depending on any of them, plus rows stored without per-criterion results
+        """
+        mask = dependency_mask(criteria)
+        return db.query(TenderMatchScore).filter(
+            TenderMatchScore.company_id == company_id,
+            or_(TenderMatchScore.depends_mask.op('&')(mask) != 0,
+                TenderMatchScore.depends_mask.is_(None),
+                TenderMatchScore.criteria.is_(None))
+        ).all()
+
+    def company_scores(self, db: Session, company_id: int) -> List[TenderMatchScore]:
+        """Every stored score of a company"""
+        return db.query(TenderMatchScore).filter(TenderMatchScore.company_id == company_id).all()
+
+    def delete_scores(self, db: Session, rows: List[TenderMatchScore]):
+        """Delete stored score rows (as returned by the queries above)"""
+        ids = [row.id for row in rows]
+        for start in range(0, len(ids), LOOKUP_BATCH_IDS):
+            db.execute(delete(TenderMatchScore).where(TenderMatchScore.id.in_(ids[start:start + LOOKUP_BATCH_IDS])))
+        db.commit()
+        self._cache_drop((row.tender_id, row.company_id) for row in rows)
+
+    def tender_scores(self, db: Session, tender_ids: Iterable[str]) -> List[TenderMatchScore]:
+        """Every company's stored scores for the given tenders"""
+        tender_ids = list(tender_ids)
+        rows = []
+        for start in range(0, len(tender_ids), LOOKUP_BATCH_IDS):
+            rows.extend(db.query(TenderMatchScore).filter(
+                TenderMatchScore.tender_id.in_(tender_ids[start:start + LOOKUP_BATCH_IDS])
+            ).all())
+        return rows
+
+    def history(self, db: Session, company_id: int, limit: int = 500) -> List[Dict]:
+        """A company's stored scores, most recently updated first"""
+        rows = db.query(TenderMatchScore).filter(
+            TenderMatchScore.company_id == company_id
+        ).order_by(TenderMatchScore.updated_at.desc(), TenderMatchScore.id.desc()).limit(limit).all()
+        return [_row_to_dict(row) for row in rows]
+
+
+# Global instance
+match_score_store = MatchScoreStore()
@@ -7,8 +7,8 @@ import json
 class MongoDBService:
     """Simple MongoDB service that actually works"""
     
-    async def store_ai_analysis(self, tender_id: str, summary_data: Dict, match_data: Dict = None) -> bool:
-        """Store AI analysis results in MongoDB"""
+    async def store_ai_analysis(self, tender_id: str, summary_data: Dict, match_data: Dict = None) -> Optional[str]:
+        """Store AI analysis results in MongoDB; returns the inserted id (None on failure)"""
         try:
             print(f"💾 Storing AI analysis for tender: {tender_id}")
             
@@ -24,6 +24,9 @@ class MongoDBService:
                     "tender_title": summary_data.get("tender_title", ""),
                 },
                 
+                # Typed values for sorting/analytics (deadline_date, deadline_days, budget_amount)
+                "values": summary_data.get("values", {}),
+                
                 # Match data if available
                 "match_results": match_data or {},
                 
@@ -41,11 +44,11 @@ class MongoDBService:
             result = await collection.insert_one(analysis_doc)
             
             print(f"✅ AI analysis stored with ID: {result.inserted_id}")
-            return True
+            return str(result.inserted_id)
             
         except Exception as e:
             print(f"❌ Failed to store AI analysis: {e}")
-            return False
+            return None
     
     async def store_match_result(self, tender_id: str, company_profile_id: str, match_data: Dict) -> bool:
         """Store match results in MongoDB"""
@@ -85,8 +88,8 @@ class MongoDBService:
             print(f"❌ Failed to store match result: {e}")
             return False
     
-    async def log_user_activity(self, user_id: str, activity_type: str, details: Dict) -> bool:
-        """Log user activity in MongoDB"""
+    async def log_user_activity(self, user_id: str, activity_type: str, details: Dict) -> Optional[str]:
+        """Log user activity in MongoDB; returns the inserted id (None on failure)"""
         try:
             activity_doc = {
                 "user_id": user_id,
@@ -96,14 +99,14 @@ class MongoDBService:
             }
             
             collection = mongodb.get_collection("user_activities")
-            await collection.insert_one(activity_doc)
+            result = await collection.insert_one(activity_doc)
             
             print(f"✅ User activity logged: {activity_type}")
-            return True
+            return str(result.inserted_id)
             
         except Exception as e:
             print(f"❌ Failed to log user activity: {e}")
-            return False
+            return None
     
     async def get_tender_analysis_history(self, tender_id: str) -> List[Dict]:
         """Get analysis history for a tender"""
@@ -0,0 +1,271 @@
+# app/services/pdf_extraction.py
+"""
+PDF text extraction functions executed inside the extraction process pool.
+
+Everything in this module must stay importable without the FastAPI app and
+must take and return picklable values (bytes, paths, dicts, lists).
+"""
+import importlib.util
+import io
+import itertools
+import json
+import logging
+import os
+import re
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+PdfSource = Union[bytes, str]
+
+# Below this many non-whitespace characters a backend's output is treated as unusable
+MIN_USABLE_CHARS = int(os.getenv("PDF_MIN_USABLE_CHARS", 20))
+
+
+def _open_source(source: PdfSource):
+    """Most libraries accept a path or a stream - wrap raw bytes in a stream"""
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source)
+    return source
+
+
+def clean_page_text(page_text: str) -> str:
+    """Clean up common PDF extraction artifacts"""
+    page_text = re.sub(r'\s+', ' ', page_text)  # Normalize whitespace
+    page_text = re.sub(r'(\w)-\s+(\w)', r'\1\2', page_text)  # Fix hyphenation
+    return page_text
+
+
+# ---------------------------
+# Extraction backends
+# ---------------------------
+
+class PdfBackend(ABC):
+    """A PDF text extraction library. Subclasses implement open()."""
+
+    name = ""
+    module = ""
+
+    def is_available(self) -> bool:
+        return importlib.util.find_spec(self.module) is not None
+
+    @abstractmethod
+    def open(self, source: PdfSource) -> Tuple[int, Iterator[str]]:
+        """Return (page_count, lazy iterator over page texts)"""
+
+
+class PdfiumBackend(PdfBackend):
+    """pypdfium2 - PDFium's C++ text layer, by far the fastest"""
+
+    name = "pypdfium2"
+    module = "pypdfium2"
+
+    def open(self, source):
+        import pypdfium2 as pdfium
+
+        pdf = pdfium.PdfDocument(source)
+        return len(pdf), self._iter_pages(pdf)
+
+    @staticmethod
+    def _iter_pages(pdf):
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                try:
+                    yield textpage.get_text_bounded().replace("\r\n", "\n")
+                finally:
+                    textpage.close()
+                    page.close()
+        finally:
+            pdf.close()
+
+
+class PdfplumberBackend(PdfBackend):
+    """pdfplumber - layout-aware, slow, good on tables"""
+
+    name = "pdfplumber"
+    module = "pdfplumber"
+
+    def open(self, source):
+        import pdfplumber
+
+        pdf = pdfplumber.open(_open_source(source))
+        return len(pdf.pages), self._iter_pages(pdf)
+
+    @staticmethod
+    def _iter_pages(pdf):
+        try:
+            for page in pdf.pages:
+                yield page.extract_text() or ""
+                page.close()
+        finally:
+            pdf.close()
+
+
+class PdfminerBackend(PdfBackend):
+    """pdfminer.six - pure Python layout analysis"""
+
+    name = "pdfminer"
+    module = "pdfminer"
+
+    def open(self, source):
+        from pdfminer.pdfpage import PDFPage
+
+        stream = _open_source(source)
+        if isinstance(stream, str):
+            with open(stream, "rb") as f:
+                stream = io.BytesIO(f.read())
+        page_count = sum(1 for _ in PDFPage.get_pages(stream))
+        stream.seek(0)
+        return page_count, self._iter_pages(stream)
+
+    @staticmethod
+    def _iter_pages(stream):
+        from pdfminer.high_level import extract_pages
+        from pdfminer.layout import LTTextContainer
+
+        for layout in extract_pages(stream):
+            yield "".join(element.get_text() for element in layout if isinstance(element, LTTextContainer))
+
+
+class PyPDF2Backend(PdfBackend):
+    """PyPDF2 - the original extractor, kept as the last resort"""
+
+    name = "pypdf2"
+    module = "PyPDF2"
+
+    def open(self, source):
+        import PyPDF2
+
+        pdf_reader = PyPDF2.PdfReader(_open_source(source))
+        return len(pdf_reader.pages), (page.extract_text() or "" for page in pdf_reader.pages)
+
+
+PDF_BACKENDS: Dict[str, PdfBackend] = {
+    backend.name: backend
+    for backend in (PdfiumBackend(), PdfplumberBackend(), PdfminerBackend(), PyPDF2Backend())
+}
+
+DEFAULT_BACKEND_ORDER = ["pypdfium2", "pdfplumber", "pdfminer", "pypdf2"]
+
+# Written by benchmark_pdf_backends.py; a relative PDF_BACKEND_BENCHMARK is taken from the repository root
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BENCHMARK_FILE = os.path.join(REPO_ROOT, os.getenv("PDF_BACKEND_BENCHMARK", "bench_output.txt"))
+
+
+def _benchmark_order(benchmark_path: str) -> List[str]:
+    """Rank backends by measured pages/second, skipping ones that produced unusable text"""
+    try:
+        with open(benchmark_path, "r", encoding="utf-8") as f:
+            results = json.load(f)["backends"]
+    except (OSError, ValueError, KeyError):
+        return []
+    usable = [r for r in results if r.get("usable") and r.get("pages_per_second")]
+    return [r["backend"] for r in sorted(usable, key=lambda r: r["pages_per_second"], reverse=True)]
+
+
+# Read once per process (the app and each extraction worker); rerun the benchmark and restart to change it
+BENCHMARK_ORDER = _benchmark_order(BENCHMARK_FILE)
+
+
+def select_backends() -> List[PdfBackend]:
+    """
+    Backends to try, fastest first. PDF_BACKENDS overrides the order explicitly;
+    otherwise the benchmark file read at import (see benchmark_pdf_backends.py)
+    decides, falling back to the built-in order.
+    """
+    configured = os.getenv("PDF_BACKENDS", "")
+    if configured:
+        order = [name.strip() for name in configured.split(",") if name.strip()]
+    else:
+        order = list(BENCHMARK_ORDER or DEFAULT_BACKEND_ORDER)
+        order += [name for name in DEFAULT_BACKEND_ORDER if name not in order]
+
+    return [PDF_BACKENDS[name] for name in order if name in PDF_BACKENDS and PDF_BACKENDS[name].is_available()]
+
+
+def backend_signature() -> str:
+    """Identifies the backend configuration, e.g. for cache keys of extracted text"""
+    return "+".join(backend.name for backend in select_backends()) or "none"
+
+
+def _is_usable(pages: List[str]) -> bool:
+    return sum(len(page.strip()) for page in pages) >= MIN_USABLE_CHARS
+
+
+def extract_pdf_pages(source: PdfSource, max_pages: Optional[int] = None, clean: bool = False,
+                      backends: Optional[List[PdfBackend]] = None,
+                      on_page: Optional[Callable[[str], bool]] = None) -> Dict:
+    """
+    Extract the text of each page from a PDF path or PDF bytes.
+
+    Backends are tried in order; a backend that fails or yields no usable text
+    for this document falls through to the next one. Pages are pulled lazily,
+    and if on_page(page_text) returns True the remaining pages are never read.
+    """
+    backends = backends if backends is not None else select_backends()
+    if not backends:
+        raise RuntimeError("No PDF extraction backend is installed")
+
+    result = None
+    last_error = None
+    for backend in backends:
+        try:
+            page_count, page_iter = backend.open(source)
+            pages = []
+            for page_text in itertools.islice(page_iter, max_pages):
+                page_text = clean_page_text(page_text) if clean else page_text
+                pages.append(page_text)
+                if on_page and on_page(page_text):
+                    break
+            page_iter.close()
+        except Exception as e:
+            last_error = e
+            logger.warning(f"{backend.name} could not extract PDF: {e}")
+            continue
+
+        result = {"pages": pages, "page_count": page_count, "method": backend.name}
+        if _is_usable(pages):
+            return result
+        logger.info(f"{backend.name} returned no usable text, trying next backend")
+
+    if result is None:
+        raise last_error
+    return result
+
+
+def extract_pdf_document(pdf_bytes: bytes, max_pages: Optional[int] = None,
+                         on_page: Optional[Callable[[str], bool]] = None) -> Dict:
+    """Extract cleaned, non-empty page texts from PDF bytes with a status report"""
+    result = {
+        "text": "",
+        "page_count": 0,
+        "pages": [],
+        "method": None,
+        "success": False,
+        "error": None
+    }
+
+    try:
+        # Check if it's actually a PDF
+        if not pdf_bytes.startswith(b'%PDF'):
+            result["error"] = "File is not a PDF document"
+            return result
+
+        extraction = extract_pdf_pages(pdf_bytes, max_pages=max_pages, clean=True, on_page=on_page)
+        result["page_count"] = extraction["page_count"]
+        result["method"] = extraction["method"]
+        result["pages"] = [page for page in extraction["pages"] if page.strip()]
+        result["text"] = "\n\n".join(result["pages"])
+        result["success"] = bool(result["text"].strip())
+
+        # If no text extracted, it might be scanned PDF
+        if not result["text"].strip():
+            result["error"] = "No text found - document may be scanned/image-based"
+
+    except Exception as e:
+        result["error"] = str(e)
+        logger.error(f"PDF extraction failed: {e}")
+
+    return result
@@ -0,0 +1,659 @@
+# app/services/readiness_engine.py
+"""
+Batch readiness scoring: one company against many tenders.
+
+Each tender's requirements are reduced once to a requirement record
+(extract_tender_features): industries, required years, CIDB grade, BBBEE
+level, certifications, province and capacity thresholds. Records are plain
+JSON-friendly dicts and are persisted per tender (tender_requirements), so
+matching is a comparison between two precomputed records. A batch of
+records becomes a fixed-width feature matrix, the company a matching
+vector, and every criterion is evaluated for all tenders at once with
+NumPy array operations.
+
+Criteria are plugins (Criterion subclasses) configured by the declarative
+rule sets in scoring_rules. Keyword tables, patterns and rule sets are
+compiled once at import; a company's rule set is chosen by sector or plan
+tier (CompiledCompanyProfile) and named in its scoring dict.
+
+Results keep each criterion's points and checklist items, and record
+which criteria depend on the company at all, so a stored score can be
+refreshed one criterion at a time (rescore) after a profile or tender edit.
+"""
+import heapq
+import re
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.models.user_models import PROVINCES
+from app.services import scoring_rules
+from app.services.tender_analysis import analyze_text
+from app.services.value_normalizer import parse_zar_amount
+
+
+def _keyword_regex(keywords: Sequence[str]) -> re.Pattern:
+    """One alternation per keyword table: search() is true when any keyword occurs as a substring"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)))
+
+
+# ---------------------------
+# Extraction tables, compiled once
+# ---------------------------
+
+EXTRACTION = scoring_rules.EXTRACTION
+INDUSTRY_MATCHERS = {name: _keyword_regex(keywords) for name, keywords in EXTRACTION['industry_keywords'].items()}
+CERTIFICATION_MATCHERS = {name: _keyword_regex(keywords) for name, keywords in EXTRACTION['certification_types'].items()}
+EXPERIENCE_PATTERNS = [re.compile(pattern) for pattern in EXTRACTION['experience_patterns']]
+STAFF_KEYWORDS = _keyword_regex(EXTRACTION['staff_keywords'])
+TURNOVER_KEYWORDS = _keyword_regex(EXTRACTION['turnover_keywords'])
+BBBEE_KEYWORDS = _keyword_regex(EXTRACTION['bbbee_keywords'])
+CIDB_GRADE_PATTERN = re.compile(EXTRACTION['cidb_grade_pattern'])
+BBBEE_LEVEL_PATTERN = re.compile(EXTRACTION['bbbee_level_pattern'])
+EMPLOYEES_PATTERN = re.compile(EXTRACTION['employees_pattern'])
+PROVINCE_NAMES = [province.lower() for province in PROVINCES]
+
+INDUSTRIES = list(INDUSTRY_MATCHERS)
+CERTIFICATIONS = list(CERTIFICATION_MATCHERS)
+INDUSTRY_SLOTS = {name: i for i, name in enumerate(INDUSTRIES)}
+CERTIFICATION_SLOTS = {name: i for i, name in enumerate(CERTIFICATIONS)}
+CIDB_SLOT = CERTIFICATION_SLOTS['cidb']
+
+# Tender feature vector layout
+F_INDUSTRY = slice(0, len(INDUSTRIES))
+F_CERT = slice(F_INDUSTRY.stop, F_INDUSTRY.stop + len(CERTIFICATIONS))
+F_YEARS = F_CERT.stop
+F_STAFF = F_YEARS + 1
+F_MIN_EMPLOYEES = F_YEARS + 2  # 0 = no number stated
+F_TURNOVER = F_YEARS + 3
+F_MIN_TURNOVER = F_YEARS + 4   # 0 = no amount stated
+F_BBBEE = F_YEARS + 5
+F_CIDB_GRADE = F_YEARS + 6     # 0 = no grade stated
+F_BBBEE_LEVEL = F_YEARS + 7    # 0 = no level stated
+TENDER_FEATURES = F_YEARS + 8
+
+# Company vector layout (same industry/certification slots)
+C_YEARS = F_CERT.stop
+C_EMPLOYEES = C_YEARS + 1
+C_TURNOVER = C_YEARS + 2
+C_BLACK_OWNED = C_YEARS + 3
+C_CIDB_GRADE = C_YEARS + 4   # 0 = unknown
+C_BBBEE_LEVEL = C_YEARS + 5  # 0 = unknown
+COMPANY_FEATURES = C_YEARS + 6
+
+
+def _first_int(pattern: re.Pattern, sentences: List[str]) -> Optional[int]:
+    for sentence in sentences:
+        match = pattern.search(sentence)
+        if match:
+            return int(next(group for group in match.groups() if group))
+    return None
+
+
+def extract_tender_features(text: str) -> Dict:
+    """
+    Requirement record of one tender text, read from its eligibility and key
+    requirement sentences (via the shared, memoized TenderAnalysis).
+    """
+    analysis = analyze_text(text)
+    requirements = analysis.requirements
+    eligibility_categories = analysis.index.categories_in('eligibility', 10)
+    criteria_categories = eligibility_categories | analysis.index.categories_in('requirement', 15)
+
+    text_lower = analysis.text_lower
+    eligibility_sentences = [sentence.lower() for sentence in requirements['eligibility_criteria']]
+    criteria_sentences = eligibility_sentences + [sentence.lower() for sentence in requirements['key_requirements']]
+    criteria_text = ' '.join(criteria_sentences)
+    eligibility_text = ' '.join(eligibility_sentences)
+
+    required_years = 0
+    if 'experience' in criteria_categories:
+        for pattern in EXPERIENCE_PATTERNS:
+            found = pattern.findall(criteria_text)
+            if found:
+                required_years = int(found[0])
+                break
+
+    certifications = []
+    if 'certification' in criteria_categories:
+        certifications = [name for name, matcher in CERTIFICATION_MATCHERS.items() if matcher.search(criteria_text)]
+
+    capacity = 'capacity' in eligibility_categories
+    requires_staff = capacity and bool(STAFF_KEYWORDS.search(eligibility_text))
+    requires_turnover = capacity and bool(TURNOVER_KEYWORDS.search(eligibility_text))
+    requires_bbbee = 'bbbee' in eligibility_categories and bool(BBBEE_KEYWORDS.search(eligibility_text))
+
+    min_turnover = None
+    if requires_turnover:
+        amounts = [parse_zar_amount(sentence) for sentence in eligibility_sentences if TURNOVER_KEYWORDS.search(sentence)]
+        min_turnover = max([amount for amount in amounts if amount], default=None)
+
+    location = (requirements.get('location') or '').lower()
+    province = next((name for name in PROVINCE_NAMES if name in location), None) or \
+        next((name for name in PROVINCE_NAMES if name in text_lower), None)
+
+    return {
+        'industries': [name for name, matcher in INDUSTRY_MATCHERS.items() if matcher.search(text_lower)],
+        'required_years': required_years,
+        'location': location,
+        'province': province,
+        'certifications': certifications,
+        'cidb_grade': _first_int(CIDB_GRADE_PATTERN, criteria_sentences) if 'cidb' in certifications else None,
+        'bbbee_level': _first_int(BBBEE_LEVEL_PATTERN, eligibility_sentences) if requires_bbbee else None,
+        'requires_staff': requires_staff,
+        'min_employees': _first_int(EMPLOYEES_PATTERN, eligibility_sentences) if requires_staff else None,
+        'requires_turnover': requires_turnover,
+        'min_turnover': min_turnover,
+        'requires_bbbee': requires_bbbee,
+    }
+
+
+def tender_matrix(records: Sequence[Dict]) -> np.ndarray:
+    """(n_tenders, TENDER_FEATURES) float64 matrix of requirement records"""
+    matrix = np.zeros((len(records), TENDER_FEATURES), dtype=np.float64)
+    for row, record in enumerate(records):
+        # Names unknown to the current tables (older records) are ignored
+        for industry in record['industries']:
+            if industry in INDUSTRY_SLOTS:
+                matrix[row, F_INDUSTRY.start + INDUSTRY_SLOTS[industry]] = 1
+        for cert_type in record['certifications']:
+            if cert_type in CERTIFICATION_SLOTS:
+                matrix[row, F_CERT.start + CERTIFICATION_SLOTS[cert_type]] = 1
+        matrix[row, F_YEARS] = record['required_years']
+        matrix[row, F_STAFF] = record['requires_staff']
+        matrix[row, F_MIN_EMPLOYEES] = record.get('min_employees') or 0
+        matrix[row, F_TURNOVER] = record['requires_turnover']
+        matrix[row, F_MIN_TURNOVER] = record.get('min_turnover') or 0
+        matrix[row, F_BBBEE] = record['requires_bbbee']
+        matrix[row, F_CIDB_GRADE] = record.get('cidb_grade') or 0
+        matrix[row, F_BBBEE_LEVEL] = record.get('bbbee_level') or 0
+    return matrix
+
+
+def company_vector(company: Dict) -> np.ndarray:
+    """Company dict (as passed to readiness_scoring) as a COMPANY_FEATURES vector"""
+    vector = np.zeros(COMPANY_FEATURES, dtype=np.float64)
+    industry = (company.get('industry') or '').lower()
+    for i, matcher in enumerate(INDUSTRY_MATCHERS.values()):
+        vector[F_INDUSTRY.start + i] = bool(matcher.search(industry))
+    certs = [cert.lower() for cert in company.get('certifications', [])]
+    for i, matcher in enumerate(CERTIFICATION_MATCHERS.values()):
+        vector[F_CERT.start + i] = any(matcher.search(cert) for cert in certs)
+    vector[C_YEARS] = company.get('years_of_experience') or 0
+    vector[C_EMPLOYEES] = company.get('employee_count') or 0
+    vector[C_TURNOVER] = company.get('annual_turnover') or 0
+    vector[C_BLACK_OWNED] = bool(company.get('black_owned'))
+    vector[C_CIDB_GRADE] = company.get('cidb_grade') or 0
+    vector[C_BBBEE_LEVEL] = company.get('bbbee_level') or 0
+    return vector
+
+
+def _location_matches(locations: List[str], company_locations: List[str]) -> np.ndarray:
+    """Per tender: a company location is in the tender location, or the reverse"""
+    matched = np.zeros(len(locations), dtype=bool)
+    if not company_locations or not locations:
+        return matched
+    tender_locations = np.array(locations, dtype=np.str_)
+    for location in company_locations:
+        matched |= np.char.find(tender_locations, location) >= 0
+        matched |= np.char.find(np.array(location, dtype=np.str_), tender_locations) >= 0
+    return matched
+
+
+# ---------------------------
+# Criterion plugins
+# ---------------------------
+
+# name -> Criterion subclass, in checklist order
+CRITERIA = {}
+
+
+def register_criterion(cls):
+    """Class decorator adding a Criterion plugin to CRITERIA"""
+    CRITERIA[cls.name] = cls
+    return cls
+
+
+class Criterion(ABC):
+    """
+    One scoring criterion. evaluate() works on all tenders at once and
+    returns outcome arrays including 'points'; checklist() renders tender i.
+    Constructor keyword arguments are the criterion's rule set parameters.
+    A plugin missing a method fails when its rule set is compiled.
+    """
+    name = None
+    profile_fields = ()  # company dict keys the outcome reads
+    record_fields = ()   # requirement record keys the outcome reads
+
+    def __init__(self, weight: int):
+        self.weight = weight
+
+    @abstractmethod
+    def evaluate(self, matrix: np.ndarray, vector: np.ndarray, records: Sequence[Dict], company: Dict) -> Dict:
+        ...
+
+    @abstractmethod
+    def checklist(self, i: int, record: Dict, outcome: Dict, vector: np.ndarray, company: Dict) -> List[str]:
+        ...
+
+    @abstractmethod
+    def depends_on_company(self, record: Dict) -> bool:
+        """Whether the company can change this criterion's outcome for the tender"""
+
+
+@register_criterion
+class IndustryCriterion(Criterion):
+    name = 'industry'
+    profile_fields = ('industry',)
+    record_fields = ('industries',)
+
+    def evaluate(self, matrix, vector, records, company):
+        matched = (matrix[:, F_INDUSTRY] * vector[F_INDUSTRY]).any(axis=1)
+        return {'points': np.where(matched, self.weight, 0), 'matched': matched}
+
+    def checklist(self, i, record, outcome, vector, company):
+        return ["✅ Industry/Sector: MATCHED" if outcome['matched'][i] else "❌ Industry/Sector: NOT MATCHED"]
+
+    def depends_on_company(self, record):
+        return bool(record['industries'])
+
+
+@register_criterion
+class ExperienceCriterion(Criterion):
+    name = 'experience'
+    profile_fields = ('years_of_experience',)
+    record_fields = ('required_years',)
+
+    def __init__(self, weight: int, unmet_points: int):
+        super().__init__(weight)
+        self.unmet_points = unmet_points
+
+    def evaluate(self, matrix, vector, records, company):
+        required_years = matrix[:, F_YEARS]
+        met = (required_years == 0) | (vector[C_YEARS] >= required_years)
+        return {'points': np.where(met, self.weight, self.unmet_points), 'met': met}
+
+    def checklist(self, i, record, outcome, vector, company):
+        required_years = record['required_years']
+        company_years = company.get('years_of_experience', 0)
+        if required_years == 0:
+            return ["✅ Experience: No specific requirement"]
+        if outcome['met'][i]:
+            return [f"✅ Experience: {company_years} years (meets {required_years}+ requirement)"]
+        return [f"❌ Experience: {company_years} years (needs {required_years}+ years)"]
+
+    def depends_on_company(self, record):
+        return record['required_years'] > 0
+
+
+@register_criterion
+class LocationCriterion(Criterion):
+    name = 'location'
+    profile_fields = ('geographic_coverage',)
+    record_fields = ('location',)
+
+    def evaluate(self, matrix, vector, records, company):
+        has_location = np.array([bool(record['location']) for record in records], dtype=bool)
+        company_locations = [loc.strip().lower() for loc in company.get('geographic_coverage', [])]
+        met = ~has_location | _location_matches([record['location'] for record in records], company_locations)
+        return {'points': np.where(met, self.weight, 0), 'has_location': has_location, 'met': met}
+
+    def checklist(self, i, record, outcome, vector, company):
+        if not outcome['has_location'][i]:
+            return ["✅ Location: No specific requirement"]
+        if outcome['met'][i]:
+            return [f"✅ Location: Operates in {record['location']}"]
+        return [f"❌ Location: Does not operate in {record['location']}"]
+
+    def depends_on_company(self, record):
+        return bool(record['location'])
+
+
+@register_criterion
+class CertificationCriterion(Criterion):
+    name = 'certification'
+    profile_fields = ('certifications', 'cidb_grade')
+    record_fields = ('certifications', 'cidb_grade')
+
+    def __init__(self, weight: int, points_per_certification: int):
+        super().__init__(weight)
+        self.points_per_certification = points_per_certification
+
+    def evaluate(self, matrix, vector, records, company):
+        # A stated CIDB grade is compared when the company's grade is known
+        required_grade = matrix[:, F_CIDB_GRADE]
+        grade_compared = (required_grade > 0) & (vector[C_CIDB_GRADE] > 0)
+        grade_met = ~grade_compared | (vector[C_CIDB_GRADE] >= required_grade)
+
+        required = matrix[:, F_CERT] > 0
+        held = required & (vector[F_CERT] > 0)
+        held[:, CIDB_SLOT] &= grade_met
+        points = np.where(~required.any(axis=1), self.weight,
+                          np.minimum(held.sum(axis=1) * self.points_per_certification, self.weight))
+        return {'points': points, 'required': required, 'held': held, 'grade_compared': grade_compared}
+
+    def checklist(self, i, record, outcome, vector, company):
+        items = []
+        for j, cert_type in enumerate(CERTIFICATIONS):
+            if not outcome['required'][i, j]:
+                continue
+            if j == CIDB_SLOT and outcome['grade_compared'][i] and vector[F_CERT.start + j]:
+                grade, required = int(vector[C_CIDB_GRADE]), record['cidb_grade']
+                items.append(f"✅ CIDB: Grade {grade} (meets grade {required})" if outcome['held'][i, j]
+                             else f"❌ CIDB: Grade {grade} (needs grade {required})")
+            elif outcome['held'][i, j]:
+                items.append(f"✅ {cert_type.upper()}: Certified")
+            else:
+                items.append(f"❌ {cert_type.upper()}: Not certified")
+        return items or ["✅ Certifications: No specific requirements"]
+
+    def depends_on_company(self, record):
+        return bool(record['certifications'])
+
+
+@register_criterion
+class CapacityCriterion(Criterion):
+    name = 'capacity'
+    profile_fields = ('employee_count', 'annual_turnover')
+    record_fields = ('requires_staff', 'min_employees', 'requires_turnover', 'min_turnover')
+
+    def __init__(self, weight: int, unstated_points: int, points_per_requirement: int,
+                 min_employees: int, min_turnover: float):
+        super().__init__(weight)
+        self.unstated_points = unstated_points
+        self.points_per_requirement = points_per_requirement
+        self.min_employees = min_employees
+        self.min_turnover = min_turnover
+
+    def evaluate(self, matrix, vector, records, company):
+        staff_required = matrix[:, F_STAFF] > 0
+        turnover_required = matrix[:, F_TURNOVER] > 0
+        min_employees = np.where(matrix[:, F_MIN_EMPLOYEES] > 0, matrix[:, F_MIN_EMPLOYEES], self.min_employees)
+        min_turnover = np.where(matrix[:, F_MIN_TURNOVER] > 0, matrix[:, F_MIN_TURNOVER], self.min_turnover)
+        staff_met = vector[C_EMPLOYEES] >= min_employees
+        turnover_met = vector[C_TURNOVER] >= min_turnover
+        met = (staff_required & staff_met).astype(np.int64) + (turnover_required & turnover_met)
+        points = np.where(~(staff_required | turnover_required), self.unstated_points,
+                          np.minimum(met * self.points_per_requirement, self.weight))
+        return {'points': points, 'staff_required': staff_required, 'staff_met': staff_met,
+                'turnover_required': turnover_required, 'turnover_met': turnover_met}
+
+    def checklist(self, i, record, outcome, vector, company):
+        items = []
+        if outcome['staff_required'][i]:
+            met = outcome['staff_met'][i]
+            if record.get('min_employees'):
+                employees = int(vector[C_EMPLOYEES])
+                items.append(f"✅ Capacity: {employees} employees (meets {record['min_employees']}+)" if met
+                             else f"❌ Capacity: {employees} employees (needs {record['min_employees']}+)")
+            else:
+                items.append("✅ Capacity: Adequate workforce" if met else "❌ Capacity: Limited workforce")
+        if outcome['turnover_required'][i]:
+            met = outcome['turnover_met'][i]
+            if record.get('min_turnover'):
+                required = f"R{record['min_turnover']:,.0f}"
+                items.append(f"✅ Financial: Turnover meets {required}" if met
+                             else f"❌ Financial: Turnover below {required}")
+            else:
+                items.append("✅ Financial: Adequate turnover" if met else "❌ Financial: Limited turnover")
+        return items or ["✅ Capacity: No specific requirements"]
+
+    def depends_on_company(self, record):
+        return record['requires_staff'] or record['requires_turnover']
+
+
+@register_criterion
+class BbbeeCriterion(Criterion):
+    name = 'bbbee'
+    profile_fields = ('black_owned', 'bbbee_level')
+    record_fields = ('requires_bbbee', 'bbbee_level')
+
+    def __init__(self, weight: int, unmet_points: int):
+        super().__init__(weight)
+        self.unmet_points = unmet_points
+
+    def evaluate(self, matrix, vector, records, company):
+        # A stated BBBEE level is compared when the company's level is known (level 1 is best)
+        required = matrix[:, F_BBBEE] > 0
+        required_level = matrix[:, F_BBBEE_LEVEL]
+        level_compared = (required_level > 0) & (vector[C_BBBEE_LEVEL] > 0)
+        met = ~required | np.where(level_compared, vector[C_BBBEE_LEVEL] <= required_level,
+                                   bool(vector[C_BLACK_OWNED]))
+        return {'points': np.where(met, self.weight, self.unmet_points), 'level_compared': level_compared, 'met': met}
+
+    def checklist(self, i, record, outcome, vector, company):
+        if not record['requires_bbbee']:
+            return ["✅ BBBEE: No specific requirement"]
+        if outcome['level_compared'][i]:
+            level, required = int(vector[C_BBBEE_LEVEL]), record['bbbee_level']
+            return [f"✅ BBBEE: Level {level} (meets level {required})" if outcome['met'][i]
+                    else f"❌ BBBEE: Level {level} (needs level {required} or better)"]
+        if vector[C_BLACK_OWNED]:
+            return ["✅ BBBEE: Compliant (Black-owned)"]
+        return ["❌ BBBEE: Not compliant"]
+
+    def depends_on_company(self, record):
+        return record['requires_bbbee']
+
+
+CRITERION_BITS = {name: 1 << bit for bit, name in enumerate(CRITERIA)}
+
+
+# ---------------------------
+# Rule sets, compiled once
+# ---------------------------
+
+class CompiledRuleSet:
+    """A rule set from scoring_rules as configured plugin instances and a weight vector"""
+
+    def __init__(self, name: str, config: Dict):
+        unknown = set(config['criteria']) - set(CRITERIA)
+        if unknown:
+            raise ValueError(f"Rule set '{name}' uses unknown criteria: {', '.join(sorted(unknown))}")
+        self.name = name
+        self.criteria = {
+            criterion: CRITERIA[criterion](**config['criteria'][criterion])
+            for criterion in CRITERIA if criterion in config['criteria']
+        }
+        self.weights = np.array([plugin.weight for plugin in self.criteria.values()], dtype=np.int64)
+        self.total_points = int(self.weights.sum())
+        if self.total_points <= 0:
+            raise ValueError(f"Rule set '{name}' has no weighted criteria")
+
+
+RULE_SETS = {name: CompiledRuleSet(name, config) for name, config in scoring_rules.load_rule_sets().items()}
+
+
+def rules_for(company: Dict) -> CompiledRuleSet:
+    """The company's rule set (its scoring dict names it), falling back to "default" """
+    return RULE_SETS.get(company.get('rule_set') or 'default', RULE_SETS['default'])
+
+
+# ---------------------------
+# Dependencies: which criteria a change can move
+# ---------------------------
+
+def record_dependencies(record: Dict, rules: CompiledRuleSet = None) -> List[str]:
+    """Criteria whose outcome depends on the company for this tender (the others are fixed by the tender alone)"""
+    rules = rules or RULE_SETS['default']
+    return [name for name, plugin in rules.criteria.items() if plugin.depends_on_company(record)]
+
+
+def dependency_mask(criteria) -> int:
+    """Bitmask of criteria names (CRITERION_BITS), as stored with each score"""
+    mask = 0
+    for name in criteria:
+        mask |= CRITERION_BITS[name]
+    return mask
+
+
+def rule_set_changed(old: Dict, new: Dict) -> bool:
+    """Whether a profile edit moves the company to another rule set, which changes every stored score"""
+    return old.get('rule_set') != new.get('rule_set')
+
+
+def changed_profile_criteria(old: Dict, new: Dict) -> List[str]:
+    """Criteria affected by a company profile edit (company dicts as passed to readiness_scoring)"""
+    if rule_set_changed(old, new):
+        return list(CRITERIA)
+    return [name for name, plugin in CRITERIA.items()
+            if any(old.get(field) != new.get(field) for field in plugin.profile_fields)]
+
+
+def changed_record_criteria(old: Dict, new: Dict) -> List[str]:
+    """Criteria affected by a tender's requirement record being re-extracted"""
+    return [name for name, plugin in CRITERIA.items()
+            if any(old.get(field) != new.get(field) for field in plugin.record_fields)]
+
+
+# ---------------------------
+# Scoring
+# ---------------------------
+
+def score_features(records: Sequence[Dict], company: Dict, vector: np.ndarray = None,
+                   criteria: Sequence[str] = None) -> Dict:
+    """
+    Outcome arrays of the company's rule set criteria (or only `criteria`)
+    for every record. 'scores' is included only when every criterion is evaluated.
+    """
+    rules = rules_for(company)
+    matrix = tender_matrix(records)
+    if vector is None:
+        vector = company_vector(company)
+
+    outcomes = {
+        name: plugin.evaluate(matrix, vector, records, company)
+        for name, plugin in rules.criteria.items() if criteria is None or name in criteria
+    }
+    features = {'company': vector, 'rules': rules, 'criteria': outcomes}
+    if criteria is None:
+        earned = np.stack([outcome['points'] for outcome in outcomes.values()], axis=1).sum(axis=1)
+        features['scores'] = np.minimum(100, (earned * 100) // rules.total_points).astype(np.int64)
+    return features
+
+
+def _criteria_results(i: int, record: Dict, features: Dict, company: Dict) -> Dict[str, Dict]:
+    """{criterion: {"points", "checklist"}} of tender i for the evaluated criteria"""
+    plugins = features['rules'].criteria
+    return {
+        name: {
+            "points": int(outcome['points'][i]),
+            "checklist": plugins[name].checklist(i, record, outcome, features['company'], company),
+        }
+        for name, outcome in features['criteria'].items()
+    }
+
+
+def generate_recommendation(score: int, checklist: List[str]) -> str:
+    """Generate recommendation based on score"""
+    matched_count = len([c for c in checklist if '✅' in c])
+    total_count = len(checklist)
+
+    if score >= 80:
+        return f"HIGHLY SUITABLE - Strong match ({matched_count}/{total_count} criteria). Recommended for bidding."
+    elif score >= 60:
+        return f"SUITABLE - Good match ({matched_count}/{total_count} criteria). Consider bidding with minor adjustments."
+    elif score >= 40:
+        return f"MODERATELY SUITABLE - Partial match ({matched_count}/{total_count} criteria). Review requirements carefully."
+    else:
+        return f"LOW SUITABILITY - Limited match ({matched_count}/{total_count} criteria). Not recommended unless gaps can be addressed."
+
+
+def combine_criteria(criteria: Dict[str, Dict], record: Dict, rules: CompiledRuleSet = None) -> Dict:
+    """readiness_scoring-shaped result from per-criterion points and checklist items"""
+    rules = rules or RULE_SETS['default']
+    earned = sum(criteria[name]["points"] for name in rules.criteria)
+    score = min(100, (earned * 100) // rules.total_points)
+    checklist = [item for name in rules.criteria for item in criteria[name]["checklist"]]
+    return {
+        "suitability_score": score,
+        "recommendation": generate_recommendation(score, checklist),
+        "checklist": checklist,
+        "matched_criteria": len([c for c in checklist if '✅' in c]),
+        "total_criteria": len(checklist),
+        "criteria": criteria,
+        "depends_on": record_dependencies(record, rules),
+    }
+
+
+def score_batch(records: Sequence[Dict], company: Dict, vector: np.ndarray = None) -> List[Dict]:
+    """
+    readiness_scoring-shaped results for every requirement record, in input
+    order. Pass a precomputed company vector (CompiledCompanyProfile.vector)
+    to skip rebuilding it.
+    """
+    if not records:
+        return []
+    features = score_features(records, company, vector)
+    return [combine_criteria(_criteria_results(i, record, features, company), record, features['rules'])
+            for i, record in enumerate(records)]
+
+
+def rescore(records: Sequence[Dict], stored: Sequence[Optional[Dict]], company: Dict, criteria: Sequence[str],
+            vector: np.ndarray = None) -> List[Dict]:
+    """
+    Re-evaluate only `criteria` for each record and merge them into its
+    stored per-criterion results. A record without stored results for every
+    criterion of the rule set (scored before they were kept) is scored in full.
+    """
+    if not records:
+        return []
+    partial = score_features(records, company, vector, criteria)
+    rules = partial['rules']
+    full = None
+    results = []
+    for i, record in enumerate(records):
+        if stored[i] and all(name in stored[i] for name in rules.criteria):
+            merged = {name: stored[i][name] for name in rules.criteria}
+            merged.update(_criteria_results(i, record, partial, company))
+        else:
+            if full is None:
+                full = score_features(records, company, partial['company'])
+            merged = _criteria_results(i, record, full, company)
+        results.append(combine_criteria(merged, record, rules))
+    return results
+
+
+def rank_records(tender_ids: Sequence[str], records: Sequence[Dict], company: Dict, limit: Optional[int] = None,
+                 min_score: int = 0, vector: np.ndarray = None) -> List[Dict]:
+    """Score precomputed records and return them best first (ties keep input order), each with its rank"""
+    results = score_batch(records, company, vector)
+    scores = np.array([result['suitability_score'] for result in results], dtype=np.int64)
+
+    ranked = []
+    for i in np.argsort(-scores, kind='stable'):
+        if scores[i] < min_score:
+            break
+        ranked.append({"rank": len(ranked) + 1, "tender_id": tender_ids[i], **results[i]})
+        if limit and len(ranked) >= limit:
+            break
+    return ranked
+
+
+def top_records(tender_ids: Sequence[str], records: Sequence[Dict], company: Dict, n: int,
+                min_score: int = 0, vector: np.ndarray = None) -> List[Dict]:
+    """
+    The n best-scoring records, best first (ties keep input order). Scores
+    are computed for every record, but only the selected n are turned into
+    checklists and recommendations.
+    """
+    if not records or n <= 0:
+        return []
+    features = score_features(records, company, vector)
+    scores = features['scores']
+    candidates = np.flatnonzero(scores >= min_score)
+    selected = heapq.nlargest(n, candidates.tolist(), key=scores.__getitem__)
+
+    return [
+        {"rank": rank, "tender_id": tender_ids[i],
+         **combine_criteria(_criteria_results(i, records[i], features, company), records[i], features['rules'])}
+        for rank, i in enumerate(selected, 1)
+    ]
+
+
+def rank_tenders(tenders: Sequence[Dict], company: Dict, limit: Optional[int] = None,
+                 min_score: int = 0, vector: np.ndarray = None) -> List[Dict]:
+    """Score [{"tender_id", "text"}, ...] against one company, best first"""
+    records = [extract_tender_features(tender['text']) for tender in tenders]
+    return rank_records([tender.get('tender_id') for tender in tenders], records, company, limit, min_score, vector)
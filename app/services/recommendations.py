@@ -0,0 +1,112 @@
+# app/services/recommendations.py
+import os
+import threading
+from datetime import date
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+
+from app.models.tender_models import Tender
+from app.models.tender_requirements import TenderRequirements
+from app.services.company_profiles import CompiledCompanyProfile
+from app.services.readiness_engine import top_records
+from app.services.tender_requirements import tender_requirement_store
+
+load_dotenv()
+
+
+class RecommendationService:
+    """
+    "Recommended for you": a team's best-matching open tenders.
+
+    Every open tender's stored requirement record is scored against the
+    compiled company profile in one vectorized pass and the top
+    RECOMMENDATION_MAX_RESULTS are picked with a heap. The ranking is cached
+    per team and reused until the profile changes or the set of requirement
+    records does (new or re-extracted tenders), or the day rolls over and
+    deadlines close.
+    """
+
+    def __init__(self):
+        self.max_results = int(os.getenv("RECOMMENDATION_MAX_RESULTS", 50))
+        self._entries: Dict[Optional[int], tuple] = {}  # team_id -> (profile data, tenders stamp, results)
+        self._lock = threading.Lock()
+
+    def _tenders_stamp(self, db: Session) -> tuple:
+        """Changes whenever a requirement record is added or rewritten"""
+        count, last_updated = db.query(
+            func.count(TenderRequirements.id), func.max(TenderRequirements.updated_at)
+        ).one()
+        return date.today().isoformat(), count, last_updated
+
+    def _open_tenders(self, db: Session) -> List:
+        # OCDS deadlines are ISO 8601 strings, so they compare as text; no deadline counts as open
+        today = date.today().isoformat()
+        return db.query(
+            Tender.ocds_id, Tender.title, Tender.description, Tender.province, Tender.buyer_name,
+            Tender.submission_deadline, Tender.estimated_value
+        ).filter(
+            Tender.ocds_id.isnot(None),
+            or_(Tender.submission_deadline.is_(None), Tender.submission_deadline == "",
+                Tender.submission_deadline >= today)
+        ).all()
+
+    def _compute(self, db: Session, profile: CompiledCompanyProfile) -> List[Dict]:
+        tenders = self._open_tenders(db)
+        records = tender_requirement_store.get_many(db, [tender.ocds_id for tender in tenders])
+
+        # Tenders stored before requirement records existed get one from their ingested fields
+        missing = {
+            tender.ocds_id: f"{tender.title or ''}\n{tender.description or ''}\n{tender.province or ''}"
+            for tender in tenders if tender.ocds_id not in records
+        }
+        if missing:
+            records.update(tender_requirement_store.save_many(db, missing, "ingest")[0])  # New records: nothing amended
+
+        tenders = [tender for tender in tenders if tender.ocds_id in records]
+        top = top_records(
+            [tender.ocds_id for tender in tenders], [records[tender.ocds_id] for tender in tenders],
+            profile.data, self.max_results, vector=profile.vector
+        )
+
+        by_id = {tender.ocds_id: tender for tender in tenders}
+        for result in top:
+            tender = by_id[result["tender_id"]]
+            result.update({
+                "title": tender.title,
+                "buyer_name": tender.buyer_name,
+                "province": tender.province,
+                "submission_deadline": tender.submission_deadline,
+                "estimated_value": tender.estimated_value,
+            })
+        print(f"⭐ Ranked {len(tenders)} open tenders for {profile.name}")
+        return top
+
+    def recommend(self, db: Session, profile: CompiledCompanyProfile, limit: int = 10) -> Dict:
+        """Top `limit` open tenders for the profile's team, best first"""
+        stamp = self._tenders_stamp(db)
+        with self._lock:
+            entry = self._entries.get(profile.team_id)
+        if entry is not None and entry[0] == profile.data and entry[1] == stamp:
+            return {"results": entry[2][:limit], "cached": True}
+
+        results = self._compute(db, profile)
+        # Records written while computing belong to this ranking
+        stamp = self._tenders_stamp(db)
+        with self._lock:
+            self._entries[profile.team_id] = (profile.data, stamp, results)
+        return {"results": results[:limit], "cached": False}
+
+    def invalidate(self, team_id: Optional[int] = None):
+        """Drop a team's ranking, or every team's"""
+        with self._lock:
+            if team_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(team_id, None)
+
+
+# Global instance
+recommendation_service = RecommendationService()
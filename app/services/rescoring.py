@@ -0,0 +1,90 @@
+# app/services/rescoring.py
+import json
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.user_models import CompanyProfile
+from app.services.company_profiles import CompiledCompanyProfile
+from app.services.match_score_store import match_score_store
+from app.services.readiness_engine import rescore
+from app.services.tender_requirements import tender_requirement_store
+
+
+def _stored_criteria(row) -> Dict:
+    return json.loads(row.criteria) if row.criteria else None
+
+
+def _rescore_rows(rows: List, records: Dict[str, Dict], profile: CompiledCompanyProfile,
+                  criteria: List[str]) -> List[Tuple]:
+    """(tender_id, company_id, result, user_id) for rows whose tender has a requirement record"""
+    rows = [row for row in rows if row.tender_id in records]
+    if not rows:
+        return []
+    results = rescore(
+        [records[row.tender_id] for row in rows], [_stored_criteria(row) for row in rows],
+        profile.data, criteria, profile.vector
+    )
+    return [(row.tender_id, row.company_id, result, row.user_id) for row, result in zip(rows, results)]
+
+
+def rescore_company(db: Session, profile: CompiledCompanyProfile, criteria: List[str],
+                    rule_set_changed: bool = False) -> int:
+    """
+    After a profile edit touching `criteria`: re-evaluate those criteria for the
+    company's stored scores that depend on them. When the edit moved the company
+    to another rule set, every stored score is re-evaluated, including those that
+    depend on no company field. Scores of tenders without a requirement record
+    (matched from text that was never stored) cannot be re-evaluated and are
+    deleted rather than left stale. Returns the number of scores updated.
+    """
+    if not criteria:
+        return 0
+    if rule_set_changed:
+        rows = match_score_store.company_scores(db, profile.id)
+    else:
+        rows = match_score_store.dependent_scores(db, profile.id, criteria)
+    if not rows:
+        return 0
+    records = tender_requirement_store.get_many(db, {row.tender_id for row in rows})
+    stale = [row for row in rows if row.tender_id not in records]
+    if stale:
+        match_score_store.delete_scores(db, stale)
+        print(f"🗑️ Deleted {len(stale)} scores for {profile.name} without a requirement record")
+    scores = _rescore_rows(rows, records, profile, criteria)
+    match_score_store.store_many(db, scores)
+    print(f"♻️ Rescored {len(scores)} tenders for {profile.name} ({', '.join(criteria)})")
+    return len(scores)
+
+
+def rescore_tenders(db: Session, changes: Dict[str, Tuple[Dict, List[str]]]) -> int:
+    """
+    After tenders' requirement records change: {tender_id: (new record, changed criteria)}.
+    Re-evaluates the changed criteria of every company's stored score for those
+    tenders only. Returns the number of scores updated.
+    """
+    changes = {tender_id: change for tender_id, change in changes.items() if change[1]}
+    if not changes:
+        return 0
+    rows = match_score_store.tender_scores(db, changes)
+    if not rows:
+        return 0
+
+    profiles = {
+        profile.id: CompiledCompanyProfile(profile) for profile in
+        db.query(CompanyProfile).filter(CompanyProfile.id.in_({row.company_id for row in rows})).all()
+    }
+    # One vectorized pass per company and set of changed criteria
+    groups = defaultdict(list)
+    for row in rows:
+        if row.company_id in profiles:
+            groups[(row.company_id, tuple(changes[row.tender_id][1]))].append(row)
+
+    records = {tender_id: record for tender_id, (record, _) in changes.items()}
+    scores = []
+    for (company_id, criteria), group in groups.items():
+        scores.extend(_rescore_rows(group, records, profiles[company_id], list(criteria)))
+    match_score_store.store_many(db, scores)
+    print(f"♻️ Rescored {len(scores)} scores for {len(changes)} amended tenders")
+    return len(scores)
@@ -0,0 +1,110 @@
+# app/services/scoring_rules.py
+"""
+Declarative readiness scoring configuration.
+
+EXTRACTION says how a tender's requirement record is read. It is shared
+by every rule set, because records are stored once per tender. RULE_SETS
+say how records are scored: which criterion plugins run, with what weight
+and parameters. A rule set only lists what it changes from "default"; a
+criterion set to None is switched off. RULE_SET_SELECTION picks a rule set
+per company by industry sector ("sector:<industry keyword>") or plan tier
+("tier:<plan_tier>"), sector first.
+
+Extra rule sets can be supplied without code changes through a JSON file
+named by SCORING_RULES_FILE: {"rule_sets": {...}, "selection": {...}}.
+readiness_engine compiles everything once at import.
+"""
+import copy
+import json
+import os
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Changing these changes stored requirement records: bump tender_requirements.EXTRACTOR_VERSION
+EXTRACTION = {
+    "industry_keywords": {
+        "construction": ["construction", "building", "civil", "engineering", "contractor"],
+        "it": ["it", "technology", "software", "hardware", "digital"],
+        "security": ["security", "guard", "surveillance", "protection"],
+        "cleaning": ["cleaning", "maintenance", "sanitation", "hygiene"],
+    },
+    "certification_types": {
+        "cidb": ["cidb"],
+        "bbbee": ["bbbee", "b-bbee"],
+        "iso": ["iso 9001", "iso 14001"],
+        "sans": ["sans 10400"],
+    },
+    "experience_patterns": [
+        r"(\d+)\s*years",
+        r"(\d+)\s*yr",
+        r"minimum\s*(\d+)\s*experience",
+        r"at least\s*(\d+)\s*years",
+    ],
+    "staff_keywords": ["employees", "staff"],
+    "turnover_keywords": ["turnover", "revenue"],
+    "bbbee_keywords": ["bbbee", "b-bbee"],
+    # Thresholds, read from single (lowercased) requirement sentences
+    "cidb_grade_pattern": r"cidb\b[^.\n]{0,60}?(?:grade\s*([1-9])|\b([1-9])\s*(?:ce|gb|me|ep)\b)",
+    "bbbee_level_pattern": r"(?:b-bbee|bbbee)\b[^.\n]{0,50}?level\s*([1-8])|level\s*([1-8])\s*(?:b-bbee|bbbee)",
+    "employees_pattern": r"(\d{1,5})\s*(?:or more\s*)?(?:full[- ]time\s*|permanent\s*)?(?:employees|staff)",
+}
+
+DEFAULT_RULE_SET = {
+    "criteria": {
+        "industry": {"weight": 20},
+        "experience": {"weight": 20, "unmet_points": 10},
+        "location": {"weight": 15},
+        "certification": {"weight": 15, "points_per_certification": 5},
+        "capacity": {
+            "weight": 15,
+            "unstated_points": 10,  # no staff or turnover requirement
+            "points_per_requirement": 5,
+            # Applied when a tender asks for staff/turnover without a number
+            "min_employees": 10,
+            "min_turnover": 1000000,
+        },
+        "bbbee": {"weight": 15, "unmet_points": 5},
+    }
+}
+
+RULE_SETS = {
+    "default": {},
+}
+
+RULE_SET_SELECTION = {}
+
+
+def _merge(base: Dict, override: Dict) -> Dict:
+    """Rule set over the default: criteria merged key by key, None switches a criterion off"""
+    merged = copy.deepcopy(base)
+    for name, params in override.get("criteria", {}).items():
+        if params is None:
+            merged["criteria"].pop(name, None)
+        else:
+            merged["criteria"][name] = {**merged["criteria"].get(name, {}), **params}
+    return merged
+
+
+def load_rule_sets() -> Dict[str, Dict]:
+    """Every rule set, fully merged over DEFAULT_RULE_SET (plus SCORING_RULES_FILE, if set)"""
+    rule_sets = dict(RULE_SETS)
+    rules_file = os.getenv("SCORING_RULES_FILE")
+    if rules_file:
+        with open(rules_file) as f:
+            extra = json.load(f)
+        rule_sets.update(extra.get("rule_sets", {}))
+        RULE_SET_SELECTION.update(extra.get("selection", {}))
+        print(f"📏 Loaded scoring rules from {rules_file}")
+    return {name: _merge(DEFAULT_RULE_SET, rule_set) for name, rule_set in rule_sets.items()}
+
+
+def rule_set_for(plan_tier: Optional[str], industry: Optional[str]) -> str:
+    """Name of the rule set a company uses: its sector's, else its plan tier's, else "default" """
+    industry = (industry or "").lower()
+    for key, name in RULE_SET_SELECTION.items():
+        if key.startswith("sector:") and key[len("sector:"):] in industry:
+            return name
+    return RULE_SET_SELECTION.get(f"tier:{plan_tier or 'free'}", "default")
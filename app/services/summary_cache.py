@@ -0,0 +1,190 @@
+# app/services/summary_cache.py
+import asyncio
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+
+from app.Mongodatabase.mongodb import mongodb
+from app.services.abstractive_summarizer import abstractive_summarizer
+from app.services.tender_analysis import SECTION_PATTERNS, SENTENCE_CATEGORIES, analyze_text, text_hash
+from app.services.tender_doc_services import summarize_text, highlight_key_points
+
+load_dotenv()
+
+# Bump when summarize_text / highlight_key_points change their output format
+SUMMARY_FORMAT_VERSION = "4"
+
+# Changes to the extraction patterns or keyword lists invalidate cached summaries automatically
+EXTRACTOR_VERSION = hashlib.sha256(repr((SECTION_PATTERNS, SENTENCE_CATEGORIES)).encode("utf-8")).hexdigest()[:12]
+
+SUMMARY_CACHE_COLLECTION = "summary_cache"
+
+
+class SummaryCache:
+    """
+    Read-through cache for summarize_text + highlight_key_points results
+    and the typed deadline/budget values.
+
+    Keys are SHA-256 of the input text plus the extractor and model versions,
+    so a pattern or model change never serves stale summaries.
+        Tier 1: in-process LRU with TTL
+        Tier 2: MongoDB summary_cache collection (upserted, TTL index on expires_at)
+    """
+
+    def __init__(self):
+        self.max_entries = int(os.getenv("SUMMARY_CACHE_SIZE", 256))
+        self.ttl = int(os.getenv("SUMMARY_CACHE_TTL", 7 * 24 * 60 * 60))  # seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    @property
+    def version(self) -> str:
+        model_version = abstractive_summarizer.version if abstractive_summarizer.enabled else "extractive"
+        return f"v{SUMMARY_FORMAT_VERSION}-{EXTRACTOR_VERSION}-{model_version}"
+
+    def key(self, text: str) -> str:
+        return f"{text_hash(text)}:{self.version}"
+
+    # ---------------------------
+    # Tier 1: in-process LRU
+    # ---------------------------
+
+    def get_local(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put_local(self, key: str, value: Dict, expires_at: float = None):
+        with self._lock:
+            self._entries[key] = (expires_at or time.time() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    # ---------------------------
+    # Tier 2: MongoDB
+    # ---------------------------
+
+    def _collection(self):
+        # connect() sets mongodb.db before its ping, so only a successful ping counts as connected.
+        # Otherwise every lookup would wait out the driver's server selection timeout.
+        if not mongodb.connected:
+            return None  # Mongo not connected: run on tier 1 only
+        return mongodb.get_collection(SUMMARY_CACHE_COLLECTION)
+
+    async def get_remote(self, key: str) -> Optional[Dict]:
+        collection = self._collection()
+        if collection is None:
+            return None
+        try:
+            # The TTL monitor only runs once a minute, so filter expired documents too
+            doc = await collection.find_one({"_id": key, "expires_at": {"$gt": datetime.utcnow()}})
+        except Exception as e:
+            print(f"⚠️ Summary cache lookup failed: {e}")
+            return None
+        if not doc:
+            return None
+        return {
+            "summary": doc["summary"],
+            "highlights": doc["highlights"],
+            "values": doc.get("values", {}),
+            "expires_at": doc["expires_at"]
+        }
+
+    async def put_remote(self, key: str, value: Dict):
+        collection = self._collection()
+        if collection is None:
+            return
+        now = datetime.utcnow()
+        try:
+            await collection.update_one(
+                {"_id": key},
+                {
+                    "$set": {
+                        "summary": value["summary"],
+                        "highlights": value["highlights"],
+                        "values": value["values"],
+                        "version": self.version,
+                        "updated_at": now,
+                        "expires_at": now + timedelta(seconds=self.ttl)
+                    },
+                    "$setOnInsert": {"created_at": now}
+                },
+                upsert=True
+            )
+        except Exception as e:
+            print(f"⚠️ Summary cache store failed: {e}")
+
+    # ---------------------------
+    # Read-through
+    # ---------------------------
+
+    @staticmethod
+    def _compute(text: str) -> Dict:
+        return {
+            "summary": summarize_text(text),
+            "highlights": highlight_key_points(text),
+            "values": analyze_text(text).values
+        }
+
+    async def get_or_compute(self, text: str) -> Dict:
+        """
+        Summary and highlights for text: tier 1, then tier 2, then computed
+        off the event loop. Concurrent requests for the same text share one
+        computation. The returned "cache" field is memory, mongo or miss.
+        """
+        key = self.key(text)
+
+        value = self.get_local(key)
+        if value is not None:
+            return {**value, "cache": "memory"}
+
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight.get_loop() is asyncio.get_running_loop():
+            value = await asyncio.shield(inflight)
+            return {**value, "cache": "memory"}
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            remote = await self.get_remote(key)
+            if remote is not None:
+                expires_at = remote.pop("expires_at")
+                self.put_local(key, remote, expires_at=(expires_at - datetime.utcnow()).total_seconds() + time.time())
+                future.set_result(remote)
+                return {**remote, "cache": "mongo"}
+
+            value = await asyncio.to_thread(self._compute, text)
+            self.put_local(key, value)
+            await self.put_remote(key, value)
+            future.set_result(value)
+            return {**value, "cache": "miss"}
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when no one else is waiting
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+
+# Global instance
+summary_cache = SummaryCache()
+
+
+async def summarize_cached(text: str) -> Dict:
+    """Async wrapper: {"summary", "highlights", "values", "cache"} for a tender text"""
+    return await summary_cache.get_or_compute(text)
@@ -0,0 +1,278 @@
+# app/services/summary_inference.py
+"""
+Local inference worker that owns the abstractive summarization model.
+
+One process loads the model and listens on a local socket
+(multiprocessing.connection, authenticated). uvicorn workers and job
+workers send summarization requests as clients. The server groups
+concurrent requests into dynamic batches: it waits at most
+INFERENCE_MAX_WAIT_MS after the first request, or until
+INFERENCE_MAX_BATCH_SIZE requests are waiting, then summarizes them in
+one summarize_many() call.
+
+Messages are pickles, so the socket's authkey is what stops other local
+processes from running code in the worker. INFERENCE_WORKER_AUTHKEY must
+be set to a secret of at least MIN_AUTHKEY_BYTES; without one the worker
+does not start and summaries fall back to the extractive overview.
+
+Run standalone with:  python -m app.services.summary_inference
+"""
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from multiprocessing.connection import Client, Listener
+from typing import Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from app.services.abstractive_summarizer import abstractive_summarizer, env_flag
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+MIN_AUTHKEY_BYTES = 16
+
+
+class InferenceAuthError(Exception):
+    """Raised when INFERENCE_WORKER_AUTHKEY is missing or too short to be a secret"""
+
+
+def _address() -> Tuple[str, int]:
+    host, _, port = os.getenv("INFERENCE_WORKER_ADDRESS", "127.0.0.1:6011").rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def _authkey() -> bytes:
+    authkey = os.getenv("INFERENCE_WORKER_AUTHKEY", "").encode("utf-8")
+    if len(authkey) < MIN_AUTHKEY_BYTES:
+        raise InferenceAuthError(
+            f"INFERENCE_WORKER_AUTHKEY must be a secret of at least {MIN_AUTHKEY_BYTES} bytes"
+        )
+    return authkey
+
+
+class InferenceServer:
+    """Accepts client connections and runs their requests in dynamic batches"""
+
+    def __init__(self, summarizer=abstractive_summarizer):
+        self.summarizer = summarizer
+        self.address = _address()
+        self.max_batch_size = int(os.getenv("INFERENCE_MAX_BATCH_SIZE", 8))
+        self.max_wait = float(os.getenv("INFERENCE_MAX_WAIT_MS", 50)) / 1000
+        self._requests: "queue.Queue" = queue.Queue()
+
+    def serve_forever(self):
+        listener = Listener(self.address, authkey=_authkey())
+        threading.Thread(target=self._batch_loop, name="inference-batcher", daemon=True).start()
+        print(f"🧠 Inference worker listening on {self.address[0]}:{self.address[1]}")
+
+        while True:
+            try:
+                conn = listener.accept()
+            except Exception as e:  # Failed handshake (wrong authkey) or a client that went away
+                logger.warning(f"Inference worker rejected a connection: {e}")
+                continue
+            threading.Thread(target=self._read_loop, args=(conn,), daemon=True).start()
+
+    def _read_loop(self, conn):
+        send_lock = threading.Lock()
+        try:
+            while True:
+                message = conn.recv()
+                if message.get("type") == "ping":
+                    with send_lock:
+                        conn.send({"id": message["id"], "result": "pong"})
+                    continue
+                self._requests.put((conn, send_lock, message))
+        except (EOFError, OSError):
+            pass
+
+    def _next_batch(self) -> List:
+        """Block for one request, then gather more until the batch is full or max_wait passes"""
+        batch = [self._requests.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._requests.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run_batch(self, batch: List) -> List[Dict]:
+        # Requests with different length caps cannot share a generate() call
+        groups: Dict[Optional[int], List[int]] = {}
+        for position, (_, _, message) in enumerate(batch):
+            groups.setdefault(message.get("max_words"), []).append(position)
+
+        replies: List[Dict] = [{} for _ in batch]
+        for max_words, positions in groups.items():
+            texts = [batch[p][2]["text"] for p in positions]
+            try:
+                summaries = self.summarizer.summarize_many(texts, max_words)
+                for p, summary in zip(positions, summaries):
+                    replies[p] = {"id": batch[p][2]["id"], "result": summary}
+            except Exception as e:
+                logger.error(f"Inference batch failed: {e}")
+                for p in positions:
+                    replies[p] = {"id": batch[p][2]["id"], "error": str(e)}
+        return replies
+
+    def _batch_loop(self):
+        while True:
+            batch = self._next_batch()
+            started = time.perf_counter()
+            replies = self._run_batch(batch)
+            print(f"🧠 Summarized batch of {len(batch)} in {time.perf_counter() - started:.2f}s")
+
+            for (conn, send_lock, _), reply in zip(batch, replies):
+                try:
+                    with send_lock:
+                        conn.send(reply)
+                except OSError:
+                    pass  # Client disconnected while waiting
+
+
+class InferenceClient:
+    """Thread-safe client: one connection per process, replies matched to futures by id"""
+
+    def __init__(self):
+        self.address = _address()
+        self.timeout = float(os.getenv("INFERENCE_TIMEOUT", 300))  # seconds
+        self._conn = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._pending: Dict[int, Future] = {}
+        self._ids = itertools.count()
+
+    def _connection(self):
+        with self._lock:
+            if self._conn is None or self._pid != os.getpid():
+                self._conn = Client(self.address, authkey=_authkey())
+                self._pid = os.getpid()
+                self._pending = {}
+                threading.Thread(target=self._receive_loop, args=(self._conn,), daemon=True).start()
+            return self._conn
+
+    def _receive_loop(self, conn):
+        try:
+            while True:
+                reply = conn.recv()
+                future = self._pending.pop(reply["id"], None)
+                if future is None:
+                    continue
+                if "error" in reply:
+                    future.set_exception(RuntimeError(reply["error"]))
+                else:
+                    future.set_result(reply["result"])
+        except (EOFError, OSError):
+            with self._lock:
+                if self._conn is conn:
+                    self._conn = None
+                pending, self._pending = self._pending, {}
+            for future in pending.values():
+                future.set_exception(ConnectionError("Inference worker connection lost"))
+
+    def _submit(self, message: Dict) -> Future:
+        conn = self._connection()
+        future: Future = Future()
+        with self._lock:
+            message["id"] = next(self._ids)
+            self._pending[message["id"]] = future
+            try:
+                conn.send(message)
+            except OSError:
+                self._pending.pop(message["id"], None)
+                self._conn = None
+                raise
+        return future
+
+    def submit(self, text: str, max_words: int = None) -> Future:
+        return self._submit({"type": "summarize", "text": text, "max_words": max_words})
+
+    def summarize(self, text: str, max_words: int = None, timeout: float = None) -> str:
+        return self.submit(text, max_words).result(timeout or self.timeout)
+
+    async def summarize_async(self, text: str, max_words: int = None, timeout: float = None) -> str:
+        future = await asyncio.to_thread(self.submit, text, max_words)  # connecting may block
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout or self.timeout)
+
+    def ping(self, timeout: float = 5) -> bool:
+        try:
+            return self._submit({"type": "ping"}).result(timeout) == "pong"
+        except Exception:
+            return False
+
+
+def serve():
+    InferenceServer().serve_forever()
+
+
+class InferenceWorkerProcess:
+    """Starts the inference worker alongside the app (INFERENCE_WORKER_AUTOSTART)"""
+
+    def __init__(self):
+        self.autostart = env_flag("INFERENCE_WORKER_AUTOSTART", "true")
+        self._process = None
+
+    def start(self):
+        if not (self.autostart and abstractive_summarizer.is_available()):
+            return
+        try:
+            _authkey()
+        except InferenceAuthError as e:
+            print(f"⚠️ Inference worker not started: {e}")
+            return
+        if inference_client.ping(timeout=1):
+            print("🧠 Inference worker already running")  # Started by another app worker
+            return
+        self._process = multiprocessing.get_context("spawn").Process(
+            target=serve, name="inference-worker", daemon=True
+        )
+        self._process.start()
+
+    def stop(self):
+        if self._process is not None and self._process.is_alive():
+            self._process.terminate()
+            self._process.join(5)
+        self._process = None
+
+
+# Global instances
+inference_client = InferenceClient()
+inference_worker = InferenceWorkerProcess()
+
+
+def overview_enabled() -> bool:
+    """Whether generate_overview() can produce anything, so callers can skip preparing its input"""
+    if not abstractive_summarizer.enabled:
+        return False
+    if os.getenv("SUMMARY_INFERENCE", "worker") == "local":
+        return abstractive_summarizer.is_available()
+    return True
+
+
+def generate_overview(text: str) -> str:
+    """Abstractive overview of a tender text, or "" when disabled or unavailable"""
+    if not overview_enabled():
+        return ""
+    try:
+        if os.getenv("SUMMARY_INFERENCE", "worker") == "local":
+            return abstractive_summarizer.summarize(text)
+        return inference_client.summarize(text)
+    except Exception as e:
+        logger.error(f"Abstractive summarization error: {e}")
+        return ""
+
+
+if __name__ == "__main__":
+    serve()
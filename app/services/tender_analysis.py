@@ -0,0 +1,306 @@
+# app/services/tender_analysis.py
+import hashlib
+import os
+import re
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Any, Dict, List, Set
+
+from dotenv import load_dotenv
+
+from app.services.extractive_ranker import extractive_ranker
+from app.services.value_normalizer import normalize_requirements
+
+load_dotenv()
+
+# Requirement extraction patterns, in priority order per field
+OBJECTIVE_PATTERNS = [
+    r'objective[:\s]*([^.\n]+)',
+    r'purpose[:\s]*([^.\n]+)',
+    r'aim[:\s]*([^.\n]+)',
+    r'introduction[:\s]*([^.\n]{50,200})'
+]
+
+SCOPE_PATTERNS = [
+    r'scope[:\s]*([^.\n]{50,300})',
+    r'works[:\s]*([^.\n]{50,300})',
+    r'services[:\s]*([^.\n]{50,300})',
+    r'description[:\s]*([^.\n]{50,300})'
+]
+
+DEADLINE_PATTERNS = [
+    r'deadline[:\s]*([^.\n]{10,50})',
+    r'submission[^.\n]{0,50}?(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})',
+    r'closing[^.\n]{0,50}?(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})',
+    r'(\d{1,2} (january|february|march|april|may|june|july|august|september|october|november|december) \d{4})'
+]
+
+BUDGET_PATTERNS = [
+    r'budget[:\s]*([^.\n]{10,50})',
+    r'amount[:\s]*([^.\n]{10,50})',
+    r'value[:\s]*([^.\n]{10,50})',
+    r'(\$|r|usd)\s*(\d[\d,\.]*)'
+]
+
+LOCATION_PATTERNS = [
+    r'location[:\s]*([^.\n]{10,50})',
+    r'province[:\s]*([^.\n]{10,50})',
+    r'city[:\s]*([^.\n]{10,50})',
+    r'address[:\s]*([^.\n]{10,50})'
+]
+
+ELIGIBILITY_KEYWORDS = ['eligible', 'qualification', 'requirement', 'must have', 'should have']
+REQUIREMENT_KEYWORDS = ['must', 'shall', 'required', 'requirement', 'specification']
+SUMMARY_KEYWORDS = ['tender', 'bid', 'submit', 'deadline', 'requirement', 'eligible', 'scope']
+EXPERIENCE_KEYWORDS = ['years', 'yr', 'experience']
+CERTIFICATION_KEYWORDS = ['cidb', 'bbbee', 'b-bbee', 'iso 9001', 'iso 14001', 'sans 10400']
+CAPACITY_KEYWORDS = ['employees', 'staff', 'turnover', 'revenue']
+BBBEE_KEYWORDS = ['bbbee', 'b-bbee']
+
+# Sentence category -> keywords (plain substrings of the lowercased sentence)
+SENTENCE_CATEGORIES = {
+    'eligibility': ELIGIBILITY_KEYWORDS,
+    'requirement': REQUIREMENT_KEYWORDS,
+    'summary': SUMMARY_KEYWORDS,
+    'experience': EXPERIENCE_KEYWORDS,
+    'certification': CERTIFICATION_KEYWORDS,
+    'capacity': CAPACITY_KEYWORDS,
+    'bbbee': BBBEE_KEYWORDS,
+}
+
+# Field -> patterns, in the order the fields are extracted
+SECTION_PATTERNS = {
+    'objective': OBJECTIVE_PATTERNS,
+    'scope': SCOPE_PATTERNS,
+    'deadline': DEADLINE_PATTERNS,
+    'budget': BUDGET_PATTERNS,
+    'location': LOCATION_PATTERNS,
+}
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+PATTERN_FLAGS = re.IGNORECASE | re.DOTALL
+
+
+def _match_value(match: re.Match) -> str:
+    """Format a match the way re.findall() reports it: the lone group, or non-empty groups joined"""
+    groups = match.groups()
+    if not groups:
+        return match.group(0).strip()
+    if len(groups) == 1:
+        return (groups[0] or "").strip()
+    return ' '.join([g for g in groups if g]).strip()
+
+
+class PatternBank:
+    """
+    Field patterns compiled once at import. scan() fills every field with
+    the first match of its highest-priority matching pattern. Lower-priority
+    patterns are never run once a better one has matched, and only the first
+    match is produced (search, not findall).
+
+    A single merged alternation with one named lookahead group per pattern
+    was measured at 5-6x slower here. CPython's re has no multi-literal
+    prefilter, so it tries every alternative at every offset. Separate
+    compiled patterns each get the engine's literal-prefix fast scan.
+    """
+
+    def __init__(self, field_patterns: Dict[str, List[str]]):
+        self.fields = list(field_patterns)
+        self.patterns = {
+            field: [re.compile(pattern, PATTERN_FLAGS) for pattern in patterns]
+            for field, patterns in field_patterns.items()
+        }
+
+    def search(self, text: str, field: str) -> str:
+        for pattern in self.patterns[field]:
+            match = pattern.search(text)
+            if match:
+                return _match_value(match)
+        return ""
+
+    def scan(self, text: str) -> Dict[str, str]:
+        """Returns field -> best match ("" when nothing matched)"""
+        return {field: self.search(text, field) for field in self.fields}
+
+
+# Compiled once at import
+SECTION_BANK = PatternBank(SECTION_PATTERNS)
+
+
+def extract_pattern(text: str, patterns: List[str]) -> str:
+    """Extract text using regex patterns (first pattern with a match wins)"""
+    for pattern in patterns:
+        match = re.search(pattern, text, PATTERN_FLAGS)  # re caches compiled patterns
+        if match:
+            return _match_value(match)
+    return ""
+
+
+class KeywordMatcher:
+    """
+    One compiled alternation per category. Each scan over the lowercased text
+    turns hits into sentence indices via bisect, instead of testing every
+    keyword against every sentence.
+    """
+
+    def __init__(self, categories: Dict[str, List[str]]):
+        self.categories = list(categories)
+        self.patterns = {
+            # Longest first so the alternation never stops on a shorter prefix
+            category: re.compile('|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)))
+            for category, keywords in categories.items()
+        }
+
+    def tag(self, text_lower: str, sentence_starts: List[int]) -> Dict[str, List[int]]:
+        """Category -> sorted indices of sentences containing any of its keywords"""
+        hits = {}
+        for category, pattern in self.patterns.items():
+            indices = []
+            last = -1
+            for match in pattern.finditer(text_lower):
+                index = bisect_right(sentence_starts, match.start()) - 1
+                if index != last:
+                    indices.append(index)
+                    last = index
+            hits[category] = indices
+        return hits
+
+
+SENTENCE_MATCHER = KeywordMatcher(SENTENCE_CATEGORIES)
+
+
+class SentenceIndex:
+    """
+    Sentences of a text (split on '.'), with their offsets, lowercased forms
+    and keyword categories, computed once.
+    """
+
+    def __init__(self, text: str, text_lower: str):
+        raw_sentences = text.split('.')
+        self.sentences = [s.strip() for s in raw_sentences]
+        self.sentences_lower = [s.lower() for s in self.sentences]
+
+        # (start, end) of each raw sentence in text
+        self.offsets = []
+        position = 0
+        for raw in raw_sentences:
+            self.offsets.append((position, position + len(raw)))
+            position += len(raw) + 1
+
+        # Lowercasing can change lengths for some characters, so hits in
+        # text_lower are mapped through offsets taken from text_lower itself
+        lower_starts = []
+        position = 0
+        for raw in text_lower.split('.'):
+            lower_starts.append(position)
+            position += len(raw) + 1
+
+        self.by_category = SENTENCE_MATCHER.tag(text_lower, lower_starts)
+        self.categories = [set() for _ in self.sentences]
+        for category, indices in self.by_category.items():
+            for index in indices:
+                self.categories[index].add(category)
+
+    def __len__(self) -> int:
+        return len(self.sentences)
+
+    def sentences_in(self, category: str) -> List[str]:
+        """Sentences tagged with a category, in document order"""
+        return [self.sentences[i] for i in self.by_category[category]]
+
+    def categories_in(self, category: str, limit: int) -> Set[str]:
+        """Every category hit by the first `limit` sentences of a category"""
+        hit = set()
+        for index in self.by_category[category][:limit]:
+            hit |= self.categories[index]
+        return hit
+
+
+class TenderAnalysis:
+    """
+    Everything the summarizer, highlighter and readiness scorer read from a
+    tender text, parsed in one pass: sentences, section fields and the
+    requirement dict returned by extract_tender_requirements().
+
+    Instances are shared through analyze_text() and must be treated as read-only.
+    """
+
+    def __init__(self, text: str, content_hash: str = None):
+        self.text = text
+        self.text_lower = text.lower()
+        self.content_hash = content_hash or text_hash(text)
+
+        # Sentence split and keyword tagging shared by every lookup
+        self.index = SentenceIndex(text, self.text_lower)
+        self.sentences = self.index.sentences
+
+        self.sections = SECTION_BANK.scan(text)
+        # Typed deadline/budget (datetime, relative day count, rands) parsed once
+        self.values = normalize_requirements(self.sections, text)
+        self.eligibility_criteria = self.index.sentences_in('eligibility')
+        self.key_requirements = self.index.sentences_in('requirement')
+        self._extracts: Dict[int, List[str]] = {}
+
+    def key_sentences(self, token_budget: int) -> List[str]:
+        """TextRank-selected sentences within token_budget, in document order (memoized per budget)"""
+        if token_budget not in self._extracts:
+            selected = extractive_ranker.select(self.sentences, token_budget)
+            self._extracts[token_budget] = [' '.join(sentence.split()) for sentence in selected]
+        return self._extracts[token_budget]
+
+    @property
+    def requirements(self) -> Dict[str, Any]:
+        return {
+            'objective': self.sections['objective'],
+            'scope': self.sections['scope'],
+            'deadline': self.sections['deadline'],
+            'eligibility_criteria': self.eligibility_criteria[:10],  # Top 10
+            'budget': self.sections['budget'],
+            'location': self.sections['location'],
+            'key_requirements': self.key_requirements[:15],  # Top 15
+            **self.values
+        }
+
+
+class TenderAnalysisCache:
+    """Bounded LRU of TenderAnalysis objects keyed by content hash"""
+
+    def __init__(self):
+        self.max_entries = int(os.getenv("TENDER_ANALYSIS_CACHE_SIZE", 128))
+        self._entries: "OrderedDict[str, TenderAnalysis]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, text: str) -> TenderAnalysis:
+        key = text_hash(text)
+        with self._lock:
+            analysis = self._entries.get(key)
+            if analysis is not None:
+                self._entries.move_to_end(key)
+                return analysis
+
+        # Parse outside the lock; a concurrent duplicate parse is harmless
+        analysis = TenderAnalysis(text, content_hash=key)
+        with self._lock:
+            self._entries[key] = analysis
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return analysis
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Global instance
+tender_analysis_cache = TenderAnalysisCache()
+
+
+def analyze_text(text: str) -> TenderAnalysis:
+    """Shared, memoized analysis of a tender text"""
+    return tender_analysis_cache.get(text)
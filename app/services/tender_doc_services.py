@@ -1,53 +1,238 @@
 import re
+import os
+import asyncio
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from datetime import datetime
 import requests
+from app.services.summary_inference import generate_overview, overview_enabled
+from app.services.archive_reader import archive_reader, ArchiveTooLargeError
+from app.services.extraction_executor import extraction_executor
+from app.services.docx_extraction import extract_docx_pages, is_docx
+from app.services.pdf_extraction import extract_pdf_pages, extract_pdf_document
+from app.services.tender_analysis import (
+    OBJECTIVE_PATTERNS,
+    SCOPE_PATTERNS,
+    DEADLINE_PATTERNS,
+    ELIGIBILITY_KEYWORDS,
+    PatternBank,
+    analyze_text,
+    extract_pattern,
+)
+from app.services.readiness_engine import (
+    extract_tender_features,
+    generate_recommendation,
+    score_batch,
+)
 
 logger = logging.getLogger(__name__)
 
-def extract_text_from_pdf(file_path: str) -> str:
-    """Extract text from PDF file"""
+# Token budgets for the TextRank extract: fallback summary and abstractive model input
+EXTRACTIVE_SUMMARY_TOKENS = int(os.getenv("EXTRACTIVE_SUMMARY_TOKENS", 160))
+SUMMARY_INPUT_TOKENS = int(os.getenv("SUMMARY_INPUT_TOKENS", 2048))
+
+# Pages to read before giving up on finding every key section
+KEY_SECTION_PAGE_BUDGET = int(os.getenv("KEY_SECTION_PAGE_BUDGET", 15))
+
+
+class RequirementScanner:
+    """
+    Incremental front end of the requirement extractor. Pages are fed one at a
+    time and the scanner reports when objective, scope, deadline and eligibility
+    have all been seen, so extraction of the remaining pages can be skipped.
+    """
+
+    KEY_SECTIONS = PatternBank({
+        'objective': OBJECTIVE_PATTERNS,
+        'scope': SCOPE_PATTERNS,
+        'deadline': DEADLINE_PATTERNS,
+    })
+
+    def __init__(self):
+        self.found = set()
+        self.pages_scanned = 0
+
+    @property
+    def complete(self) -> bool:
+        return len(self.found) == len(self.KEY_SECTIONS.fields) + 1  # + eligibility
+
+    def feed(self, page_text: str) -> bool:
+        """Scan one page. Returns True once every key section has been found."""
+        self.pages_scanned += 1
+        for section in self.KEY_SECTIONS.fields:
+            if section not in self.found and self.KEY_SECTIONS.search(page_text, section):
+                self.found.add(section)
+        if 'eligibility' not in self.found:
+            page_lower = page_text.lower()
+            if any(word in page_lower for word in ELIGIBILITY_KEYWORDS):
+                self.found.add('eligibility')
+        return self.complete
+
+
+def _scan_key_sections(extract_fn, *args, page_budget: int = KEY_SECTION_PAGE_BUDGET, on_page=None, **kwargs) -> Dict:
+    scanner = RequirementScanner()
+    
+    def feed(page_text: str) -> bool:
+        if on_page:
+            on_page(page_text)
+        return scanner.feed(page_text)
+    
+    result = extract_fn(*args, max_pages=page_budget, on_page=feed, **kwargs)
+    result["sections_found"] = sorted(scanner.found)
+    result["stopped_early"] = scanner.complete and scanner.pages_scanned < result.get("page_count", 0)
+    return result
+
+
+def extract_key_pages(source, page_budget: int = KEY_SECTION_PAGE_BUDGET, on_page=None) -> Dict:
+    """
+    Extract pages from a PDF or DOCX (path or bytes) until every key section is
+    found or the page budget runs out. Runs inside the extraction process pool
+    (or a thread, when on_page(page_text) has to see pages as they are read).
+    """
+    return _scan_key_sections(extract_document_pages, source, page_budget=page_budget, on_page=on_page)
+
+
+def extract_key_document(pdf_bytes: bytes, page_budget: int = KEY_SECTION_PAGE_BUDGET) -> Dict:
+    """extract_pdf_document() with early termination once key sections are found"""
+    return _scan_key_sections(extract_pdf_document, pdf_bytes, page_budget=page_budget)
+
+
+def detect_document_kind(source) -> str:
+    """Identify a document from its content: pdf, docx, zip or unknown"""
+    if isinstance(source, (bytes, bytearray)):
+        head = bytes(source[:1024])
+    else:
+        with open(source, 'rb') as f:
+            head = f.read(1024)
+    
+    # ZIP magic first: a stored PDF member puts %PDF inside the first KB of a pack
+    if head.startswith(b'PK\x03\x04') or head.startswith(b'PK\x05\x06'):
+        return "docx" if is_docx(source) else "zip"
+    if b'%PDF' in head:  # The PDF header may follow a little junk
+        return "pdf"
+    return "unknown"
+
+def extract_document_pages(source, max_pages: int = None, clean: bool = False, on_page=None) -> Dict:
+    """
+    Extract page texts from a PDF or DOCX path or bytes. Both formats return the
+    same result shape, so the rest of the pipeline does not care which it got.
+    """
+    kind = detect_document_kind(source)
+    if kind == "docx":
+        return extract_docx_pages(source, max_pages=max_pages, clean=clean, on_page=on_page)
+    if kind == "pdf":
+        return extract_pdf_pages(source, max_pages=max_pages, clean=clean, on_page=on_page)
+    raise ValueError(f"Unsupported document type: {kind}")
+
+def extract_text_from_pdf(file_path: str, key_sections_only: bool = False) -> str:
+    """
+    Extract text from PDF file (blocks until the extraction pool returns).
+    With key_sections_only, stop reading pages once the key sections are found.
+    """
     try:
-        import PyPDF2
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-        return text
+        extract_fn = extract_key_pages if key_sections_only else extract_pdf_pages
+        extraction = extraction_executor.run_sync(extract_fn, file_path)
+        return "".join(page + "\n" for page in extraction["pages"])
     except Exception as e:
         logger.error(f"PDF extraction error: {e}")
         return ""
 
-def extract_text_from_zip(file_path: str, extract_dir: str) -> str:
-    """Extract text from ZIP file containing documents"""
+async def extract_text_from_pdf_async(file_path: str, key_sections_only: bool = False) -> str:
+    """Extract text from PDF file without blocking the event loop"""
+    try:
+        extract_fn = extract_key_pages if key_sections_only else extract_pdf_pages
+        extraction = await extraction_executor.run(extract_fn, file_path)
+        return "".join(page + "\n" for page in extraction["pages"])
+    except Exception as e:
+        logger.error(f"PDF extraction error: {e}")
+        return ""
+
+def extract_text_from_docx(file_path: str) -> str:
+    """Extract text from DOCX file (blocks until the extraction pool returns)"""
+    try:
+        extraction = extraction_executor.run_sync(extract_docx_pages, file_path)
+        return "".join(page + "\n" for page in extraction["pages"])
+    except Exception as e:
+        logger.error(f"DOCX extraction error: {e}")
+        return ""
+
+async def extract_text_from_docx_async(file_path: str) -> str:
+    """Extract text from DOCX file without blocking the event loop"""
+    try:
+        extraction = await extraction_executor.run(extract_docx_pages, file_path)
+        return "".join(page + "\n" for page in extraction["pages"])
+    except Exception as e:
+        logger.error(f"DOCX extraction error: {e}")
+        return ""
+
+def iter_documents_from_zip(source):
+    """
+    Extract each document in a ZIP (path or file object) as {"name", "text"}.
+    Members are streamed out of the archive in memory, nested ZIPs included,
+    and extracted concurrently in the process pool. Documents are yielded in
+    archive order as soon as they are extracted. Raises ArchiveTooLargeError
+    when the decompressed size limit is hit.
+    """
+    member_names = []
+    
+    def _member_data():
+        for member_name, data in archive_reader.iter_documents(source):
+            member_names.append(member_name)
+            yield data
+    
+    results = extraction_executor.iter_many_sync(extract_document_pages, _member_data())
+    for position, extraction in enumerate(results):
+        member_name = member_names[position]
+        if isinstance(extraction, Exception):
+            logger.error(f"Could not extract {member_name} from archive: {extraction}")
+            continue
+        yield {
+            "name": member_name,
+            "text": "".join(page + "\n" for page in extraction["pages"])
+        }
+
+def extract_documents_from_zip(source) -> List[Dict[str, str]]:
+    """iter_documents_from_zip() collected into a list"""
+    return list(iter_documents_from_zip(source))
+
+def extract_text_from_zip(file_path, extract_dir: str = None) -> str:
+    """
+    Extract text from ZIP file containing documents. Nothing is written to
+    extract_dir any more; it is kept only for backwards compatibility.
+    """
     try:
-        import zipfile
-        import os
-        all_text = ""
-        with zipfile.ZipFile(file_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_dir)
-            for file_name in zip_ref.namelist():
-                if file_name.lower().endswith('.pdf'):
-                    pdf_path = os.path.join(extract_dir, file_name)
-                    all_text += extract_text_from_pdf(pdf_path) + "\n\n"
-        return all_text
+        documents = extract_documents_from_zip(file_path)
+        return "".join(document["text"] + "\n\n" for document in documents)
+    except ArchiveTooLargeError:
+        raise
     except Exception as e:
         logger.error(f"ZIP extraction error: {e}")
         return ""
 
+async def extract_documents_from_zip_async(source) -> List[Dict[str, str]]:
+    """Extract documents from a ZIP without blocking the event loop"""
+    return await asyncio.to_thread(extract_documents_from_zip, source)
+
 def summarize_text(text: str) -> str:
     """
     Enhanced AI summarization focusing on key tender elements
     """
     try:
-        # Extract key information first
-        extracted_info = extract_tender_requirements(text)
+        # Extract key information first (shared with highlights and scoring)
+        analysis = analyze_text(text)
+        extracted_info = analysis.requirements
         
         # Build comprehensive summary
         summary_parts = []
         
+        # Abstractive overview (only when the transformer summarizer is enabled),
+        # fed the top-ranked sentences rather than the whole document
+        overview = ""
+        if overview_enabled():
+            overview = generate_overview('. '.join(analysis.key_sentences(SUMMARY_INPUT_TOKENS)))
+        if overview:
+            summary_parts.append(f"📝 **Overview**: {overview}")
+        
         # Objective
         if extracted_info['objective']:
             summary_parts.append(f"📋 **Objective**: {extracted_info['objective']}")
@@ -82,12 +267,11 @@ def summarize_text(text: str) -> str:
         
         # If no specific info found, create a general summary
         if not summary_parts:
-            # Simple rule-based summary as fallback
-            sentences = text.split('.')
-            key_sentences = [s.strip() for s in sentences if any(word in s.lower() for word in 
-                            ['tender', 'bid', 'submit', 'deadline', 'requirement', 'eligible', 'scope'])]
-            summary = '. '.join(key_sentences[:5]) + '.'
-            return summary if summary else "Summary not available from document content."
+            # Extractive (TextRank) summary as fallback
+            key_sentences = analysis.key_sentences(EXTRACTIVE_SUMMARY_TOKENS)
+            if not key_sentences:
+                return "Summary not available from document content."
+            return '. '.join(key_sentences) + '.'
         
         return '\n\n'.join(summary_parts)
         
@@ -99,93 +283,19 @@ def extract_tender_requirements(text: str) -> Dict[str, Any]:
     """
     Extract specific tender requirements using pattern matching and rules
     """
-    text_lower = text.lower()
-    requirements = {
-        'objective': '',
-        'scope': '',
-        'deadline': '',
-        'eligibility_criteria': [],
-        'budget': '',
-        'location': '',
-        'key_requirements': []
-    }
-    
     try:
-        # Extract Objective (look for purpose, objective, aim)
-        objective_patterns = [
-            r'objective[:\s]*([^.\n]+)',
-            r'purpose[:\s]*([^.\n]+)',
-            r'aim[:\s]*([^.\n]+)',
-            r'introduction[:\s]*([^.\n]{50,200})'
-        ]
-        requirements['objective'] = extract_pattern(text, objective_patterns)
-        
-        # Extract Scope (look for scope, works, services)
-        scope_patterns = [
-            r'scope[:\s]*([^.\n]{50,300})',
-            r'works[:\s]*([^.\n]{50,300})',
-            r'services[:\s]*([^.\n]{50,300})',
-            r'description[:\s]*([^.\n]{50,300})'
-        ]
-        requirements['scope'] = extract_pattern(text, scope_patterns)
-        
-        # Extract Deadline (look for date patterns)
-        deadline_patterns = [
-            r'deadline[:\s]*([^.\n]{10,50})',
-            r'submission[^.\n]{0,50}?(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})',
-            r'closing[^.\n]{0,50}?(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})',
-            r'(\d{1,2} (january|february|march|april|may|june|july|august|september|october|november|december) \d{4})'
-        ]
-        requirements['deadline'] = extract_pattern(text, deadline_patterns)
-        
-        # Extract Eligibility Criteria
-        eligibility_keywords = ['eligible', 'qualification', 'requirement', 'must have', 'should have']
-        sentences = text.split('.')
-        eligibility_sentences = [s.strip() for s in sentences if any(word in s.lower() for word in eligibility_keywords)]
-        requirements['eligibility_criteria'] = eligibility_sentences[:10]  # Top 10
-        
-        # Extract Budget
-        budget_patterns = [
-            r'budget[:\s]*([^.\n]{10,50})',
-            r'amount[:\s]*([^.\n]{10,50})',
-            r'value[:\s]*([^.\n]{10,50})',
-            r'(\$|r|usd)\s*(\d[\d,\.]*)'
-        ]
-        requirements['budget'] = extract_pattern(text, budget_patterns)
-        
-        # Extract Location
-        location_patterns = [
-            r'location[:\s]*([^.\n]{10,50})',
-            r'province[:\s]*([^.\n]{10,50})',
-            r'city[:\s]*([^.\n]{10,50})',
-            r'address[:\s]*([^.\n]{10,50})'
-        ]
-        requirements['location'] = extract_pattern(text, location_patterns)
-        
-        # Extract Key Requirements
-        requirement_keywords = ['must', 'shall', 'required', 'requirement', 'specification']
-        requirement_sentences = [s.strip() for s in sentences if any(word in s.lower() for word in requirement_keywords)]
-        requirements['key_requirements'] = requirement_sentences[:15]  # Top 15
-        
-        # Clean up extracted data
-        requirements = {k: v.strip() if isinstance(v, str) else v for k, v in requirements.items()}
-        
+        return analyze_text(text).requirements
     except Exception as e:
         logger.error(f"Requirement extraction error: {e}")
-    
-    return requirements
-
-def extract_pattern(text: str, patterns: List[str]) -> str:
-    """Extract text using regex patterns"""
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE | re.DOTALL)
-        if matches:
-            # Handle different match formats
-            match = matches[0]
-            if isinstance(match, tuple):
-                match = ' '.join([m for m in match if m])
-            return match.strip()
-    return ""
+        return {
+            'objective': '',
+            'scope': '',
+            'deadline': '',
+            'eligibility_criteria': [],
+            'budget': '',
+            'location': '',
+            'key_requirements': []
+        }
 
 def highlight_key_points(text: str) -> List[str]:
     """
@@ -194,7 +304,7 @@ def highlight_key_points(text: str) -> List[str]:
     key_points = []
     
     try:
-        requirements = extract_tender_requirements(text)
+        requirements = analyze_text(text).requirements
         
         # Add objective if found
         if requirements['objective']:
@@ -240,72 +350,22 @@ def highlight_key_points(text: str) -> List[str]:
     
     return key_points
 
-def readiness_scoring(tender_summary: str, company_profile: Dict) -> Dict:
+def readiness_scoring(tender_summary: str, company_profile: Dict, requirements: Optional[Dict] = None) -> Dict:
     """
-    Enhanced readiness scoring with detailed criteria matching
+    Enhanced readiness scoring with detailed criteria matching.
+
+    The tender side is its requirement record (extract_tender_features);
+    pass a stored record as `requirements` and the summary is not read at all.
+    The record that was scored is returned as tender_requirements.
+    Criteria and weights come from the company's compiled rule set
+    (readiness_engine criterion plugins, configured in scoring_rules).
     """
     try:
-        # Extract requirements from tender summary
-        tender_reqs = extract_tender_requirements(tender_summary)
-        
-        # Initialize scoring
-        total_points = 0
-        earned_points = 0
-        checklist = []
-        
-        # 1. Industry/Sector Match (20 points)
-        total_points += 20
-        industry_match = check_industry_match(tender_summary, company_profile)
-        if industry_match['match']:
-            earned_points += 20
-            checklist.append("✅ Industry/Sector: MATCHED")
-        else:
-            checklist.append("❌ Industry/Sector: NOT MATCHED")
-        
-        # 2. Experience Match (20 points)
-        total_points += 20
-        exp_match = check_experience_match(tender_reqs, company_profile)
-        earned_points += exp_match['score']
-        checklist.append(exp_match['checklist'])
+        record = requirements if requirements is not None else extract_tender_features(tender_summary)
         
-        # 3. Location Match (15 points)
-        total_points += 15
-        location_match = check_location_match(tender_reqs, company_profile)
-        earned_points += location_match['score']
-        checklist.append(location_match['checklist'])
-        
-        # 4. Certification Match (15 points)
-        total_points += 15
-        cert_match = check_certification_match(tender_reqs, company_profile)
-        earned_points += cert_match['score']
-        checklist.extend(cert_match['checklist'])
-        
-        # 5. Capacity Match (15 points)
-        total_points += 15
-        capacity_match = check_capacity_match(tender_reqs, company_profile)
-        earned_points += capacity_match['score']
-        checklist.extend(capacity_match['checklist'])
-        
-        # 6. BBBEE Match (15 points)
-        total_points += 15
-        bbbee_match = check_bbbee_match(tender_reqs, company_profile)
-        earned_points += bbbee_match['score']
-        checklist.append(bbbee_match['checklist'])
-        
-        # Calculate final score
-        suitability_score = min(100, int((earned_points / total_points) * 100)) if total_points > 0 else 0
-        
-        # Generate recommendation
-        recommendation = generate_recommendation(suitability_score, checklist)
-        
-        return {
-            "suitability_score": suitability_score,
-            "recommendation": recommendation,
-            "checklist": checklist,
-            "matched_criteria": len([c for c in checklist if '✅' in c]),
-            "total_criteria": len(checklist),
-            "tender_requirements": tender_reqs
-        }
+        result = score_batch([record], company_profile)[0]
+        result["tender_requirements"] = record
+        return result
         
     except Exception as e:
         logger.error(f"Readiness scoring error: {e}")
@@ -316,156 +376,3 @@ def readiness_scoring(tender_summary: str, company_profile: Dict) -> Dict:
             "matched_criteria": 0,
             "total_criteria": 1
         }
-
-def check_industry_match(tender_summary: str, company: Dict) -> Dict:
-    """Check if company industry matches tender requirements"""
-    company_industry = company.get('industry', '').lower()
-    tender_text = tender_summary.lower()
-    
-    # Common industry keywords
-    industry_keywords = {
-        'construction': ['construction', 'building', 'civil', 'engineering', 'contractor'],
-        'it': ['it', 'technology', 'software', 'hardware', 'digital'],
-        'security': ['security', 'guard', 'surveillance', 'protection'],
-        'cleaning': ['cleaning', 'maintenance', 'sanitation', 'hygiene']
-    }
-    
-    for industry, keywords in industry_keywords.items():
-        if any(keyword in company_industry for keyword in keywords):
-            if any(keyword in tender_text for keyword in keywords):
-                return {'match': True, 'industry': industry}
-    
-    return {'match': False, 'industry': 'unknown'}
-
-def check_experience_match(tender_reqs: Dict, company: Dict) -> Dict:
-    """Check experience requirements match"""
-    exp_text = ' '.join(tender_reqs['eligibility_criteria'] + tender_reqs['key_requirements']).lower()
-    
-    # Look for experience requirements
-    exp_patterns = [
-        r'(\d+)\s*years',
-        r'(\d+)\s*yr',
-        r'minimum\s*(\d+)\s*experience',
-        r'at least\s*(\d+)\s*years'
-    ]
-    
-    required_exp = 0
-    for pattern in exp_patterns:
-        matches = re.findall(pattern, exp_text)
-        if matches:
-            required_exp = max(required_exp, int(matches[0]))
-            break
-    
-    company_exp = company.get('years_of_experience', 0)
-    
-    if required_exp == 0:
-        return {'score': 20, 'checklist': "✅ Experience: No specific requirement"}
-    elif company_exp >= required_exp:
-        return {'score': 20, 'checklist': f"✅ Experience: {company_exp} years (meets {required_exp}+ requirement)"}
-    else:
-        return {'score': 10, 'checklist': f"❌ Experience: {company_exp} years (needs {required_exp}+ years)"}
-
-def check_location_match(tender_reqs: Dict, company: Dict) -> Dict:
-    """Check location requirements match"""
-    tender_location = tender_reqs.get('location', '').lower()
-    company_locations = [loc.strip().lower() for loc in company.get('geographic_coverage', [])]
-    
-    if not tender_location:
-        return {'score': 15, 'checklist': "✅ Location: No specific requirement"}
-    
-    # Check if company operates in required location
-    location_match = any(loc in tender_location for loc in company_locations) or any(tender_location in loc for loc in company_locations)
-    
-    if location_match:
-        return {'score': 15, 'checklist': f"✅ Location: Operates in {tender_location}"}
-    else:
-        return {'score': 0, 'checklist': f"❌ Location: Does not operate in {tender_location}"}
-
-def check_certification_match(tender_reqs: Dict, company: Dict) -> Dict:
-    """Check certification requirements match"""
-    cert_text = ' '.join(tender_reqs['eligibility_criteria'] + tender_reqs['key_requirements']).lower()
-    company_certs = [cert.lower() for cert in company.get('certifications', [])]
-    
-    checklist_items = []
-    score = 0
-    max_score = 15
-    
-    # Check for common certifications
-    cert_checks = {
-        'cidb': ['cidb'],
-        'bbbee': ['bbbee', 'b-bbee'],
-        'iso': ['iso 9001', 'iso 14001'],
-        'sans': ['sans 10400']
-    }
-    
-    for cert_type, keywords in cert_checks.items():
-        if any(keyword in cert_text for keyword in keywords):
-            if any(any(keyword in cert for keyword in keywords) for cert in company_certs):
-                checklist_items.append(f"✅ {cert_type.upper()}: Certified")
-                score += 5
-            else:
-                checklist_items.append(f"❌ {cert_type.upper()}: Not certified")
-    
-    if not checklist_items:
-        checklist_items.append("✅ Certifications: No specific requirements")
-        score = max_score
-    
-    return {'score': min(score, max_score), 'checklist': checklist_items}
-
-def check_capacity_match(tender_reqs: Dict, company: Dict) -> Dict:
-    """Check company capacity matches requirements"""
-    capacity_text = ' '.join(tender_reqs['eligibility_criteria']).lower()
-    company_employees = company.get('employee_count', 0)
-    company_turnover = company.get('annual_turnover', 0)
-    
-    checklist_items = []
-    score = 0
-    
-    # Check employee count requirements
-    if 'employees' in capacity_text or 'staff' in capacity_text:
-        if company_employees >= 10:
-            checklist_items.append("✅ Capacity: Adequate workforce")
-            score += 5
-        else:
-            checklist_items.append("❌ Capacity: Limited workforce")
-    
-    # Check turnover requirements
-    if 'turnover' in capacity_text or 'revenue' in capacity_text:
-        if company_turnover >= 1000000:  # 1 million
-            checklist_items.append("✅ Financial: Adequate turnover")
-            score += 5
-        else:
-            checklist_items.append("❌ Financial: Limited turnover")
-    
-    if not checklist_items:
-        checklist_items.append("✅ Capacity: No specific requirements")
-        score = 10
-    
-    return {'score': score, 'checklist': checklist_items}
-
-def check_bbbee_match(tender_reqs: Dict, company: Dict) -> Dict:
-    """Check BBBEE requirements"""
-    bbeee_text = ' '.join(tender_reqs['eligibility_criteria']).lower()
-    company_bbbee = company.get('black_owned', False)
-    
-    if 'bbbee' in bbeee_text or 'b-bbee' in bbeee_text:
-        if company_bbbee:
-            return {'score': 15, 'checklist': "✅ BBBEE: Compliant (Black-owned)"}
-        else:
-            return {'score': 5, 'checklist': "❌ BBBEE: Not compliant"}
-    else:
-        return {'score': 15, 'checklist': "✅ BBBEE: No specific requirement"}
-
-def generate_recommendation(score: int, checklist: List[str]) -> str:
-    """Generate recommendation based on score"""
-    matched_count = len([c for c in checklist if '✅' in c])
-    total_count = len(checklist)
-    
-    if score >= 80:
-        return f"HIGHLY SUITABLE - Strong match ({matched_count}/{total_count} criteria). Recommended for bidding."
-    elif score >= 60:
-        return f"SUITABLE - Good match ({matched_count}/{total_count} criteria). Consider bidding with minor adjustments."
-    elif score >= 40:
-        return f"MODERATELY SUITABLE - Partial match ({matched_count}/{total_count} criteria). Review requirements carefully."
-    else:
-        return f"LOW SUITABILITY - Limited match ({matched_count}/{total_count} criteria). Not recommended unless gaps can be addressed."
\ No newline at end of file
@@ -0,0 +1,133 @@
+# app/services/tender_requirements.py
+import hashlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.database import upsert_insert
+from app.models.tender_requirements import TenderRequirements
+from app.services.readiness_engine import changed_record_criteria, extract_tender_features
+
+# Bump when extract_tender_features reads requirements differently, so stored records are re-extracted
+EXTRACTOR_VERSION = "2"
+
+# A record read from richer text is never replaced by one read from poorer text.
+# "posted" is text a client sent (summarize requests, workspace saves): it only
+# ever fills a gap and never replaces a record read at ingest or from documents.
+SOURCE_PRIORITY = {"posted": 0, "ingest": 1, "summary": 2, "documents": 3}
+
+RECORD_FIELDS = (
+    "industries", "required_years", "location", "province", "certifications", "cidb_grade",
+    "bbbee_level", "requires_staff", "min_employees", "requires_turnover", "min_turnover", "requires_bbbee",
+)
+
+# Rows per INSERT statement (17 bound columns each, under SQLite's 999 variable limit)
+UPSERT_BATCH_ROWS = 50
+# Ids per IN (...) lookup
+LOOKUP_BATCH_IDS = 500
+
+
+def _content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _row_to_record(row: TenderRequirements) -> Dict:
+    record = {field: getattr(row, field) for field in RECORD_FIELDS}
+    record["industries"] = record["industries"] or []
+    record["certifications"] = record["certifications"] or []
+    record["location"] = record["location"] or ""
+    return record
+
+
+def _rows(db: Session, tender_ids: list) -> Dict[str, TenderRequirements]:
+    rows = {}
+    for start in range(0, len(tender_ids), LOOKUP_BATCH_IDS):
+        chunk = tender_ids[start:start + LOOKUP_BATCH_IDS]
+        for row in db.query(TenderRequirements).filter(TenderRequirements.tender_id.in_(chunk)):
+            rows[row.tender_id] = row
+    return rows
+
+
+class TenderRequirementStore:
+    """
+    Requirement records (see readiness_engine.extract_tender_features) kept
+    in tender_requirements, one row per tender. Records are written when a
+    tender is ingested, summarized or its documents are processed; matching
+    then reads the stored record instead of re-analysing the tender text.
+    """
+
+    def _is_current(self, row: Optional[TenderRequirements], source: str, content_hash: str) -> bool:
+        """Whether the stored row should be kept over a record read from (source, text)"""
+        if row is None or row.extractor_version != EXTRACTOR_VERSION:
+            return False
+        if row.content_hash == content_hash:
+            return True
+        return SOURCE_PRIORITY.get(row.source, 0) > SOURCE_PRIORITY[source]
+
+    def save_many(self, db: Session, texts: Dict[str, str],
+                  source: str) -> Tuple[Dict[str, Dict], Dict[str, Tuple[Dict, List[str]]]]:
+        """
+        Extract and store records for {tender_id: text} in one transaction.
+        Tenders whose stored record is current (same text, or read from a
+        richer source) are left as they are. Returns (records written,
+        amended), where amended is {tender_id: (new record, changed criteria)}
+        for tenders whose scoring-relevant fields moved; callers pass it to
+        rescoring.rescore_tenders, off the event loop.
+        """
+        texts = {tender_id: text for tender_id, text in texts.items() if tender_id and text and text.strip()}
+        if not texts:
+            return {}, {}
+
+        existing = _rows(db, list(texts))
+        records, rows, amended = {}, [], {}
+        for tender_id, text in texts.items():
+            content_hash = _content_hash(text)
+            row = existing.get(tender_id)
+            if self._is_current(row, source, content_hash):
+                continue
+            record = extract_tender_features(text)
+            records[tender_id] = record
+            if row is not None:
+                criteria = changed_record_criteria(_row_to_record(row), record)
+                if criteria:
+                    amended[tender_id] = (record, criteria)
+            rows.append({
+                "tender_id": tender_id,
+                "source": source,
+                "content_hash": content_hash,
+                "extractor_version": EXTRACTOR_VERSION,
+                **record,
+                "updated_at": func.now(),
+            })
+
+        for start in range(0, len(rows), UPSERT_BATCH_ROWS):
+            statement = upsert_insert(db, TenderRequirements).values(rows[start:start + UPSERT_BATCH_ROWS])
+            statement = statement.on_conflict_do_update(
+                index_elements=["tender_id"],
+                set_={
+                    **{column: statement.excluded[column] for column in
+                       ("source", "content_hash", "extractor_version") + RECORD_FIELDS},
+                    "updated_at": func.now(),
+                }
+            )
+            db.execute(statement)
+        if rows:
+            db.commit()
+            print(f"📐 Stored requirement records for {len(rows)} tenders ({source})")
+        return records, amended
+
+    def save(self, db: Session, tender_id: str, text: str, source: str) -> Dict[str, Tuple[Dict, List[str]]]:
+        """Extract and store one tender's record; returns save_many's amended changes"""
+        return self.save_many(db, {tender_id: text}, source)[1]
+
+    def get(self, db: Session, tender_id: str) -> Optional[Dict]:
+        row = db.query(TenderRequirements).filter(TenderRequirements.tender_id == tender_id).first()
+        return _row_to_record(row) if row is not None else None
+
+    def get_many(self, db: Session, tender_ids: Iterable[str]) -> Dict[str, Dict]:
+        return {tender_id: _row_to_record(row) for tender_id, row in _rows(db, list(tender_ids)).items()}
+
+
+# Global instance
+tender_requirement_store = TenderRequirementStore()
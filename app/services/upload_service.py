@@ -0,0 +1,200 @@
+# app/services/upload_service.py
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from typing import AsyncIterator, Dict
+
+from dotenv import load_dotenv
+from fastapi import UploadFile
+
+from app.services.docx_extraction import is_docx
+from app.services.document_cache import document_cache
+from app.services.extraction_executor import extraction_executor
+from app.services.pdf_extraction import backend_signature
+from app.services.tender_doc_services import (
+    extract_key_pages,
+    extract_documents_from_zip_async,
+    iter_documents_from_zip,
+)
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+
+class UploadTooLargeError(Exception):
+    """Raised when an uploaded file exceeds MAX_UPLOAD_BYTES"""
+
+
+class UnsupportedDocumentError(Exception):
+    """Raised when an upload is not a recognised document type"""
+
+
+class UploadService:
+    """
+    Reads tender document uploads in chunks, hashing and sniffing them as they
+    stream, then hands them to the extraction pipeline.
+
+    The multipart body is already spooled to a SpooledTemporaryFile by the
+    form parser (memory first, disk past its threshold). We read that same
+    file in chunks, so large packs are never held fully in memory. A single
+    PDF or DOCX past one chunk is copied in chunks to a named temporary file
+    for the extraction worker, which opens it by path.
+    """
+
+    def __init__(self):
+        self.chunk_size = 1024 * 1024  # 1MB
+        self.max_upload_bytes = int(os.getenv("MAX_UPLOAD_BYTES", 100 * 1024 * 1024))  # 100MB
+        self.extraction_variant = f"upload-{backend_signature()}"
+
+    @staticmethod
+    def detect_type(head: bytes, upload_file) -> str:
+        """Identify the document type from its magic bytes (a DOCX is a ZIP with word/document.xml)"""
+        # ZIP magic first: a stored PDF member puts %PDF inside the first KB of a pack
+        if head.startswith(b'PK\x03\x04') or head.startswith(b'PK\x05\x06'):
+            # Only the central directory is read, not the members
+            is_word_document = is_docx(upload_file)
+            upload_file.seek(0)
+            return "docx" if is_word_document else "zip"
+        if b'%PDF' in head[:1024]:  # The PDF header may follow a little junk
+            return "pdf"
+        return "unknown"
+
+    async def inspect(self, upload: UploadFile) -> Dict:
+        """Stream through the upload once: SHA-256, size limit and type detection"""
+        sha256 = hashlib.sha256()
+        size = 0
+        head = b""
+
+        await upload.seek(0)
+        while True:
+            chunk = await upload.read(self.chunk_size)
+            if not chunk:
+                break
+            if not head:
+                head = chunk[:1024]
+            size += len(chunk)
+            if size > self.max_upload_bytes:
+                raise UploadTooLargeError(f"Upload exceeds the {self.max_upload_bytes} byte limit")
+            sha256.update(chunk)
+        await upload.seek(0)
+
+        return {
+            "filename": upload.filename,
+            "sha256": sha256.hexdigest(),
+            "size": size,
+            "type": self.detect_type(head, upload.file)
+        }
+
+    async def _copy_to_path(self, upload: UploadFile) -> str:
+        """Copy the spooled upload in chunks to a named temporary file; the caller removes it"""
+        await upload.seek(0)
+        with tempfile.NamedTemporaryFile(prefix="upload-", delete=False) as f:
+            await asyncio.to_thread(shutil.copyfileobj, upload.file, f, self.chunk_size)
+            return f.name
+
+    async def extract_text(self, upload: UploadFile) -> Dict:
+        """Extract text from an uploaded PDF, DOCX or ZIP, reusing cached text for identical content"""
+        info = await self.inspect(upload)
+        if info["type"] == "unknown":
+            raise UnsupportedDocumentError(f"{upload.filename} is not a PDF, DOCX or ZIP document")
+
+        cached = document_cache.get_pages(info["sha256"], self.extraction_variant)
+        if cached:
+            print(f"♻️ Using cached extracted text for upload {info['sha256'][:12]}")
+            return {**info, "text": cached["text"], "documents_processed": cached.get("documents_processed", 1)}
+
+        if info["type"] == "zip":
+            # Members are streamed straight out of the spooled upload
+            documents = await extract_documents_from_zip_async(upload.file)
+            text = "".join(document["text"] + "\n\n" for document in documents)
+            documents_processed = len(documents)
+        else:
+            # Single PDF or DOCX: small uploads are still in memory, larger ones go to the worker by path
+            if info["size"] <= self.chunk_size:
+                extraction = await extraction_executor.run(extract_key_pages, await upload.read())
+            else:
+                path = await self._copy_to_path(upload)
+                try:
+                    extraction = await extraction_executor.run(extract_key_pages, path)
+                finally:
+                    os.remove(path)
+            text = "".join(page + "\n" for page in extraction["pages"])
+            documents_processed = 1
+
+        if text.strip():
+            document_cache.put_pages(info["sha256"], self.extraction_variant, {
+                "text": text,
+                "documents_processed": documents_processed
+            })
+
+        return {**info, "text": text, "documents_processed": documents_processed}
+
+    async def detach(self, upload: UploadFile) -> Dict:
+        """
+        inspect() plus a copy of the upload in a named temporary file (info["path"]).
+        FastAPI closes form files when the endpoint returns, before a streamed
+        response body runs, so streaming responses extract from the copy.
+        The caller removes the file.
+        """
+        info = await self.inspect(upload)
+        if info["type"] == "unknown":
+            raise UnsupportedDocumentError(f"{upload.filename} is not a PDF, DOCX or ZIP document")
+        return {**info, "path": await self._copy_to_path(upload)}
+
+    async def iter_text(self, info: Dict) -> AsyncIterator[Dict]:
+        """
+        Extract a detached upload progressively: {"page": text} for each page
+        of a PDF/DOCX or each document of a ZIP as soon as it is read, then
+        {"text", "documents_processed"} with the same text extract_text() returns.
+
+        ZIP members are still extracted in the process pool. A single document
+        is read in a worker thread here, because its pages have to come back
+        while the rest of it is still being extracted.
+        """
+        cached = document_cache.get_pages(info["sha256"], self.extraction_variant)
+        if cached:
+            print(f"♻️ Using cached extracted text for upload {info['sha256'][:12]}")
+            yield {"text": cached["text"], "documents_processed": cached.get("documents_processed", 1)}
+            return
+
+        loop = asyncio.get_running_loop()
+        pages: asyncio.Queue = asyncio.Queue()
+
+        def emit(page_text: str):
+            loop.call_soon_threadsafe(pages.put_nowait, page_text)
+
+        def extract():
+            try:
+                if info["type"] == "zip":
+                    documents = []
+                    for document in iter_documents_from_zip(info["path"]):
+                        documents.append(document)
+                        emit(document["text"])
+                    return "".join(document["text"] + "\n\n" for document in documents), len(documents)
+                extraction = extract_key_pages(info["path"], on_page=emit)
+                return "".join(page + "\n" for page in extraction["pages"]), 1
+            finally:
+                loop.call_soon_threadsafe(pages.put_nowait, None)
+
+        extraction = asyncio.ensure_future(asyncio.to_thread(extract))
+        while True:
+            page_text = await pages.get()
+            if page_text is None:
+                break
+            yield {"page": page_text}
+        text, documents_processed = await extraction
+
+        if text.strip():
+            document_cache.put_pages(info["sha256"], self.extraction_variant, {
+                "text": text,
+                "documents_processed": documents_processed
+            })
+        yield {"text": text, "documents_processed": documents_processed}
+
+
+# Global instance
+upload_service = UploadService()
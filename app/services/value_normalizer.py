@@ -0,0 +1,213 @@
+# app/services/value_normalizer.py
+"""
+Typed deadline and budget values from the raw strings the section patterns
+extract ("15 March 2025 at 11h00", "30 days from publication",
+"R 5,000,000", "R2.5 million").
+
+All parsers are compiled once at import. Dates are read day-first, the way
+South African tenders write them (15/03/2025 is 15 March). Amounts are
+treated as ZAR unless another currency is named, which returns None rather
+than a wrong number.
+"""
+import re
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional
+
+MONTHS = {
+    'jan': 1, 'january': 1, 'feb': 2, 'february': 2, 'mar': 3, 'march': 3,
+    'apr': 4, 'april': 4, 'may': 5, 'jun': 6, 'june': 6, 'jul': 7, 'july': 7,
+    'aug': 8, 'august': 8, 'sep': 9, 'sept': 9, 'september': 9, 'oct': 10, 'october': 10,
+    'nov': 11, 'november': 11, 'dec': 12, 'december': 12,
+}
+_MONTH = r'(?P<month>' + '|'.join(sorted(MONTHS, key=len, reverse=True)) + r')\.?'
+
+# Time of day: 11:00, 11h00 (SA), 11.00am, 2 pm
+_TIME = re.compile(r'(?P<hour>\d{1,2})\s*(?:[:h]|\.(?=\d{2}\s*[ap]m))\s*(?P<minute>\d{2})?\s*(?P<meridiem>[ap]\.?m\.?)?'
+                   r'|(?P<hour12>\d{1,2})\s*(?P<meridiem12>[ap]\.?m\.?)', re.IGNORECASE)
+
+_DATE_PATTERNS = [
+    # 2025-03-15, 2025/03/15
+    re.compile(r'\b(?P<year>\d{4})[-/.](?P<month>\d{1,2})[-/.](?P<day>\d{1,2})\b'),
+    # 15/03/2025, 15-03-25, 15.03.2025 (day first)
+    re.compile(r'\b(?P<day>\d{1,2})[-/.](?P<month>\d{1,2})[-/.](?P<year>\d{4}|\d{2})\b'),
+    # 15 March 2025, 15th of Mar 2025, Friday 15 March 2025
+    re.compile(r'\b(?P<day>\d{1,2})(?:st|nd|rd|th)?\s+(?:of\s+)?' + _MONTH + r',?\s+(?P<year>\d{4})\b', re.IGNORECASE),
+    # March 15, 2025
+    re.compile(r'\b' + _MONTH + r'\s+(?P<day>\d{1,2})(?:st|nd|rd|th)?,?\s+(?P<year>\d{4})\b', re.IGNORECASE),
+]
+
+_NUMBER_WORDS = {
+    'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6, 'seven': 7, 'eight': 8, 'nine': 9,
+    'ten': 10, 'fourteen': 14, 'fifteen': 15, 'twenty': 20, 'twenty-one': 21, 'thirty': 30,
+    'forty-five': 45, 'sixty': 60, 'ninety': 90,
+}
+_UNIT_DAYS = {'day': 1, 'working day': 1, 'business day': 1, 'calendar day': 1, 'week': 7, 'month': 30}
+
+# 30 days from publication, within 14 working days, two weeks after the briefing session
+_RELATIVE = re.compile(
+    r'\b(?P<count>\d{1,3}|' + '|'.join(sorted(_NUMBER_WORDS, key=len, reverse=True)) + r')\s*(?:\(\d{1,3}\)\s*)?'
+    r'(?P<unit>working day|business day|calendar day|day|week|month)s?\b',
+    re.IGNORECASE
+)
+
+# R 5,000,000.00 / R5 million / ZAR 3.2bn / 1 500 000,00 / R500k
+_AMOUNT = re.compile(
+    r'(?P<currency>\bzar\b|\br(?=\s?\d)|\$|\busd\b|\beur\b|€|£|\bgbp\b)?\s*'
+    r'(?P<number>\d{1,3}(?:[ ,. ]\d{3})+(?:[.,]\d+)?|\d+(?:[.,]\d+)?)'
+    r'(?:\s*(?P<scale>billion|bn|million|mil|m|thousand|k)\b)?',
+    re.IGNORECASE
+)
+_DOT_GROUPED = re.compile(r'\d{1,3}(?:\.\d{3})+')
+_SCALES = {'billion': 1e9, 'bn': 1e9, 'million': 1e6, 'mil': 1e6, 'm': 1e6, 'thousand': 1e3, 'k': 1e3}
+_SCALE_WORDS = {'billion', 'million', 'thousand'}
+_FOREIGN_CURRENCIES = {'$', 'usd', 'eur', '€', '£', 'gbp'}
+
+
+def _year(value: str) -> int:
+    year = int(value)
+    return year + 2000 if year < 100 else year
+
+
+def _time_of_day(text: str) -> Optional[tuple]:
+    match = _TIME.search(text)
+    if not match:
+        return None
+    if match.group('hour12'):
+        hour, minute, meridiem = int(match.group('hour12')), 0, match.group('meridiem12')
+    else:
+        hour, minute, meridiem = int(match.group('hour')), int(match.group('minute') or 0), match.group('meridiem')
+    if meridiem:
+        meridiem = meridiem.lower().replace('.', '')
+        if hour == 12:
+            hour = 0
+        if meridiem == 'pm':
+            hour += 12
+    if hour > 23 or minute > 59:
+        return None
+    return hour, minute
+
+
+def parse_date(raw: Optional[str]) -> Optional[datetime]:
+    """First absolute date in raw (with its time of day when one follows it), or None"""
+    if not raw:
+        return None
+    for pattern in _DATE_PATTERNS:
+        for match in pattern.finditer(raw):
+            month = match.group('month')
+            month = MONTHS.get(month.lower().rstrip('.')) if not month.isdigit() else int(month)
+            try:
+                parsed = datetime(_year(match.group('year')), month, int(match.group('day')))
+            except (TypeError, ValueError):
+                continue  # 31/02/2025, 13/13/2025 and the like
+            time_of_day = _time_of_day(raw[match.end():match.end() + 20])
+            if time_of_day:
+                parsed = parsed.replace(hour=time_of_day[0], minute=time_of_day[1])
+            return parsed
+    return None
+
+
+def parse_relative_days(raw: Optional[str]) -> Optional[int]:
+    """Day count of a relative deadline ("30 days from publication", "two weeks"), or None"""
+    if not raw:
+        return None
+    match = _RELATIVE.search(raw)
+    if not match:
+        return None
+    count = match.group('count').lower()
+    count = int(count) if count.isdigit() else _NUMBER_WORDS[count]
+    return count * _UNIT_DAYS[match.group('unit').lower()]
+
+
+def resolve_deadline(raw: Optional[str], reference: Optional[date] = None) -> Optional[datetime]:
+    """Absolute deadline for raw; relative deadlines need a reference (e.g. publication) date"""
+    absolute = parse_date(raw)
+    if absolute is not None or reference is None:
+        return absolute
+    days = parse_relative_days(raw)
+    if days is None:
+        return None
+    if not isinstance(reference, datetime):
+        reference = datetime(reference.year, reference.month, reference.day)
+    return reference + timedelta(days=days)
+
+
+def _to_float(number: str, scaled: bool = False) -> Optional[float]:
+    """'5,000,000' / '1 500 000,00' / '5.000.000' / '2.5' / '2,5' -> float (scaled: a scale word follows)"""
+    number = number.replace(' ', ' ').replace(' ', '')
+    if ',' in number and '.' in number:
+        # The later separator is the decimal one
+        if number.rfind(',') > number.rfind('.'):
+            number = number.replace('.', '').replace(',', '.')
+        else:
+            number = number.replace(',', '')
+    elif ',' in number:
+        head, _, tail = number.rpartition(',')
+        # A single comma followed by 1-2 digits is an SA decimal comma; anything else groups thousands
+        number = f"{head}.{tail}" if len(tail) <= 2 and number.count(',') == 1 else number.replace(',', '')
+    elif _DOT_GROUPED.fullmatch(number) and (number.count('.') > 1 or not scaled):
+        # Dots before three-digit groups group thousands ("R 5.000.000"), but "R 1.250 million" is 1.25
+        number = number.replace('.', '')
+    try:
+        return float(number)
+    except ValueError:
+        return None
+
+
+def parse_zar_amount(raw: Optional[str]) -> Optional[float]:
+    """
+    Largest ZAR amount named in raw, in rands. Bare numbers count only when
+    they carry a currency or a spelled-out scale ("5 million"), so "Phase 2",
+    a year or "20 m" is never read as a budget.
+    """
+    if not raw:
+        return None
+    best = None
+    for match in _AMOUNT.finditer(raw):
+        currency = (match.group('currency') or '').lower()
+        scale = (match.group('scale') or '').lower()
+        if currency in _FOREIGN_CURRENCIES:
+            continue
+        if not currency and scale not in _SCALE_WORDS:
+            continue  # "20 m of road", "500k" without a currency are not budgets
+        value = _to_float(match.group('number'), scaled=bool(scale))
+        if value is None:
+            continue
+        value *= _SCALES.get(scale, 1)
+        if best is None or value > best:
+            best = value
+    return best
+
+
+CONTEXT_CHARS = 40
+
+
+def _with_context(raw: Optional[str], text: Optional[str]) -> Optional[str]:
+    """
+    raw from the start of its first word to the rest of its line (up to
+    CONTEXT_CHARS). The section patterns stop at the first '.' and may start
+    mid-word, so "R 2.5 million" arrives as "R 2.5", "15/03/2025 at 11h00"
+    as "15/03/2025" and "2025-04-01" as "25-04-01"; the context restores them.
+    """
+    if not raw or not text:
+        return raw
+    start = text.find(raw)
+    if start < 0:
+        return raw  # Joined capture groups do not occur verbatim
+    end = start + len(raw)
+    while start > 0 and not text[start - 1].isspace():
+        start -= 1
+    line_end = text.find('\n', end)
+    stop = end + CONTEXT_CHARS if line_end < 0 else min(line_end, end + CONTEXT_CHARS)
+    return text[start:stop]
+
+
+def normalize_requirements(requirements: Dict[str, Any], text: Optional[str] = None) -> Dict[str, Any]:
+    """Typed values for the raw deadline and budget fields of a requirements dict (text adds context)"""
+    deadline = _with_context(requirements.get('deadline'), text)
+    deadline_date = parse_date(deadline)
+    return {
+        'deadline_date': deadline_date,
+        'deadline_days': parse_relative_days(deadline) if deadline_date is None else None,
+        'budget_amount': parse_zar_amount(_with_context(requirements.get('budget'), text)),
+        'budget_currency': 'ZAR',
+    }
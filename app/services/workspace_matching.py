@@ -0,0 +1,69 @@
+# app/services/workspace_matching.py
+from typing import Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.workspace import WorkspaceTender
+from app.services.company_profiles import CompiledCompanyProfile
+from app.services.match_score_store import match_score_store
+from app.services.readiness_engine import score_batch
+from app.services.tender_requirements import tender_requirement_store
+
+
+def match_workspace_tenders(db: Session, profile: CompiledCompanyProfile, status: Optional[str] = None,
+                            user_id: Optional[int] = None) -> Dict:
+    """
+    Score every workspace tender against the company profile in one pass.
+
+    The tender side is the stored requirement record when there is one,
+    otherwise it is read from the saved AI summary (or title/description)
+    and stored as client-posted text, which never replaces a richer record.
+    Workspace rows are shared by every team, so scores are not written onto
+    them: they go to tender_match_scores for this company with the usual
+    batched upserts, and the workspace list reads them there.
+    """
+    query = db.query(
+        WorkspaceTender.id, WorkspaceTender.tender_id, WorkspaceTender.title,
+        WorkspaceTender.description, WorkspaceTender.ai_summary
+    )
+    if status:
+        query = query.filter(WorkspaceTender.status == status)
+    entries = query.all()
+    if not entries:
+        return {"matched": 0, "skipped": 0, "results": []}
+
+    records = tender_requirement_store.get_many(db, {entry.tender_id for entry in entries})
+
+    # Tenders without a record: the cached summary first, then whatever was saved with the tender
+    missing = [entry for entry in entries if entry.tender_id not in records]
+    from_summaries = {entry.tender_id: entry.ai_summary for entry in missing if (entry.ai_summary or '').strip()}
+    from_details = {
+        entry.tender_id: f"{entry.title or ''}\n{entry.description or ''}"
+        for entry in missing if entry.tender_id not in from_summaries
+    }
+    # Only tenders without a record are saved, so nothing is amended
+    records.update(tender_requirement_store.save_many(db, from_summaries, "posted")[0])
+    records.update(tender_requirement_store.save_many(db, from_details, "posted")[0])
+    # Records kept from a richer source are not returned by save_many
+    unresolved = {entry.tender_id for entry in missing} - set(records)
+    if unresolved:
+        records.update(tender_requirement_store.get_many(db, unresolved))
+
+    scored = [entry for entry in entries if entry.tender_id in records]
+    results = score_batch([records[entry.tender_id] for entry in scored], profile.data, profile.vector)
+
+    # Same rows the single-tender /match endpoint writes (and later rescoring keeps current)
+    match_score_store.upsert_many(
+        db, profile.id, {entry.tender_id: result for entry, result in zip(scored, results)}, user_id
+    )
+    print(f"🎯 Matched {len(scored)} workspace tenders for {profile.name}")
+
+    return {
+        "matched": len(scored),
+        "skipped": len(entries) - len(scored),
+        "results": [
+            {"id": entry.id, "tender_id": entry.tender_id,
+             "match_score": result["suitability_score"], "match_recommendation": result["recommendation"]}
+            for entry, result in zip(scored, results)
+        ]
+    }
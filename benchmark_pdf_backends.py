@@ -0,0 +1,101 @@
+# benchmark_pdf_backends.py
+"""
+Measure pages/second for every installed PDF extraction backend on the
+sample documents in temp_files/ and record the results as JSON.
+
+The output file is read by app.services.pdf_extraction at import,
+so the fastest backend that still produced usable text becomes the default.
+
+    python benchmark_pdf_backends.py [--docs temp_files] [--output <repo>/bench_output.txt] [--rounds 3]
+"""
+import argparse
+import glob
+import json
+import os
+import time
+from datetime import datetime
+
+from app.services.pdf_extraction import BENCHMARK_FILE, PDF_BACKENDS, MIN_USABLE_CHARS
+
+
+def benchmark_backend(backend, pdf_files, rounds):
+    total_pages = 0
+    total_chars = 0
+    usable_docs = 0
+    errors = []
+    elapsed = 0.0
+
+    for pdf_path in pdf_files:
+        with open(pdf_path, "rb") as f:
+            pdf_bytes = f.read()
+
+        for round_number in range(rounds):
+            try:
+                start = time.perf_counter()
+                _, page_iter = backend.open(pdf_bytes)
+                pages = list(page_iter)
+                elapsed += time.perf_counter() - start
+            except Exception as e:
+                errors.append(f"{os.path.basename(pdf_path)}: {e}")
+                break
+
+            if round_number == 0:
+                chars = sum(len(page.strip()) for page in pages)
+                total_pages += len(pages)
+                total_chars += chars
+                usable_docs += chars >= MIN_USABLE_CHARS
+
+    measured_pages = total_pages * rounds
+    return {
+        "backend": backend.name,
+        "documents": len(pdf_files),
+        "pages": total_pages,
+        "characters": total_chars,
+        "usable_documents": usable_docs,
+        "usable": usable_docs == len(pdf_files) and not errors,
+        "seconds": round(elapsed, 4),
+        "pages_per_second": round(measured_pages / elapsed, 2) if elapsed else 0,
+        "errors": errors
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PDF text extraction backends")
+    parser.add_argument("--docs", default="temp_files", help="Directory of sample PDFs")
+    parser.add_argument("--output", default=BENCHMARK_FILE, help="Where to write JSON results (read by the app)")
+    parser.add_argument("--rounds", type=int, default=3, help="Extraction rounds per document")
+    args = parser.parse_args()
+
+    pdf_files = sorted(glob.glob(os.path.join(args.docs, "*.pdf")))
+    if not pdf_files:
+        print(f"❌ No PDFs found in {args.docs}")
+        return
+
+    print(f"📄 Benchmarking {len(pdf_files)} documents x {args.rounds} rounds")
+
+    results = []
+    for backend in PDF_BACKENDS.values():
+        if not backend.is_available():
+            print(f"⚠️ {backend.name}: not installed, skipped")
+            continue
+        result = benchmark_backend(backend, pdf_files, args.rounds)
+        results.append(result)
+        status = "✅" if result["usable"] else "❌"
+        print(f"{status} {backend.name:<10} {result['pages_per_second']:>9.1f} pages/s  "
+              f"{result['characters']:>8} chars  {result['usable_documents']}/{len(pdf_files)} usable")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "created_at": datetime.utcnow().isoformat(),
+            "documents": [os.path.basename(p) for p in pdf_files],
+            "backends": results
+        }, f, indent=2)
+
+    ranked = [r for r in sorted(results, key=lambda r: r["pages_per_second"], reverse=True) if r["usable"]]
+    if ranked:
+        print(f"🏆 Fastest usable backend: {ranked[0]['backend']}")
+    print(f"💾 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# migrate_match_scores.py
+from app.database import engine, SessionLocal
+from app.models.tender_match import TenderMatchScore
+from sqlalchemy import text
+
+def migrate_match_scores():
+    print("🚀 Running match score migration...")
+
+    db = SessionLocal()
+
+    try:
+        # Check if tender_match_scores table exists
+        result = db.execute(text("""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name='tender_match_scores'
+        """))
+        if result.fetchone() is None:
+            print("📦 Creating tender_match_scores table...")
+            TenderMatchScore.__table__.create(bind=engine)
+            print("✅ Match score table created successfully!")
+            return
+
+        columns = {row[1]: row[3] for row in db.execute(text("PRAGMA table_info(tender_match_scores)"))}  # name -> notnull
+        if 'company_id' not in columns:
+            print("📦 Adding tender_match_scores.company_id...")
+            db.execute(text("ALTER TABLE tender_match_scores ADD COLUMN company_id INTEGER"))
+        if 'criteria' not in columns:
+            # Scores stored before per-criterion results are rescored in full on the next profile edit
+            print("📦 Adding tender_match_scores.criteria and depends_mask...")
+            db.execute(text("ALTER TABLE tender_match_scores ADD COLUMN criteria TEXT"))
+            db.execute(text("ALTER TABLE tender_match_scores ADD COLUMN depends_mask INTEGER"))
+
+        # Scores stored without a company belong to their user's team profile (demo mode: the first profile)
+        db.execute(text("""
+            UPDATE tender_match_scores SET company_id = COALESCE(
+                (SELECT company_profiles.id FROM company_profiles JOIN users
+                 ON company_profiles.team_id = users.team_id
+                 WHERE users.id = tender_match_scores.user_id ORDER BY company_profiles.id LIMIT 1),
+                (SELECT MIN(id) FROM company_profiles WHERE tender_match_scores.user_id IS NULL)
+            )
+            WHERE company_id IS NULL
+        """))
+        orphaned = db.execute(text("DELETE FROM tender_match_scores WHERE company_id IS NULL")).rowcount
+        if orphaned:
+            print(f"🧹 Removed {orphaned} scores without a company profile")
+
+        # Keep the newest row per (tender, company) so the unique index can be built
+        removed = db.execute(text("""
+            DELETE FROM tender_match_scores
+            WHERE id NOT IN (
+                SELECT MAX(id) FROM tender_match_scores
+                GROUP BY tender_id, company_id
+            )
+        """)).rowcount
+        if removed:
+            print(f"🧹 Removed {removed} duplicate scores")
+        db.execute(text("UPDATE tender_match_scores SET updated_at = created_at WHERE updated_at IS NULL"))
+
+        if not columns.get('company_id'):
+            # SQLite cannot add NOT NULL to an existing column: rebuild the table from the model
+            print("🔁 Rebuilding tender_match_scores with company_id NOT NULL...")
+            db.execute(text("ALTER TABLE tender_match_scores RENAME TO tender_match_scores_old"))
+            for (index_name,) in db.execute(text("""
+                SELECT name FROM sqlite_master
+                WHERE type='index' AND tbl_name='tender_match_scores_old' AND sql IS NOT NULL
+            """)).fetchall():
+                db.execute(text(f'DROP INDEX "{index_name}"'))
+            db.commit()
+            TenderMatchScore.__table__.create(bind=engine)
+            copied = ", ".join(column.name for column in TenderMatchScore.__table__.columns)
+            db.execute(text(f"""
+                INSERT INTO tender_match_scores ({copied})
+                SELECT {copied} FROM tender_match_scores_old
+            """))
+            db.execute(text("DROP TABLE tender_match_scores_old"))
+        else:
+            print("🗂️ Creating indexes...")
+            # Tables built from the model already carry the unique constraint
+            if not any(row[2] for row in db.execute(text("PRAGMA index_list(tender_match_scores)"))):
+                db.execute(text("""
+                    CREATE UNIQUE INDEX IF NOT EXISTS uq_tender_match_scores_tender_company
+                    ON tender_match_scores (tender_id, company_id)
+                """))
+            db.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_tender_match_scores_company_updated
+                ON tender_match_scores (company_id, updated_at)
+            """))
+
+        db.commit()
+        print("✅ Match score migration complete!")
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Migration error: {e}")
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    migrate_match_scores()
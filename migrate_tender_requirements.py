@@ -0,0 +1,53 @@
+# migrate_tender_requirements.py
+from app.database import engine, SessionLocal
+from app.models.tender_models import Tender
+from app.models.tender_requirements import TenderRequirements
+from app.services.rescoring import rescore_tenders
+from app.services.tender_requirements import tender_requirement_store
+from sqlalchemy import text
+
+def migrate_tender_requirements():
+    print("🚀 Running tender requirements migration...")
+
+    db = SessionLocal()
+
+    try:
+        # Check if tender_requirements table exists
+        result = db.execute(text("""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name='tender_requirements'
+        """))
+        if result.fetchone() is None:
+            print("📦 Creating tender_requirements table...")
+            TenderRequirements.__table__.create(bind=engine)
+            print("✅ Tender requirements table created successfully!")
+
+        db.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_tender_requirements_updated_at
+            ON tender_requirements (updated_at)
+        """))
+
+        # Backfill records for stored tenders from their ingested fields
+        tenders = db.query(Tender.ocds_id, Tender.title, Tender.description, Tender.province).filter(
+            Tender.ocds_id.isnot(None)
+        ).all()
+        print(f"📐 Extracting requirement records for {len(tenders)} tenders...")
+        written, amended = tender_requirement_store.save_many(db, {
+            tender.ocds_id: f"{tender.title or ''}\n{tender.description or ''}\n{tender.province or ''}"
+            for tender in tenders
+        }, "ingest")
+        db.commit()
+        # Records re-extracted by a newer extractor: refresh the stored scores they move
+        rescore_tenders(db, amended)
+
+        print(f"✅ Tender requirements migration complete! ({len(written)} records written)")
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Migration error: {e}")
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    migrate_tender_requirements()
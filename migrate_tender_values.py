@@ -0,0 +1,56 @@
+# migrate_tender_values.py
+from app.database import engine, SessionLocal
+from app.services.value_normalizer import parse_zar_amount
+from sqlalchemy import text
+
+def migrate_tender_values():
+    print("🚀 Running typed deadline/budget migration...")
+
+    db = SessionLocal()
+
+    try:
+        # Check if workspace_tenders table exists
+        result = db.execute(text("""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name='workspace_tenders'
+        """))
+        if result.fetchone() is None:
+            print("📋 No workspace_tenders table yet - it will be created with the new columns")
+            return
+
+        columns = {row[1] for row in db.execute(text("PRAGMA table_info(workspace_tenders)"))}
+
+        if 'budget_amount' not in columns:
+            print("📦 Adding workspace_tenders.budget_amount...")
+            db.execute(text("ALTER TABLE workspace_tenders ADD COLUMN budget_amount FLOAT"))
+
+        print("🗂️ Creating indexes...")
+        db.execute(text("CREATE INDEX IF NOT EXISTS ix_workspace_tenders_budget_amount ON workspace_tenders (budget_amount)"))
+        db.execute(text("CREATE INDEX IF NOT EXISTS ix_workspace_tenders_deadline ON workspace_tenders (deadline)"))
+
+        # Backfill from the raw budget strings
+        rows = db.execute(text("""
+            SELECT id, budget FROM workspace_tenders
+            WHERE budget_amount IS NULL AND budget IS NOT NULL
+        """)).fetchall()
+        updates = [
+            {"id": row_id, "amount": amount}
+            for row_id, budget in rows
+            if (amount := parse_zar_amount(budget)) is not None
+        ]
+        if updates:
+            db.execute(text("UPDATE workspace_tenders SET budget_amount = :amount WHERE id = :id"), updates)
+        print(f"💰 Parsed {len(updates)} of {len(rows)} budgets")
+
+        db.commit()
+        print("✅ Typed value migration complete!")
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Migration error: {e}")
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    migrate_tender_values()
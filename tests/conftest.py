@@ -0,0 +1,57 @@
+# tests/conftest.py
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from app import database
+from app.auth import get_current_user_optional
+from app.models import tender_match, tender_models, tender_requirements, user_models, workspace  # noqa: F401 (tables)
+from app.services.company_profiles import company_profile_cache
+from app.services.match_score_store import match_score_store
+from app.services.recommendations import recommendation_service
+
+
+@pytest.fixture
+def db(tmp_path):
+    """A session on a fresh SQLite database; SessionLocal (and so get_db) is bound to it for the test"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'tender_hub.db'}", connect_args={"check_same_thread": False})
+    database.Base.metadata.create_all(bind=engine)
+    database.SessionLocal.configure(bind=engine)
+    session = database.SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        database.SessionLocal.configure(bind=database.engine)
+        engine.dispose()
+        # In-process caches are keyed by ids that the next database reuses
+        match_score_store.invalidate()
+        recommendation_service.invalidate()
+        company_profile_cache._entries.clear()
+
+
+@pytest.fixture
+def team_profile(db):
+    """A team with a construction company profile"""
+    team = user_models.Team(name="Team A")
+    db.add(team)
+    db.commit()
+    profile = user_models.CompanyProfile(
+        company_name="Build Co", industry_sector="Construction",
+        services_provided="Building Construction, Road Works", years_of_experience=8,
+        cidb_grading="7CE", bbbee_level="2", operating_provinces="Gauteng",
+        number_of_employees=40, annual_turnover="R10 million", team_id=team.id,
+    )
+    db.add(profile)
+    db.commit()
+    return profile
+
+
+def route_client(*routers, user=None) -> TestClient:
+    """TestClient for a bare app with the given routers, authenticated as `user` (None = demo mode)"""
+    app = FastAPI()
+    for router in routers:
+        app.include_router(router)
+    app.dependency_overrides[get_current_user_optional] = lambda: user
+    return TestClient(app)
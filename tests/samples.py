@@ -0,0 +1,67 @@
+# tests/samples.py
+"""Small documents built in memory for extraction tests"""
+import io
+import zipfile
+from typing import List
+
+
+def make_pdf(pages: List[str]) -> bytes:
+    """A minimal PDF with one line of Helvetica text per page"""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in pages:
+        escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+        stream = f"BT /F1 12 Tf 72 720 Td ({escaped}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1"))
+    xref = out.tell()
+    out.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1"))
+    for offset in offsets:
+        out.write(f"{offset:010d} 00000 n \n".encode("latin-1"))
+    out.write(f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1"))
+    return out.getvalue()
+
+
+def make_docx(paragraphs: List[str]) -> bytes:
+    """A minimal DOCX (word/document.xml only) with one run per paragraph"""
+    body = "".join(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>" for text in paragraphs)
+    document = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                f'<w:body>{body}</w:body></w:document>')
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w") as archive:
+        archive.writestr("[Content_Types].xml", '<?xml version="1.0" encoding="UTF-8"?><Types/>')
+        archive.writestr("word/document.xml", document)
+    return out.getvalue()
+
+
+def make_zip(members: dict) -> bytes:
+    """A ZIP archive of {name: bytes}"""
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return out.getvalue()
+
+
+TENDER_TEXT = """Invitation to bid for the construction of a community clinic.
+Objective: to build a primary health care clinic for the Soweto community.
+Scope: the works include site clearance, foundations, brickwork, roofing and external works for the clinic.
+Deadline: 15 March 2025 at 11h00.
+Location: Soweto, Gauteng Province.
+Budget: R 2 500 000 including VAT.
+Bidders must have a CIDB grading of 6GB or higher.
+Bidders must have a minimum of 5 years experience in building construction.
+Only eligible bidders with a valid B-BBEE level 2 certificate will be considered.
+The contractor shall employ at least 20 employees from the local community.
+The tender documents must be submitted in a sealed envelope."""
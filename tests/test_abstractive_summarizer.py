@@ -0,0 +1,83 @@
+# tests/test_abstractive_summarizer.py
+"""Chunking and map-reduce with a word-level tokenizer and generator standing in for the model"""
+import pytest
+
+from app.services.abstractive_summarizer import AbstractiveSummarizer
+
+
+class WordTokenizer:
+    def __call__(self, sentences, add_special_tokens=False):
+        return {"input_ids": [sentence.split() for sentence in sentences]}
+
+    def decode(self, ids):
+        return " ".join(ids)
+
+
+class FakeModelSummarizer(AbstractiveSummarizer):
+    """generate() keeps the first max_tokens // 4 words of each input and records its batches"""
+
+    def __init__(self):
+        super().__init__()
+        self.chunk_tokens = 12
+        self.batch_size = 2
+        self._tokenizer = WordTokenizer()
+        self.batches = []
+
+    def _load(self):
+        pass
+
+    def generate(self, texts, max_tokens, min_tokens=0):
+        for start in range(0, len(texts), self.batch_size):
+            self.batches.append(len(texts[start:start + self.batch_size]))
+        return [" ".join(text.split()[:max(1, max_tokens // 4)]) + "." for text in texts]
+
+
+def test_chunks_hold_whole_sentences_within_the_token_budget():
+    summarizer = FakeModelSummarizer()
+    text = "One two three four. Five six seven. Eight nine ten eleven twelve. " + " ".join(["w"] * 25) + ". End here."
+
+    chunks = summarizer.chunk(text)
+
+    assert chunks[0] == "One two three four. Five six seven."
+    assert chunks[1] == "Eight nine ten eleven twelve."
+    # The overlong sentence is split on token windows of chunk_tokens - 2
+    assert [len(chunk.split()) for chunk in chunks[2:5]] == [10, 10, 5]
+    assert chunks[5] == "End here."
+    assert all(len(chunk.split()) <= summarizer.chunk_tokens - 2 for chunk in chunks)
+
+
+def test_documents_are_reduced_together_until_one_chunk_each():
+    summarizer = FakeModelSummarizer()
+    long_text = " ".join(f"Sentence number {i} of the tender." for i in range(12))
+
+    summaries = summarizer.summarize_many([long_text, "", "Short tender notice."], max_words=20)
+
+    assert summaries[1] == ""
+    assert summaries[0].startswith("Sentence number 0") and summaries[2].startswith("Short tender notice")
+    assert max(summarizer.batches) == summarizer.batch_size
+
+
+def test_truncation_prefers_a_sentence_boundary():
+    text = "The clinic must be built in Soweto. The contractor shall employ local staff for the works"
+
+    assert AbstractiveSummarizer._truncate_words(text, 10) == "The clinic must be built in Soweto."
+    assert AbstractiveSummarizer._truncate_words("one two three four", 2) == "one two..."
+    assert AbstractiveSummarizer._truncate_words("short", 10) == "short"
+
+
+def test_model_libraries_are_only_needed_when_enabled(monkeypatch):
+    monkeypatch.setenv("ABSTRACTIVE_SUMMARY_ENABLED", "false")
+    assert not AbstractiveSummarizer().is_available()
+
+    monkeypatch.setenv("ABSTRACTIVE_SUMMARY_ENABLED", "true")
+    monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+    assert not AbstractiveSummarizer().is_available()
+
+
+@pytest.mark.parametrize("quantize, expected", [("true", "int8"), ("false", "fp32")])
+def test_version_names_the_output_configuration(monkeypatch, quantize, expected):
+    monkeypatch.setenv("SUMMARY_QUANTIZE", quantize)
+    monkeypatch.setenv("SUMMARY_MODEL", "facebook/bart-large-cnn")
+    monkeypatch.setenv("SUMMARY_MAX_WORDS", "80")
+
+    assert AbstractiveSummarizer().version == f"facebook/bart-large-cnn-{expected}-w80"
@@ -0,0 +1,52 @@
+# tests/test_archive_reader.py
+import io
+
+import pytest
+
+from app.services.archive_reader import ArchiveReader, ArchiveTooLargeError
+from app.services.extraction_executor import extraction_executor
+from app.services.tender_doc_services import extract_documents_from_zip
+from tests.samples import make_docx, make_pdf, make_zip
+
+
+@pytest.fixture
+def reader(monkeypatch):
+    monkeypatch.setenv("ARCHIVE_MAX_TOTAL_BYTES", "1000")
+    monkeypatch.setenv("ARCHIVE_MAX_DEPTH", "1")
+    return ArchiveReader()
+
+
+def test_documents_are_streamed_from_nested_archives(reader):
+    pack = make_zip({
+        "notice.pdf": b"%PDF one",
+        "readme.txt": b"skipped",
+        "returnables.zip": make_zip({"forms/sbd4.docx": b"docx", "deeper.zip": make_zip({"x.pdf": b"%PDF"})}),
+    })
+
+    members = list(reader.iter_documents(io.BytesIO(pack)))
+
+    # deeper.zip is past ARCHIVE_MAX_DEPTH and is skipped
+    assert members == [("notice.pdf", b"%PDF one"), ("returnables.zip/forms/sbd4.docx", b"docx")]
+
+
+def test_decompressed_budget_is_shared_across_nested_archives(reader):
+    pack = make_zip({"a.pdf": b"a" * 600, "inner.zip": make_zip({"b.pdf": b"b" * 600})})
+
+    with pytest.raises(ArchiveTooLargeError):
+        list(reader.iter_documents(io.BytesIO(pack)))
+
+
+def test_zip_documents_are_extracted_in_archive_order(tmp_path):
+    path = tmp_path / "pack.zip"
+    path.write_bytes(make_zip({
+        "1-notice.pdf": make_pdf(["Invitation to tender"]),
+        "2-specification.docx": make_docx(["Scope of works", "Supply and install"]),
+    }))
+    try:
+        documents = extract_documents_from_zip(str(path))
+    finally:
+        extraction_executor.shutdown()
+
+    assert [document["name"] for document in documents] == ["1-notice.pdf", "2-specification.docx"]
+    assert "Invitation to tender" in documents[0]["text"]
+    assert "Supply and install" in documents[1]["text"]
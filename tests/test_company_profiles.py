@@ -0,0 +1,101 @@
+# tests/test_company_profiles.py
+from datetime import datetime
+
+import pytest
+
+from app import database
+from app.models.user_models import CompanyProfile, User
+from app.services.company_profiles import (
+    CompanyProfileCache, CompiledCompanyProfile, parse_bbbee_level, parse_cidb_grading
+)
+
+
+def _edit_elsewhere(profile_id: int, **changes):
+    """Save an edit through another session, as another uvicorn worker would"""
+    other = database.SessionLocal()
+    try:
+        other.query(CompanyProfile).filter(CompanyProfile.id == profile_id).update(changes)
+        other.commit()
+    finally:
+        other.close()
+
+
+def test_profiles_are_compiled_once_per_team(db, team_profile):
+    cache = CompanyProfileCache()
+    user = User(id=1, team_id=team_profile.team_id)
+
+    compiled = cache.get(db, user)
+
+    assert cache.get(db, user) is compiled
+    assert compiled.data["cidb_grade"] == 7 and compiled.cidb_classes == {"ce"}
+    assert compiled.annual_turnover == 10_000_000
+
+
+def test_edits_saved_by_another_worker_are_picked_up(db, team_profile):
+    cache = CompanyProfileCache()
+    user = User(id=1, team_id=team_profile.team_id)
+    compiled = cache.get(db, user)
+
+    _edit_elsewhere(team_profile.id, years_of_experience=12, updated_at=datetime(2025, 1, 1, 10, 0, 0))
+    db.expire_all()  # The next request's session
+    recompiled = cache.get(db, user)
+    assert recompiled is not compiled and recompiled.years_of_experience == 12
+
+    _edit_elsewhere(team_profile.id, years_of_experience=15, updated_at=datetime(2025, 1, 1, 10, 0, 1))
+    db.expire_all()
+    assert cache.get(db, user).years_of_experience == 15
+
+
+def test_plan_tier_changes_recompile_the_rule_set(db, team_profile):
+    cache = CompanyProfileCache()
+    user = User(id=1, team_id=team_profile.team_id)
+    compiled = cache.get(db, user)
+
+    team_profile.team.plan_tier = "pro"
+    db.commit()
+
+    recompiled = cache.get(db, user)
+    assert recompiled is not compiled and recompiled.plan_tier == "pro"
+
+
+def test_entries_expire_and_can_be_invalidated(db, team_profile):
+    cache = CompanyProfileCache()
+    user = User(id=1, team_id=team_profile.team_id)
+    compiled = cache.get(db, user)
+
+    cache.invalidate(team_profile.team_id)
+    assert cache.get(db, user) is not compiled
+
+    cache.ttl = -1
+    cache.invalidate(team_profile.team_id)
+    compiled = cache.get(db, user)
+    assert cache.get(db, user) is not compiled
+
+
+def test_demo_mode_creates_and_caches_a_profile(db):
+    cache = CompanyProfileCache()
+
+    compiled = cache.get(db, None)
+
+    assert compiled.name == "Demo Construction Company"
+    assert cache.get(db, None) is compiled
+    assert db.query(CompanyProfile).count() == 1
+
+
+@pytest.mark.parametrize("grading, expected", [
+    ("7CE", (7, {"ce"})), ("Grade 6 GB CE", (6, {"gb", "ce"})), ("", (None, set())), ("none", (None, set())),
+])
+def test_cidb_gradings(grading, expected):
+    assert parse_cidb_grading(grading) == expected
+
+
+def test_bbbee_levels():
+    assert [parse_bbbee_level(level) for level in ("Level 2", "2", None, "non-compliant")] == [2, 2, None, None]
+
+
+def test_compiled_profile_shapes(db, team_profile):
+    compiled = CompiledCompanyProfile(team_profile)
+
+    assert compiled.provinces == {"gauteng"}
+    assert compiled.data["geographic_coverage"] == ["Gauteng"]
+    assert compiled.data["sme"] and compiled.bbbee_level == 2
@@ -0,0 +1,30 @@
+# tests/test_database.py
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+from app.database import upsert_insert
+from app.models.tender_match import TenderMatchScore
+
+
+def _session(dialect):
+    return SimpleNamespace(get_bind=lambda: SimpleNamespace(dialect=dialect))
+
+
+def test_upsert_insert_follows_the_session_backend(db):
+    assert isinstance(upsert_insert(db, TenderMatchScore), sqlite.Insert)  # the test database
+
+    statement = upsert_insert(_session(postgresql.dialect()), TenderMatchScore)
+    assert isinstance(statement, postgresql.Insert)
+    statement = statement.values(
+        tender_id="t-1", company_id=1, suitability_score=50, recommendation="r")
+    statement = statement.on_conflict_do_update(
+        index_elements=["tender_id", "company_id"],
+        set_={"suitability_score": statement.excluded.suitability_score})
+    assert "ON CONFLICT (tender_id, company_id) DO UPDATE" in str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_upsert_insert_rejects_other_backends():
+    with pytest.raises(RuntimeError, match="Unsupported database backend 'mysql'"):
+        upsert_insert(_session(mysql.dialect()), TenderMatchScore)
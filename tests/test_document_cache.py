@@ -0,0 +1,57 @@
+# tests/test_document_cache.py
+import os
+
+import pytest
+
+from app.services.document_cache import DocumentCache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("DOCUMENT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("DOCUMENT_CACHE_MAX_BYTES", "100")
+    return DocumentCache()
+
+
+def test_blobs_are_content_addressed(cache):
+    sha256 = cache.put_blob(b"tender pack")
+
+    assert sha256 == DocumentCache.content_hash(b"tender pack")
+    assert cache.put_blob(b"tender pack") == sha256
+    assert cache.get_blob(sha256) == b"tender pack"
+    assert cache.get_blob("0" * 64) is None
+
+
+def test_url_index_keeps_validators(cache):
+    url = "https://etenders.example/doc.pdf"
+    sha256 = cache.store_download(url, b"%PDF body", {"etag": '"abc"', "last-modified": "Mon, 01 Sep 2025 10:00:00 GMT"})
+
+    entry = cache.lookup_url(url)
+    assert entry["sha256"] == sha256 and cache.is_fresh(entry)
+    assert DocumentCache.conditional_headers(entry) == {
+        "If-None-Match": '"abc"', "If-Modified-Since": "Mon, 01 Sep 2025 10:00:00 GMT"}
+
+    entry["fetched_at"] -= cache.max_age + 1
+    assert not cache.is_fresh(entry)
+    cache.mark_revalidated(url, entry)
+    assert cache.is_fresh(cache.lookup_url(url))
+
+
+def test_url_entry_is_dropped_with_its_blob(cache):
+    url = "https://etenders.example/doc.pdf"
+    sha256 = cache.store_download(url, b"%PDF body")
+    os.remove(cache._blob_path(sha256))
+
+    assert cache.lookup_url(url) is None
+
+
+def test_eviction_drops_least_recently_used_content_with_its_pages(cache):
+    old = cache.put_blob(b"o" * 40)
+    cache.put_pages(old, "v1", {"pages": ["old"]})
+    os.utime(cache._blob_path(old), (1, 1))
+    os.utime(cache._pages_path(old, "v1"), (1, 1))
+
+    new = cache.put_blob(b"n" * 60)
+
+    assert cache.get_blob(old) is None and cache.get_pages(old, "v1") is None
+    assert cache.get_blob(new) == b"n" * 60
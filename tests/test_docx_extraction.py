@@ -0,0 +1,55 @@
+# tests/test_docx_extraction.py
+from app.services.docx_extraction import BLOCKS_PER_PAGE, extract_docx_pages, is_docx, iter_docx_blocks
+from tests.samples import make_docx, make_zip
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+
+def _docx(body: str) -> bytes:
+    return make_zip({"word/document.xml": f'<w:document {W}><w:body>{body}</w:body></w:document>'})
+
+
+def _p(text: str) -> str:
+    return f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>"
+
+
+def _row(*cells: str) -> str:
+    return "<w:tr>" + "".join(f"<w:tc>{cell}</w:tc>" for cell in cells) + "</w:tr>"
+
+
+def test_paragraphs_and_table_rows_in_document_order():
+    document = _docx(
+        _p("Bill of quantities")
+        + "<w:p><w:r><w:t>Item</w:t><w:tab/><w:t>Rate</w:t><w:br/><w:t>excl. VAT</w:t></w:r></w:p>"
+        + "<w:tbl>" + _row(_p("1.1"), _p("Site clearance"), _p("R 12 500")) + _row(_p(""), _p(""), _p("")) + "</w:tbl>"
+        + _p("Total")
+    )
+
+    assert list(iter_docx_blocks(document)) == [
+        "Bill of quantities", "Item\tRate\nexcl. VAT", "1.1 | Site clearance | R 12 500", "Total"]
+
+
+def test_nested_table_rows_stay_inside_their_cell():
+    nested = "<w:tbl>" + _row(_p("a"), _p("b")) + "</w:tbl>"
+    document = _docx("<w:tbl>" + _row(_p("Outer"), _p("Cell text") + nested) + "</w:tbl>")
+
+    assert list(iter_docx_blocks(document)) == ["Outer | Cell text a | b"]
+
+
+def test_blocks_are_grouped_into_pseudo_pages():
+    document = make_docx([f"Paragraph {i}" for i in range(BLOCKS_PER_PAGE * 2 + 1)])
+
+    result = extract_docx_pages(document)
+    assert result["page_count"] == 3 and result["method"] == "docx-stream"
+    assert result["pages"][2] == f"Paragraph {BLOCKS_PER_PAGE * 2}"
+
+    seen = []
+    stopped = extract_docx_pages(document, on_page=lambda page: seen.append(page) or True)
+    assert len(stopped["pages"]) == 1 and len(seen) == 1
+    assert len(extract_docx_pages(document, max_pages=2)["pages"]) == 2
+
+
+def test_only_archives_with_a_word_document_are_docx():
+    assert is_docx(make_docx(["text"]))
+    assert not is_docx(make_zip({"notice.pdf": b"%PDF"}))
+    assert not is_docx(b"%PDF-1.4")
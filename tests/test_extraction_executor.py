@@ -0,0 +1,58 @@
+# tests/test_extraction_executor.py
+import asyncio
+import time
+
+import pytest
+
+from app.services.extraction_executor import ExtractionExecutor, ExtractionTimeoutError, extraction_executor
+from app.services.tender_doc_services import extract_text_from_pdf_async
+from tests.samples import make_pdf
+
+
+def _square(n):
+    if n < 0:
+        raise ValueError(f"negative: {n}")
+    return n * n
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    monkeypatch.setenv("EXTRACTION_WORKERS", "2")
+    monkeypatch.setenv("EXTRACTION_TIMEOUT", "30")
+    executor = ExtractionExecutor()
+    yield executor
+    executor.shutdown()
+
+
+def test_run_awaits_the_pool_result(executor):
+    assert asyncio.run(executor.run(_square, 7)) == 49
+
+
+def test_run_many_sync_keeps_order_and_returns_failures(executor):
+    results = executor.run_many_sync(_square, iter([3, -1, 4]))
+
+    assert results[0] == 9 and results[2] == 16
+    assert isinstance(results[1], ValueError)
+
+
+def test_timed_out_job_replaces_the_pool(executor):
+    with pytest.raises(ExtractionTimeoutError):
+        executor.run_sync(_sleep, 10, timeout=0.5)
+
+    assert executor.run_sync(_square, 5) == 25
+
+
+def test_pdf_text_is_extracted_in_the_pool(tmp_path):
+    path = tmp_path / "tender.pdf"
+    path.write_bytes(make_pdf(["Invitation to tender", "Closing date 15 March 2025"]))
+    try:
+        text = asyncio.run(extract_text_from_pdf_async(str(path)))
+    finally:
+        extraction_executor.shutdown()
+
+    assert "Invitation to tender" in text and "Closing date 15 March 2025" in text
@@ -0,0 +1,66 @@
+# tests/test_extractive_ranker.py
+"""TF-IDF + TextRank ranking and the token-budgeted selection"""
+import numpy as np
+
+from app.services.extractive_ranker import ExtractiveRanker, estimate_tokens
+
+SENTENCES = [
+    "Tender Number",  # Too short to rank
+    "The contractor shall construct the new community clinic building in Soweto.",
+    "Construction of the clinic building includes electrical and plumbing installations.",
+    "The clinic building construction must comply with the national building regulations.",
+    "Enquiries may be directed to the supply chain office during office hours.",
+    "The contractor shall construct the new community clinic building in Soweto.",
+]
+
+
+def test_tfidf_rows_are_unit_length():
+    matrix = ExtractiveRanker().tfidf(SENTENCES[1:])
+
+    assert matrix.dtype == np.float32
+    assert np.allclose(np.linalg.norm(matrix, axis=1), 1.0)
+
+
+def test_vocabulary_is_capped_to_the_most_widespread_terms():
+    ranker = ExtractiveRanker()
+    ranker.max_terms = 3
+
+    matrix = ranker.tfidf(SENTENCES[1:4])
+
+    assert matrix.shape == (3, 3)
+    # "clinic" and "building" appear in every sentence, so every row keeps weight
+    assert np.all(np.linalg.norm(matrix, axis=1) > 0)
+
+
+def test_textrank_is_a_distribution_favouring_central_sentences():
+    ranker = ExtractiveRanker()
+    vectors = ranker.tfidf(SENTENCES[1:5])
+
+    scores = ranker.textrank(vectors @ vectors.T)
+
+    assert abs(float(scores.sum()) - 1.0) < 1e-4
+    assert int(np.argmin(scores)) == 3  # The enquiries sentence shares nothing with the rest
+
+
+def test_rank_skips_sentences_outside_the_word_limits():
+    order = ExtractiveRanker().rank(SENTENCES)
+
+    assert 0 not in order
+    assert order[-1] == 4
+
+
+def test_select_fits_the_budget_in_document_order_without_duplicates():
+    budget = estimate_tokens(SENTENCES[1]) + estimate_tokens(SENTENCES[2]) + estimate_tokens(SENTENCES[3])
+
+    selected = ExtractiveRanker().select(SENTENCES, budget)
+
+    assert selected == SENTENCES[1:4]
+    assert sum(estimate_tokens(sentence) for sentence in selected) <= budget
+
+
+def test_select_with_a_small_budget_keeps_the_best_sentence():
+    ranker = ExtractiveRanker()
+    best = SENTENCES[ranker.rank(SENTENCES)[0]]
+
+    assert ranker.select(SENTENCES, estimate_tokens(best)) == [best]
+    assert ranker.select(SENTENCES, 1) == []
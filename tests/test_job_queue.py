@@ -0,0 +1,94 @@
+# tests/test_job_queue.py
+import pytest
+
+from app.models.tender_models import Tender
+from app.routes import tenders
+from app.services import job_queue as job_queue_module
+from app.services.job_queue import JobQueue
+from tests.conftest import route_client
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOB_QUEUE_DB", str(tmp_path / "jobs.db"))
+    monkeypatch.setenv("JOB_MAX_ATTEMPTS", "2")
+    queue = JobQueue()
+    queue.init_db()
+    return queue
+
+
+def _expire(queue, job_id):
+    conn = queue._connect()
+    try:
+        conn.execute("UPDATE jobs SET lease_expires_at = 0 WHERE id = ?", (job_id,))
+    finally:
+        conn.close()
+
+
+def test_one_active_job_per_tender(queue):
+    first = queue.enqueue("auto_summarize", "ocds-1")
+    again = queue.enqueue("auto_summarize", "ocds-1")
+
+    assert not first["deduplicated"] and again["deduplicated"] and again["id"] == first["id"]
+    assert queue.enqueue("auto_summarize", "ocds-2")["id"] != first["id"]
+
+    job = queue.claim("worker-a")
+    assert queue.finish(job["id"], "worker-a", result={"success": True})
+    assert queue.enqueue("auto_summarize", "ocds-1")["id"] != first["id"]
+
+
+def test_leases_belong_to_their_owner(queue):
+    job = queue.enqueue("auto_summarize", "ocds-1")
+
+    claimed = queue.claim("worker-a")
+    assert claimed["id"] == job["id"] and queue.claim("worker-b") is None
+    assert queue.renew(job["id"], "worker-a") and not queue.renew(job["id"], "worker-b")
+    assert not queue.finish(job["id"], "worker-b", result={})
+    assert queue.get(job["id"])["status"] == "running"
+
+
+def test_expired_lease_is_requeued_and_the_stale_result_discarded(queue):
+    job = queue.enqueue("auto_summarize", "ocds-1")
+    queue.claim("worker-a")
+    _expire(queue, job["id"])
+
+    reclaimed = queue.claim("worker-b")
+
+    assert reclaimed["id"] == job["id"]
+    assert queue.get(job["id"])["attempts"] == 2
+    assert not queue.finish(job["id"], "worker-a", result={"success": True})
+    assert queue.finish(job["id"], "worker-b", error="No documents")
+    assert queue.get(job["id"])["status"] == "failed"
+
+
+def test_job_interrupted_too_often_fails(queue):
+    job = queue.enqueue("auto_summarize", "ocds-1")
+    for owner in ("worker-a", "worker-b"):
+        queue.claim(owner)
+        _expire(queue, job["id"])
+
+    assert queue.claim("worker-c") is None
+    failed = queue.get(job["id"])
+    assert failed["status"] == "failed" and failed["error"] == "Interrupted too many times"
+
+
+def test_auto_summarize_is_accepted_and_polled(db, queue, monkeypatch):
+    monkeypatch.setattr(job_queue_module, "job_queue", queue)
+    monkeypatch.setattr(tenders, "job_queue", queue)
+    db.add(Tender(ocds_id="ocds-1", title="Clinic", documents=[{"url": "https://etenders.example/1.pdf"}]))
+    db.commit()
+    client = route_client(tenders.router)
+
+    accepted = client.post("/api/tenders/ocds-1/auto-summarize")
+    assert accepted.status_code == 202
+    assert accepted.headers["Location"] == accepted.json()["status_url"]
+    assert client.post("/api/tenders/ocds-1/auto-summarize").json()["deduplicated"]
+
+    job_id = accepted.json()["job_id"]
+    assert client.get(f"/api/tenders/jobs/{job_id}").json()["status"] == "queued"
+    assert client.get(f"/api/tenders/jobs/{job_id}/result").status_code == 202
+
+    job = queue.claim("worker-a")
+    queue.finish(job["id"], "worker-a", result={"success": True, "overall_summary": "Clinic construction"})
+    assert client.get(f"/api/tenders/jobs/{job_id}/result").json()["overall_summary"] == "Clinic construction"
+    assert client.get("/api/tenders/jobs/unknown").status_code == 404
@@ -0,0 +1,34 @@
+# tests/test_key_sections.py
+from app.services.tender_doc_services import RequirementScanner, extract_key_pages
+from tests.samples import make_pdf
+
+KEY_PAGES = [
+    "Objective: construction of a community clinic in Soweto",
+    "Scope: the works include site clearance, foundations, brickwork and roofing for the new clinic building",
+    "Deadline: 15 March 2025 at 11h00. Bidders must have a valid tax clearance certificate",
+]
+ANNEXURES = ["Annexure A: pricing schedule", "Annexure B: declaration of interest"]
+
+
+def test_scanner_reports_when_every_key_section_is_seen():
+    scanner = RequirementScanner()
+
+    assert [scanner.feed(page) for page in KEY_PAGES] == [False, False, True]
+    assert scanner.found == {"objective", "scope", "deadline", "eligibility"}
+
+
+def test_extraction_stops_after_the_key_sections():
+    result = extract_key_pages(make_pdf(KEY_PAGES + ANNEXURES))
+
+    assert result["stopped_early"]
+    assert len(result["pages"]) == 3 and result["page_count"] == 5
+    assert result["sections_found"] == ["deadline", "eligibility", "objective", "scope"]
+
+
+def test_extraction_stops_at_the_page_budget():
+    seen = []
+
+    result = extract_key_pages(make_pdf(ANNEXURES * 3), page_budget=4, on_page=seen.append)
+
+    assert len(result["pages"]) == 4 and len(seen) == 4
+    assert not result["stopped_early"] and result["sections_found"] == []
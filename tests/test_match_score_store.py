@@ -0,0 +1,79 @@
+# tests/test_match_score_store.py
+from datetime import datetime, timedelta
+
+from app.models.tender_match import TenderMatchScore
+from app.services import match_score_store as store_module
+from app.services.match_score_store import MatchScoreStore
+
+
+def _result(score: int, checklist=None) -> dict:
+    return {"suitability_score": score, "recommendation": f"scored {score}", "checklist": checklist or [],
+            "matched_criteria": 1, "total_criteria": 2, "criteria": {"location": {"points": score}}}
+
+
+def test_upserts_keep_one_row_per_tender_and_company(db, team_profile):
+    store = MatchScoreStore()
+    store.upsert(db, "t-1", team_profile.id, _result(40))
+    store.upsert(db, "t-1", team_profile.id, _result(70, ["✅ Location"]), user_id=3)
+    store.upsert(db, "t-1", team_profile.id + 1, _result(10))
+
+    rows = db.query(TenderMatchScore).filter(TenderMatchScore.tender_id == "t-1").all()
+    assert sorted(row.suitability_score for row in rows) == [10, 70]
+
+    stored = store.get(db, "t-1", team_profile.id)
+    assert (stored["suitability_score"], stored["checklist"], stored["criteria"]) == \
+        (70, ["✅ Location"], {"location": {"points": 70}})
+    assert store.get(db, "t-2", team_profile.id) is None
+
+
+def test_large_batches_are_split_into_several_statements(db, team_profile, monkeypatch):
+    monkeypatch.setattr(store_module, "UPSERT_BATCH_ROWS", 3)
+    store = MatchScoreStore()
+
+    store.upsert_many(db, team_profile.id, {f"t-{i}": _result(i) for i in range(10)})
+
+    assert {row.tender_id: row.suitability_score for row in store.company_scores(db, team_profile.id)} == \
+        {f"t-{i}": i for i in range(10)}
+
+
+def test_reads_are_cached_until_this_process_writes(db, team_profile):
+    store = MatchScoreStore()
+    store.upsert(db, "t-1", team_profile.id, _result(40))
+    assert store.get(db, "t-1", team_profile.id)["suitability_score"] == 40
+
+    # Another worker's write is only seen once the entry expires
+    db.query(TenderMatchScore).update({TenderMatchScore.suitability_score: 55})
+    db.commit()
+    assert store.get(db, "t-1", team_profile.id)["suitability_score"] == 40
+    store.ttl = -1
+    store.invalidate()
+    assert store.get(db, "t-1", team_profile.id)["suitability_score"] == 55
+
+    store.ttl = 30
+    store.upsert(db, "t-1", team_profile.id, _result(90))
+    assert store.get(db, "t-1", team_profile.id)["suitability_score"] == 90
+
+
+def test_lru_keeps_the_most_recent_entries(db, team_profile):
+    store = MatchScoreStore()
+    store.max_entries = 2
+    store.upsert_many(db, team_profile.id, {"a": _result(1), "b": _result(2), "c": _result(3)})
+    for tender_id in ("a", "b", "c"):
+        store.get(db, tender_id, team_profile.id)
+
+    assert list(store._entries) == [("b", team_profile.id), ("c", team_profile.id)]
+
+
+def test_history_is_most_recent_first_for_one_company(db, team_profile):
+    store = MatchScoreStore()
+    store.upsert_many(db, team_profile.id, {"a": _result(1), "b": _result(2)})
+    store.upsert(db, "c", team_profile.id + 1, _result(3))
+    db.query(TenderMatchScore).filter(TenderMatchScore.tender_id == "a").update(
+        {TenderMatchScore.updated_at: datetime.utcnow() + timedelta(minutes=1)})
+    db.commit()
+
+    history = store.history(db, team_profile.id)
+
+    assert [entry["tender_id"] for entry in history] == ["a", "b"]
+    assert all(entry["company_id"] == team_profile.id for entry in history)
+    assert store.history(db, team_profile.id, limit=1)[0]["tender_id"] == "a"
@@ -0,0 +1,26 @@
+# tests/test_pattern_bank.py
+from app.services.tender_analysis import SECTION_BANK, SECTION_PATTERNS, PatternBank, extract_pattern
+from tests.samples import TENDER_TEXT
+
+
+def test_bank_matches_the_per_pattern_extraction():
+    scanned = SECTION_BANK.scan(TENDER_TEXT)
+
+    assert scanned == {field: extract_pattern(TENDER_TEXT, patterns) for field, patterns in SECTION_PATTERNS.items()}
+    assert scanned["objective"] == "to build a primary health care clinic for the Soweto community"
+    assert scanned["location"] == "Soweto, Gauteng Province"
+
+
+def test_higher_priority_pattern_wins_even_when_it_matches_later():
+    bank = PatternBank({"deadline": [r"closing date[:\s]*([^.\n]+)", r"(\d{1,2} march \d{4})"]})
+
+    text = "Briefing on 2 March 2025. Closing date: 15 March 2025 at 11h00."
+
+    assert bank.search(text, "deadline") == "15 March 2025 at 11h00"
+    assert bank.scan("No dates here")["deadline"] == ""
+
+
+def test_multi_group_matches_join_their_groups():
+    bank = PatternBank({"budget": [r"(r)\s*(\d[\d,]*)"]})
+
+    assert bank.search("Estimated value R 250,000", "budget") == "R 250,000"
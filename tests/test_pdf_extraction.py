@@ -0,0 +1,69 @@
+# tests/test_pdf_extraction.py
+import json
+
+import pytest
+
+from app.services import pdf_extraction
+from app.services.pdf_extraction import PdfBackend, extract_pdf_pages
+from tests.samples import make_pdf
+
+
+class FakeBackend(PdfBackend):
+    def __init__(self, name, pages):
+        self.name = name
+        self.pages = pages
+
+    def open(self, source):
+        return len(self.pages), (page for page in self.pages)
+
+
+def test_pdf_backend_requires_open():
+    class NoOpen(PdfBackend):
+        name = module = "none"
+
+    with pytest.raises(TypeError):
+        PdfBackend()
+    with pytest.raises(TypeError):
+        NoOpen()
+
+
+def test_unusable_backend_falls_through_to_the_next():
+    empty = FakeBackend("empty", ["", "  "])
+    good = FakeBackend("good", ["Tender for the construction of a clinic in Gauteng."])
+
+    result = extract_pdf_pages(b"%PDF", backends=[empty, good])
+
+    assert result["method"] == "good" and result["page_count"] == 1
+
+
+def test_benchmark_order_ranks_usable_backends_by_speed(tmp_path):
+    benchmark = tmp_path / "bench_output.txt"
+    benchmark.write_text(json.dumps({"backends": [
+        {"backend": "pdfminer", "usable": True, "pages_per_second": 40},
+        {"backend": "pypdfium2", "usable": False, "pages_per_second": 900},
+        {"backend": "pdfplumber", "usable": True, "pages_per_second": 15},
+    ]}))
+
+    assert pdf_extraction._benchmark_order(str(benchmark)) == ["pdfminer", "pdfplumber"]
+    assert pdf_extraction._benchmark_order(str(tmp_path / "missing.txt")) == []
+
+
+def test_select_backends_uses_the_order_read_at_import(tmp_path, monkeypatch):
+    monkeypatch.delenv("PDF_BACKENDS", raising=False)
+    monkeypatch.setattr(pdf_extraction, "BENCHMARK_ORDER", ["pdfminer"])
+    # A benchmark file in the working directory is not read
+    (tmp_path / "bench_output.txt").write_text(json.dumps({"backends": [
+        {"backend": "pypdf2", "usable": True, "pages_per_second": 1000}]}))
+    monkeypatch.chdir(tmp_path)
+
+    available = [name for name in ["pdfminer"] + pdf_extraction.DEFAULT_BACKEND_ORDER
+                 if pdf_extraction.PDF_BACKENDS[name].is_available()]
+    assert [backend.name for backend in pdf_extraction.select_backends()] == list(dict.fromkeys(available))
+
+
+def test_every_installed_backend_reads_the_same_pages():
+    pdf = make_pdf(["Invitation to tender", "Closing date 15 March 2025"])
+
+    for backend in pdf_extraction.select_backends():
+        result = extract_pdf_pages(pdf, clean=True, backends=[backend])
+        assert [page.strip() for page in result["pages"]] == ["Invitation to tender", "Closing date 15 March 2025"]
@@ -0,0 +1,65 @@
+# tests/test_readiness_batch.py
+from app.models.user_models import User
+from app.routes import readiness
+from app.services.company_profiles import CompiledCompanyProfile
+from app.services.readiness_engine import extract_tender_features, rank_records, score_batch
+from app.services.tender_doc_services import readiness_scoring
+from tests.conftest import route_client
+
+TENDERS = {
+    "clinic": "Construction of a clinic in Gauteng. CIDB grade 6CE or higher required. Minimum 5 years experience.",
+    "software": "Supply of accounting software licences in the Western Cape. ISO 27001 certification required.",
+    "roads": "Road works and building maintenance in Gauteng. B-BBEE level 1 contributors preferred.",
+}
+
+
+def test_batch_scores_match_scoring_each_tender_alone(db, team_profile):
+    company = CompiledCompanyProfile(team_profile)
+    records = [extract_tender_features(text) for text in TENDERS.values()]
+
+    batched = score_batch(records, company.data, company.vector)
+
+    for text, result in zip(TENDERS.values(), batched):
+        single = readiness_scoring(text, company.data)
+        single.pop("tender_requirements")
+        assert result == single
+
+
+def test_ranking_is_best_first_with_limit_and_minimum(db, team_profile):
+    company = CompiledCompanyProfile(team_profile)
+    ids = list(TENDERS)
+    records = [extract_tender_features(text) for text in TENDERS.values()]
+    scores = dict(zip(ids, (result["suitability_score"] for result in score_batch(records, company.data))))
+
+    ranked = rank_records(ids, records, company.data)
+    assert [result["tender_id"] for result in ranked] == sorted(ids, key=lambda i: -scores[i])
+    assert [result["rank"] for result in ranked] == [1, 2, 3]
+
+    assert len(rank_records(ids, records, company.data, limit=1)) == 1
+    cutoff = max(scores.values())
+    assert {result["tender_id"] for result in rank_records(ids, records, company.data, min_score=cutoff)} == \
+        {i for i in ids if scores[i] == cutoff}
+
+
+def test_batch_route_scores_against_the_team_profile(db, team_profile):
+    user = User(id=1, team_id=team_profile.team_id)
+    payload = {"tenders": [{"tender_id": i, "summary": text} for i, text in TENDERS.items()]
+               + [{"tender_id": "empty", "title": " "}]}
+
+    body = route_client(readiness.router, user=user).post("/api/readiness/batch", json=payload).json()
+
+    company = CompiledCompanyProfile(team_profile)
+    expected = rank_records(list(TENDERS), [extract_tender_features(t) for t in TENDERS.values()], company.data)
+    assert body["company_used"] == "Build Co"
+    assert (body["tenders_scored"], body["skipped"]) == (3, 1)
+    assert [(r["tender_id"], r["suitability_score"]) for r in body["results"]] == \
+        [(r["tender_id"], r["suitability_score"]) for r in expected]
+
+
+def test_batch_route_caps_the_batch_size(db, team_profile, monkeypatch):
+    monkeypatch.setattr(readiness, "MAX_BATCH_TENDERS", 2)
+    payload = {"tenders": [{"tender_id": i, "summary": text} for i, text in TENDERS.items()]}
+
+    response = route_client(readiness.router).post("/api/readiness/batch", json=payload)
+
+    assert response.status_code == 413
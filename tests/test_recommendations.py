@@ -0,0 +1,79 @@
+# tests/test_recommendations.py
+import itertools
+
+import pytest
+
+from app.models.tender_models import Tender
+from app.models.user_models import User
+from app.routes import readiness
+from app.services.company_profiles import CompiledCompanyProfile
+from app.services.readiness_engine import extract_tender_features, rank_records, top_records
+from app.services.recommendations import RecommendationService
+from app.services.tender_requirements import tender_requirement_store
+from tests.conftest import route_client
+
+PARTS = [
+    ("Construction of a clinic", "Supply of laptops", "Road works and maintenance", "Cleaning services"),
+    (" in Gauteng.", " in Limpopo.", ""),
+    (" CIDB grade 6CE required.", " CIDB grade 9GB required.", ""),
+    (" Minimum 5 years experience.", " Minimum 15 years experience.", ""),
+]
+TEXTS = ["".join(parts) for parts in itertools.product(*PARTS)]
+
+
+@pytest.mark.parametrize("n, min_score", [(1, 0), (10, 0), (len(TEXTS) + 5, 0), (10, 60)])
+def test_top_n_matches_a_full_sort(db, team_profile, n, min_score):
+    company = CompiledCompanyProfile(team_profile)
+    ids = [f"t-{i}" for i in range(len(TEXTS))]
+    records = [extract_tender_features(text) for text in TEXTS]
+
+    top = top_records(ids, records, company.data, n, min_score, company.vector)
+
+    assert top == rank_records(ids, records, company.data, n, min_score, company.vector)
+
+
+def _tenders(db, *tenders):
+    for ocds_id, title, deadline in tenders:
+        db.add(Tender(ocds_id=ocds_id, title=title, description="", province="Gauteng", submission_deadline=deadline))
+    db.commit()
+
+
+def test_only_open_tenders_are_recommended(db, team_profile):
+    _tenders(db, ("open", "Construction of a clinic", "2999-01-01T11:00:00"),
+             ("undated", "Road works", None), ("closed", "Construction of a school", "2000-01-01T11:00:00"))
+
+    results = RecommendationService().recommend(db, CompiledCompanyProfile(team_profile))["results"]
+
+    assert {result["tender_id"] for result in results} == {"open", "undated"}
+    assert all(result["province"] == "Gauteng" for result in results)
+
+
+def test_rankings_are_cached_until_the_tenders_or_profile_change(db, team_profile):
+    service = RecommendationService()
+    profile = CompiledCompanyProfile(team_profile)
+    _tenders(db, ("a", "Construction of a clinic", None))
+
+    assert not service.recommend(db, profile)["cached"]
+    assert service.recommend(db, profile)["cached"]
+
+    _tenders(db, ("b", "Road works", None))
+    tender_requirement_store.save(db, "b", "Road works", "ingest")  # As /tenders ingest stores it
+    refreshed = service.recommend(db, profile)
+    assert not refreshed["cached"] and {r["tender_id"] for r in refreshed["results"]} == {"a", "b"}
+
+    team_profile.years_of_experience = 1
+    db.commit()
+    assert not service.recommend(db, CompiledCompanyProfile(team_profile))["cached"]
+
+
+def test_recommended_endpoint_limits_results(db, team_profile):
+    _tenders(db, *((f"t-{i}", text, None) for i, text in enumerate(TEXTS[:12])))
+    client = route_client(readiness.router, user=User(id=1, team_id=team_profile.team_id))
+
+    body = client.get("/api/readiness/recommended?limit=5").json()
+
+    assert body["company_used"] == "Build Co"
+    assert [result["rank"] for result in body["results"]] == [1, 2, 3, 4, 5]
+    scores = [result["suitability_score"] for result in body["results"]]
+    assert scores == sorted(scores, reverse=True)
+    assert client.get("/api/readiness/recommended?limit=5").json()["cached"]
@@ -0,0 +1,95 @@
+# tests/test_rescoring.py
+from app.services import readiness_engine, scoring_rules
+from app.services.company_profiles import CompiledCompanyProfile
+from app.services.match_score_store import match_score_store
+from app.services.readiness_engine import (
+    CompiledRuleSet, changed_profile_criteria, rule_set_changed, score_batch,
+)
+from app.services.rescoring import rescore_company, rescore_tenders
+from app.services.tender_requirements import tender_requirement_store
+
+TENDER_TEXT = "Construction of a clinic in Gauteng. CIDB grade 6CE or higher required. Minimum 5 years experience."
+
+
+def _result(score: int, depends_on=None, criteria=True) -> dict:
+    result = {"suitability_score": score, "recommendation": "stored", "checklist": [],
+              "matched_criteria": 0, "total_criteria": 6}
+    if criteria:
+        result["criteria"] = {"location": {"points": 0}}
+    if depends_on is not None:
+        result["depends_on"] = depends_on
+    return result
+
+
+def _scores(db, company_id) -> dict:
+    db.expire_all()
+    return {row.tender_id: row.suitability_score for row in match_score_store.company_scores(db, company_id)}
+
+
+def test_dependent_scores_follow_the_dependency_mask(db, team_profile):
+    match_score_store.upsert_many(db, team_profile.id, {
+        "t-location": _result(50, ["location"]),
+        "t-fixed": _result(50, []),                   # depends on no company field (mask 0)
+        "t-unknown": _result(50, criteria=False),     # stored without per-criterion results
+    })
+
+    def dependent(criteria):
+        return {row.tender_id for row in match_score_store.dependent_scores(db, team_profile.id, criteria)}
+
+    assert dependent(["location"]) == {"t-location", "t-unknown"}
+    assert dependent(["industry"]) == {"t-unknown"}
+    assert set(_scores(db, team_profile.id)) == {"t-location", "t-fixed", "t-unknown"}
+
+
+def test_rule_set_change_rescores_scores_that_depend_on_nothing(db, team_profile, monkeypatch):
+    tender_requirement_store.save(db, "t-fixed", TENDER_TEXT, "ingest")
+    record = tender_requirement_store.get(db, "t-fixed")
+    previous = CompiledCompanyProfile(team_profile)
+    stored = score_batch([record], previous.data, previous.vector)[0]
+    match_score_store.upsert(db, "t-fixed", team_profile.id, {**stored, "depends_on": []})
+
+    # Pro-tier companies move to a rule set that weighs certification far more
+    monkeypatch.setitem(readiness_engine.RULE_SETS, "strict", CompiledRuleSet("strict", scoring_rules._merge(
+        scoring_rules.DEFAULT_RULE_SET, {"criteria": {"certification": {"weight": 100}, "location": None}})))
+    monkeypatch.setitem(scoring_rules.RULE_SET_SELECTION, "tier:pro", "strict")
+    team_profile.team.plan_tier = "pro"
+    db.commit()
+    updated = CompiledCompanyProfile(team_profile)
+    expected = score_batch([record], updated.data, updated.vector)[0]["suitability_score"]
+    assert expected != stored["suitability_score"]
+
+    assert rule_set_changed(previous.data, updated.data)
+    rescored = rescore_company(db, updated, changed_profile_criteria(previous.data, updated.data), True)
+
+    assert rescored == 1
+    assert _scores(db, team_profile.id) == {"t-fixed": expected}
+
+
+def test_profile_edit_deletes_scores_without_a_requirement_record(db, team_profile):
+    tender_requirement_store.save(db, "t-known", TENDER_TEXT, "ingest")
+    match_score_store.upsert_many(db, team_profile.id, {
+        "t-known": _result(50, ["experience"]),
+        "t-unrecorded": _result(50, ["experience"]),
+    })
+    team_profile.years_of_experience = 1
+    db.commit()
+
+    rescored = rescore_company(db, CompiledCompanyProfile(team_profile), ["experience"])
+
+    assert rescored == 1
+    assert set(_scores(db, team_profile.id)) == {"t-known"}
+    assert match_score_store.get(db, "t-unrecorded", team_profile.id) is None
+
+
+def test_amended_tender_is_rescored_for_every_company(db, team_profile):
+    tender_requirement_store.save(db, "t-1", "Supply of stationery to a school.", "ingest")
+    profile = CompiledCompanyProfile(team_profile)
+    first = score_batch([tender_requirement_store.get(db, "t-1")], profile.data, profile.vector)[0]
+    match_score_store.upsert(db, "t-1", team_profile.id, first)
+
+    amended = tender_requirement_store.save(db, "t-1", TENDER_TEXT, "documents")
+    assert amended
+    assert rescore_tenders(db, amended) == 1
+
+    expected = score_batch([tender_requirement_store.get(db, "t-1")], profile.data, profile.vector)[0]
+    assert _scores(db, team_profile.id) == {"t-1": expected["suitability_score"]}
@@ -0,0 +1,77 @@
+# tests/test_scoring_rules.py
+import json
+
+import pytest
+
+from app.services import readiness_engine, scoring_rules
+from app.services.readiness_engine import CRITERIA, CompiledRuleSet, Criterion, extract_tender_features, score_batch
+from app.services.scoring_rules import DEFAULT_RULE_SET, _merge, load_rule_sets, rule_set_for
+
+RECORD = extract_tender_features("Construction of a clinic in Gauteng. CIDB grade 6CE or higher required.")
+COMPANY = {"industry": "Construction", "services": [], "certifications": [], "geographic_coverage": ["Limpopo"],
+           "years_of_experience": 8, "annual_turnover": 0, "employee_count": 10, "black_owned": False,
+           "cidb_grade": None, "bbbee_level": None}
+
+
+def test_rule_sets_override_the_default_key_by_key():
+    merged = _merge(DEFAULT_RULE_SET, {"criteria": {"experience": {"weight": 40}, "location": None}})
+
+    assert merged["criteria"]["experience"] == {"weight": 40, "unmet_points": 10}
+    assert "location" not in merged["criteria"]
+    assert DEFAULT_RULE_SET["criteria"]["experience"]["weight"] == 20  # The default is not modified
+
+
+def test_switched_off_criteria_leave_the_score_and_checklist(monkeypatch):
+    monkeypatch.setitem(readiness_engine.RULE_SETS, "no-certification", CompiledRuleSet(
+        "no-certification", _merge(DEFAULT_RULE_SET, {"criteria": {"certification": None}})))
+
+    default = score_batch([RECORD], COMPANY)[0]
+    without = score_batch([RECORD], {**COMPANY, "rule_set": "no-certification"})[0]
+
+    assert "certification" in default["depends_on"] and "certification" not in without["depends_on"]
+    assert len(without["checklist"]) < len(default["checklist"])
+    assert without["suitability_score"] > default["suitability_score"]  # The missing CIDB grading no longer counts
+
+
+def test_unknown_or_unweighted_rule_sets_fail_when_compiled():
+    with pytest.raises(ValueError, match="unknown criteria: turnover"):
+        CompiledRuleSet("bad", {"criteria": {"turnover": {"weight": 10}}})
+    with pytest.raises(ValueError, match="no weighted criteria"):
+        CompiledRuleSet("empty", {"criteria": {"industry": {"weight": 0}}})
+
+
+def test_plugins_missing_a_method_cannot_be_configured(monkeypatch):
+    class PartialCriterion(Criterion):
+        name = "partial"
+
+        def evaluate(self, matrix, vector, records, company):
+            return {"points": 0}
+
+    monkeypatch.setitem(CRITERIA, "partial", PartialCriterion)
+
+    with pytest.raises(TypeError, match="abstract"):
+        CompiledRuleSet("partial", {"criteria": {"partial": {"weight": 10}}})
+
+
+def test_rule_sets_are_selected_by_sector_before_plan_tier(monkeypatch):
+    monkeypatch.setattr(scoring_rules, "RULE_SET_SELECTION", {"sector:security": "guarding", "tier:pro": "pro"})
+
+    assert rule_set_for("pro", "Security Services") == "guarding"
+    assert rule_set_for("pro", "Construction") == "pro"
+    assert rule_set_for(None, "Construction") == "default"
+
+
+def test_rule_sets_load_from_a_json_file(tmp_path, monkeypatch):
+    rules_file = tmp_path / "rules.json"
+    rules_file.write_text(json.dumps({
+        "rule_sets": {"public-works": {"criteria": {"certification": {"weight": 30}}}},
+        "selection": {"sector:civil": "public-works"},
+    }))
+    monkeypatch.setenv("SCORING_RULES_FILE", str(rules_file))
+    monkeypatch.setattr(scoring_rules, "RULE_SET_SELECTION", {})
+
+    rule_sets = load_rule_sets()
+
+    assert rule_sets["public-works"]["criteria"]["certification"] == {"weight": 30, "points_per_certification": 5}
+    assert rule_sets["default"] == DEFAULT_RULE_SET
+    assert rule_set_for("free", "Civil Engineering") == "public-works"
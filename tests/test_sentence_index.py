@@ -0,0 +1,45 @@
+# tests/test_sentence_index.py
+from app.services.tender_analysis import SENTENCE_CATEGORIES, SentenceIndex
+from tests.samples import TENDER_TEXT
+
+
+def _naive_categories(sentence_lower: str) -> set:
+    return {category for category, keywords in SENTENCE_CATEGORIES.items()
+            if any(keyword in sentence_lower for keyword in keywords)}
+
+
+def test_one_scan_per_category_matches_testing_every_keyword_per_sentence():
+    index = SentenceIndex(TENDER_TEXT, TENDER_TEXT.lower())
+
+    assert index.categories == [_naive_categories(sentence) for sentence in index.sentences_lower]
+    for category in SENTENCE_CATEGORIES:
+        assert index.sentences_in(category) == [
+            sentence for sentence, lower in zip(index.sentences, index.sentences_lower)
+            if category in _naive_categories(lower)
+        ]
+
+
+def test_offsets_point_back_into_the_text():
+    index = SentenceIndex(TENDER_TEXT, TENDER_TEXT.lower())
+
+    assert len(index) == len(TENDER_TEXT.split('.'))
+    for sentence, (start, end) in zip(index.sentences, index.offsets):
+        assert TENDER_TEXT[start:end].strip() == sentence
+
+
+def test_categories_in_collects_the_categories_of_a_category_sentences():
+    index = SentenceIndex(TENDER_TEXT, TENDER_TEXT.lower())
+
+    categories = index.categories_in('experience', 10)
+
+    assert {'experience', 'requirement'} <= categories
+    assert index.categories_in('experience', 0) == set()
+
+
+def test_lowercasing_that_changes_length_keeps_sentence_indices():
+    # 'İ' lowercases to two code points, shifting offsets in the lowercased text
+    text = "İİİ intro. Bidders must be eligible. Staff of 20 employees."
+    index = SentenceIndex(text, text.lower())
+
+    assert index.sentences_in('eligibility') == ["Bidders must be eligible"]
+    assert index.sentences_in('capacity') == ["Staff of 20 employees"]
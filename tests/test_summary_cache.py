@@ -0,0 +1,110 @@
+# tests/test_summary_cache.py
+"""Summary cache tiers: LRU with TTL, Mongo only once connected, one computation per text"""
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.Mongodatabase.mongodb import mongodb
+from app.services import summary_cache as summary_cache_module
+from app.services.summary_cache import SummaryCache
+
+
+class FakeCollection:
+    def __init__(self, docs=None):
+        self.docs = docs or {}
+
+    async def find_one(self, query):
+        doc = self.docs.get(query["_id"])
+        return doc if doc and doc["expires_at"] > query["expires_at"]["$gt"] else None
+
+    async def update_one(self, query, update, upsert=False):
+        self.docs[query["_id"]] = {"_id": query["_id"], **update["$set"]}
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    computed = []
+
+    def compute(text):
+        computed.append(text)
+        time.sleep(0.05)
+        return {"summary": text.upper(), "highlights": [], "values": {}}
+
+    monkeypatch.setattr(SummaryCache, "_compute", staticmethod(compute))
+    monkeypatch.setattr(mongodb, "connected", False)
+    cache = SummaryCache()
+    cache.computed = computed
+    return cache
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    cache.max_entries = 2
+    cache.put_local("a", {"n": 1})
+    cache.put_local("b", {"n": 2})
+    cache.get_local("a")
+    cache.put_local("c", {"n": 3})
+
+    assert cache.get_local("b") is None
+    assert cache.get_local("a") == {"n": 1} and cache.get_local("c") == {"n": 3}
+
+
+def test_expired_entries_are_dropped(cache):
+    cache.put_local("a", {"n": 1}, expires_at=time.time() - 1)
+
+    assert cache.get_local("a") is None
+    assert "a" not in cache._entries
+
+
+def test_mongo_is_not_touched_until_connected(cache, monkeypatch):
+    def unavailable(name):
+        raise AssertionError("lookup against a disconnected MongoDB")
+
+    monkeypatch.setattr(mongodb, "get_collection", unavailable)
+
+    assert asyncio.run(cache.get_remote("key")) is None
+    assert asyncio.run(cache.get_or_compute("tender text"))["cache"] == "miss"
+
+
+def test_results_come_from_memory_then_mongo(cache, monkeypatch):
+    collection = FakeCollection()
+    monkeypatch.setattr(mongodb, "connected", True)
+    monkeypatch.setattr(mongodb, "get_collection", lambda name: collection)
+
+    assert asyncio.run(cache.get_or_compute("tender text"))["cache"] == "miss"
+    assert asyncio.run(cache.get_or_compute("tender text"))["cache"] == "memory"
+
+    fresh = SummaryCache()  # Another worker: empty tier 1, shared tier 2
+    result = asyncio.run(fresh.get_or_compute("tender text"))
+    assert result["cache"] == "mongo" and result["summary"] == "TENDER TEXT"
+    assert cache.computed == ["tender text"]
+
+
+def test_expired_mongo_documents_are_recomputed(cache, monkeypatch):
+    collection = FakeCollection({cache.key("tender text"): {
+        "summary": "stale", "highlights": [], "values": {}, "expires_at": datetime.utcnow() - timedelta(seconds=1)
+    }})
+    monkeypatch.setattr(mongodb, "connected", True)
+    monkeypatch.setattr(mongodb, "get_collection", lambda name: collection)
+
+    result = asyncio.run(cache.get_or_compute("tender text"))
+
+    assert result["cache"] == "miss" and result["summary"] == "TENDER TEXT"
+
+
+def test_concurrent_requests_share_one_computation(cache):
+    async def run():
+        return await asyncio.gather(*(cache.get_or_compute("tender text") for _ in range(5)))
+
+    results = asyncio.run(run())
+
+    assert cache.computed == ["tender text"]
+    assert sorted(result["cache"] for result in results) == ["memory"] * 4 + ["miss"]
+
+
+def test_format_changes_move_to_new_keys(cache, monkeypatch):
+    before = cache.key("tender text")
+    monkeypatch.setattr(summary_cache_module, "SUMMARY_FORMAT_VERSION", "next")
+
+    assert cache.key("tender text") != before
@@ -0,0 +1,80 @@
+# tests/test_summary_inference.py
+"""The inference worker's authkey check, batching and client round trips over a local socket"""
+import socket
+import threading
+import time
+
+import pytest
+
+from app.services.summary_inference import (
+    MIN_AUTHKEY_BYTES, InferenceAuthError, InferenceClient, InferenceServer, _authkey
+)
+
+AUTHKEY = "k" * MIN_AUTHKEY_BYTES
+
+
+class RecordingSummarizer:
+    def __init__(self):
+        self.calls = []
+
+    def summarize_many(self, texts, max_words=None):
+        self.calls.append((list(texts), max_words))
+        if any(text == "fail" for text in texts):
+            raise ValueError("model failed")
+        return [f"{text[:5]}/{max_words}" for text in texts]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    monkeypatch.setenv("INFERENCE_WORKER_ADDRESS", f"127.0.0.1:{_free_port()}")
+    monkeypatch.setenv("INFERENCE_WORKER_AUTHKEY", AUTHKEY)
+    monkeypatch.setenv("INFERENCE_MAX_WAIT_MS", "200")
+    server = InferenceServer(RecordingSummarizer())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = InferenceClient()
+    deadline = time.monotonic() + 5
+    while not client.ping(timeout=1):
+        assert time.monotonic() < deadline, "inference worker did not start"
+        time.sleep(0.05)
+    return server, client
+
+
+@pytest.mark.parametrize("authkey", ["", "short-secret"])
+def test_missing_or_short_authkeys_are_refused(monkeypatch, authkey):
+    monkeypatch.setenv("INFERENCE_WORKER_AUTHKEY", authkey)
+
+    with pytest.raises(InferenceAuthError):
+        _authkey()
+
+
+def test_concurrent_requests_share_one_batch_per_length_cap(worker):
+    server, client = worker
+
+    futures = [client.submit(f"text {i}", 40) for i in range(3)] + [client.submit("other", 10)]
+    results = [future.result(5) for future in futures]
+
+    assert results == ["text /40", "text /40", "text /40", "other/10"]
+    assert sorted(len(texts) for texts, _ in server.summarizer.calls) == [1, 3]
+
+
+def test_a_failed_batch_fails_only_its_own_requests(worker):
+    _, client = worker
+
+    failing, passing = client.submit("fail", 5), client.submit("fine", 6)
+
+    with pytest.raises(RuntimeError, match="model failed"):
+        failing.result(5)
+    assert passing.result(5) == "fine/6"
+
+
+def test_clients_with_the_wrong_authkey_are_rejected(worker, monkeypatch):
+    monkeypatch.setenv("INFERENCE_WORKER_AUTHKEY", "x" * MIN_AUTHKEY_BYTES)
+
+    assert not InferenceClient().ping(timeout=1)
+    assert worker[1].ping(timeout=1)  # The worker keeps serving
@@ -0,0 +1,40 @@
+# tests/test_tender_analysis.py
+from app.services import tender_analysis
+from app.services.tender_analysis import TenderAnalysisCache, analyze_text, tender_analysis_cache
+from app.services.tender_doc_services import extract_tender_requirements, highlight_key_points, summarize_text
+from tests.samples import TENDER_TEXT
+
+
+def test_summary_highlights_and_requirements_share_one_parse(monkeypatch):
+    parses = []
+
+    class CountingAnalysis(tender_analysis.TenderAnalysis):
+        def __init__(self, *args, **kwargs):
+            parses.append(1)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(tender_analysis, "TenderAnalysis", CountingAnalysis)
+    tender_analysis_cache.clear()
+
+    summary = summarize_text(TENDER_TEXT)
+    highlights = highlight_key_points(TENDER_TEXT)
+    requirements = extract_tender_requirements(TENDER_TEXT)
+
+    assert len(parses) == 1
+    assert analyze_text(TENDER_TEXT) is analyze_text(TENDER_TEXT)
+    assert "Soweto" in summary and any(point.startswith("⏰ Deadline") for point in highlights)
+    assert requirements["deadline"] == "15 March 2025 at 11h00"
+    assert requirements["budget_amount"] == 2500000
+
+
+def test_analysis_cache_is_a_bounded_lru(monkeypatch):
+    monkeypatch.setenv("TENDER_ANALYSIS_CACHE_SIZE", "2")
+    cache = TenderAnalysisCache()
+
+    first = cache.get("first tender")
+    cache.get("second tender")
+    assert cache.get("first tender") is first  # now most recently used
+    cache.get("third tender")
+
+    assert cache.get("first tender") is first
+    assert len(cache._entries) == 2 and tender_analysis.text_hash("second tender") not in cache._entries
@@ -0,0 +1,33 @@
+# tests/test_tender_requirements.py
+from app.models.tender_requirements import TenderRequirements
+from app.services.tender_requirements import tender_requirement_store
+
+INGEST_TEXT = "Construction of a clinic in Gauteng. CIDB grade 6CE or higher required. Minimum 5 years experience."
+POSTED_TEXT = "IT support services in Limpopo. CIDB grade 2GB. Minimum 1 year experience."
+
+
+def _source(db, tender_id):
+    db.expire_all()
+    return db.query(TenderRequirements.source).filter(TenderRequirements.tender_id == tender_id).scalar()
+
+
+def test_posted_text_only_fills_a_gap(db):
+    tender_requirement_store.save(db, "ocds-1", POSTED_TEXT, "posted")
+    assert _source(db, "ocds-1") == "posted"
+
+    # Ingest replaces the posted record, and posted text never replaces it back
+    amended = tender_requirement_store.save(db, "ocds-1", INGEST_TEXT, "ingest")
+    assert "ocds-1" in amended
+    assert tender_requirement_store.save(db, "ocds-1", POSTED_TEXT, "posted") == {}
+    assert _source(db, "ocds-1") == "ingest"
+    assert tender_requirement_store.get(db, "ocds-1")["cidb_grade"] == 6
+
+
+def test_documents_replace_ingest_but_not_the_reverse(db):
+    tender_requirement_store.save(db, "ocds-1", INGEST_TEXT, "ingest")
+    tender_requirement_store.save(db, "ocds-1", POSTED_TEXT, "documents")
+    assert _source(db, "ocds-1") == "documents"
+
+    records, amended = tender_requirement_store.save_many(db, {"ocds-1": INGEST_TEXT}, "ingest")
+    assert records == {} and amended == {}
+    assert _source(db, "ocds-1") == "documents"
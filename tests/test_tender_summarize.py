@@ -0,0 +1,80 @@
+# tests/test_tender_summarize.py
+import json
+
+from app.models.tender_models import Tender
+from app.models.tender_requirements import TenderRequirements
+from app.routes import tender_summarize
+from app.services.tender_requirements import tender_requirement_store
+from tests.conftest import route_client
+
+TENDER_TEXT = "Construction of a clinic in Gauteng. CIDB grade 6CE or higher required. Minimum 5 years experience."
+
+
+def _posted(tender_id, description="Supply of IT equipment in Limpopo. CIDB grade 2GB."):
+    return {"tender_data": json.dumps({"tender_id": tender_id, "title": "Posted tender", "description": description})}
+
+
+def test_summarize_does_not_store_records_for_unknown_tenders(db):
+    response = route_client(tender_summarize.router).post("/api/tenders/summarize", data=_posted("made-up-id"))
+
+    assert response.status_code == 200 and response.json()["success"]
+    assert db.query(TenderRequirements).count() == 0
+
+
+def test_summarize_never_replaces_an_ingest_record(db):
+    db.add(Tender(ocds_id="ocds-1", title="Clinic"))
+    db.commit()
+    tender_requirement_store.save(db, "ocds-1", TENDER_TEXT, "ingest")
+
+    response = route_client(tender_summarize.router).post("/api/tenders/summarize", data=_posted("ocds-1"))
+
+    assert response.status_code == 200
+    db.expire_all()
+    row = db.query(TenderRequirements).filter(TenderRequirements.tender_id == "ocds-1").one()
+    assert row.source == "ingest" and row.cidb_grade == 6
+
+
+def test_summarize_stores_a_posted_record_for_a_known_tender(db):
+    db.add(Tender(ocds_id="ocds-1", title="Clinic"))
+    db.commit()
+
+    route_client(tender_summarize.router).post("/api/tenders/summarize", data=_posted("ocds-1", TENDER_TEXT))
+
+    assert db.query(TenderRequirements.source).filter(TenderRequirements.tender_id == "ocds-1").scalar() == "posted"
+
+
+def _events(response):
+    """[(event, data), ...] from a Server-Sent Events body"""
+    events = []
+    for block in response.text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_summarize_from_data_stream_completes_and_stores_the_record(db):
+    db.add(Tender(ocds_id="ocds-1", title="Clinic"))
+    db.commit()
+    tender = {"tender_id": "ocds-1", "title": "Clinic construction", "description": TENDER_TEXT,
+              "province": "Gauteng", "value": {"amount": "R 2 500 000"}}
+
+    response = route_client(tender_summarize.router).post("/api/tenders/summarize-from-data/stream", json=tender)
+
+    assert response.status_code == 200
+    events = _events(response)
+    assert [name for name, _ in events][0] == "status"
+    assert events[-1][0] == "complete" and events[-1][1]["tender_id"] == "ocds-1"
+    assert tender_requirement_store.get(db, "ocds-1")["cidb_grade"] == 6
+
+
+def test_summarize_stream_stores_the_record_before_completing(db):
+    db.add(Tender(ocds_id="ocds-1", title="Clinic"))
+    db.commit()
+
+    response = route_client(tender_summarize.router).post("/api/tenders/summarize/stream",
+                                                          data=_posted("ocds-1", TENDER_TEXT))
+
+    events = _events(response)
+    assert events[-1][0] == "complete"
+    assert any(name == "section" for name, _ in events)
+    assert tender_requirement_store.get(db, "ocds-1") is not None
@@ -0,0 +1,69 @@
+# tests/test_upload_service.py
+import hashlib
+import os
+import tempfile
+
+import pytest
+
+from app.routes import tender_summarize
+from app.services.document_cache import document_cache
+from app.services.extraction_executor import extraction_executor
+from app.services.upload_service import upload_service
+from tests.conftest import route_client
+from tests.samples import make_docx, make_pdf, make_zip
+
+PAGES = ["Objective: construction of a community clinic in Soweto", "Closing date 15 March 2025"]
+
+
+@pytest.fixture(autouse=True)
+def upload_dirs(tmp_path, monkeypatch):
+    """Cached text and upload copies go to the test's directory; the pool is shut down afterwards"""
+    monkeypatch.setattr(document_cache, "blob_dir", str(tmp_path / "cache" / "blobs"))
+    monkeypatch.setattr(document_cache, "url_dir", str(tmp_path / "cache" / "urls"))
+    uploads = tmp_path / "uploads"
+    uploads.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(uploads))
+    yield uploads
+    extraction_executor.shutdown()
+
+
+def _summarize(name, data):
+    return route_client(tender_summarize.router).post("/api/tenders/summarize", files={"file": (name, data)})
+
+
+@pytest.mark.parametrize("name, data", [
+    ("tender.pdf", make_pdf(PAGES)),
+    ("tender.docx", make_docx(PAGES)),
+    ("pack.zip", make_zip({"notice.pdf": make_pdf(PAGES)})),
+])
+def test_uploaded_documents_are_summarized(db, name, data):
+    response = _summarize(name, data)
+
+    body = response.json()
+    assert response.status_code == 200 and body["success"]
+    assert body["tender_id"] == f"upload-{hashlib.sha256(data).hexdigest()[:16]}"
+    assert "clinic" in body["summary"].lower()
+
+
+def test_extracted_text_is_cached_by_content(db):
+    data = make_pdf(PAGES)
+    _summarize("tender.pdf", data)
+
+    cached = document_cache.get_pages(hashlib.sha256(data).hexdigest(), upload_service.extraction_variant)
+    assert "Closing date 15 March 2025" in cached["text"]
+
+
+def test_large_upload_goes_to_the_worker_by_path_and_is_removed(db, upload_dirs, monkeypatch):
+    monkeypatch.setattr(upload_service, "chunk_size", 256)
+
+    response = _summarize("tender.pdf", make_pdf(PAGES))
+
+    assert response.json()["success"]
+    assert [name for name in os.listdir(upload_dirs) if name.startswith("upload-")] == []
+
+
+def test_rejected_uploads(db, monkeypatch):
+    assert _summarize("notes.txt", b"plain text").status_code == 415
+
+    monkeypatch.setattr(upload_service, "max_upload_bytes", 100)
+    assert _summarize("tender.pdf", make_pdf(PAGES)).status_code == 413
@@ -0,0 +1,82 @@
+# tests/test_value_normalizer.py
+"""Typed deadlines and ZAR budgets from the raw strings the section patterns extract"""
+from datetime import date, datetime
+
+import pytest
+
+from app.services.value_normalizer import (
+    normalize_requirements, parse_date, parse_relative_days, parse_zar_amount, resolve_deadline
+)
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("15 March 2025 at 11h00", datetime(2025, 3, 15, 11, 0)),
+    ("15/03/2025", datetime(2025, 3, 15)),
+    ("15-03-25 11:30", datetime(2025, 3, 15, 11, 30)),
+    ("2025-04-01 at 2 pm", datetime(2025, 4, 1, 14, 0)),
+    ("Friday 15th of Mar 2025, 11.00am", datetime(2025, 3, 15, 11, 0)),
+    ("March 15, 2025 12 pm", datetime(2025, 3, 15, 12, 0)),
+    ("31/02/2025 or 01/03/2025", datetime(2025, 3, 1)),
+    ("30 days from publication", None),
+    (None, None),
+])
+def test_dates_are_read_day_first(raw, expected):
+    assert parse_date(raw) == expected
+
+
+@pytest.mark.parametrize("raw, days", [
+    ("30 days from publication", 30),
+    ("within 14 working days", 14),
+    ("two weeks after the briefing session", 14),
+    ("twenty-one (21) days", 21),
+    ("3 months", 90),
+    ("as soon as possible", None),
+])
+def test_relative_deadlines_count_days(raw, days):
+    assert parse_relative_days(raw) == days
+
+
+def test_relative_deadlines_resolve_from_a_reference_date():
+    assert resolve_deadline("30 days from publication", date(2025, 3, 1)) == datetime(2025, 3, 31)
+    assert resolve_deadline("30 days from publication") is None
+    assert resolve_deadline("15/03/2025", date(2025, 1, 1)) == datetime(2025, 3, 15)
+
+
+@pytest.mark.parametrize("raw, amount", [
+    ("R 5,000,000", 5_000_000),
+    ("R5 000 000.00", 5_000_000),
+    ("R 1 500 000,00", 1_500_000),
+    ("R 5.000.000", 5_000_000),
+    ("R 250.000", 250_000),
+    ("R 1.250 million", 1_250_000),
+    ("R2.5 million", 2_500_000),
+    ("ZAR 3.2bn", 3_200_000_000),
+    ("R500k", 500_000),
+    ("5 million rand", 5_000_000),
+    ("R 2,5 million", 2_500_000),
+    ("Phase 2 of 2025, 20 m of road, 500k", None),
+    ("USD 5,000,000", None),
+    ("R 200 000 or R 1 000 000", 1_000_000),
+])
+def test_zar_amounts(raw, amount):
+    assert parse_zar_amount(raw) == amount
+
+
+def test_normalize_requirements_restores_values_cut_at_the_first_dot():
+    text = "Budget: R 2.5 million for the works.\nClosing date: 15/03/2025 at 11h00 sharp\n"
+
+    values = normalize_requirements({"budget": "R 2", "deadline": "15/03/2025"}, text)
+
+    assert values == {
+        "deadline_date": datetime(2025, 3, 15, 11, 0),
+        "deadline_days": None,
+        "budget_amount": 2_500_000,
+        "budget_currency": "ZAR",
+    }
+
+
+def test_normalize_requirements_keeps_relative_deadlines_as_days():
+    values = normalize_requirements({"deadline": "30 days from publication", "budget": "not disclosed"})
+
+    assert values["deadline_date"] is None and values["deadline_days"] == 30
+    assert values["budget_amount"] is None
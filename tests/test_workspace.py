@@ -0,0 +1,67 @@
+# tests/test_workspace.py
+from app.models import user_models
+from app.models.workspace import WorkspaceTender
+from app.routes import workspace
+from app.services.match_score_store import match_score_store
+from tests.conftest import route_client
+
+
+def _result(score: int) -> dict:
+    return {"suitability_score": score, "recommendation": f"scored {score}"}
+
+
+def _listed(user, sort="match"):
+    response = route_client(workspace.router, user=user).get(f"{workspace.router.prefix}/tenders?sort={sort}")
+    return [(tender["tender_id"], tender["match_score"]) for tender in response.json()["tenders"]]
+
+
+def _team(db, name, industry):
+    team = user_models.Team(name=name)
+    db.add(team)
+    db.commit()
+    profile = user_models.CompanyProfile(company_name=name, industry_sector=industry,
+                                         services_provided=industry, team_id=team.id)
+    db.add(profile)
+    db.commit()
+    return user_models.User(id=team.id, team_id=team.id), profile
+
+
+def test_each_team_lists_its_own_scores(db):
+    user_a, profile_a = _team(db, "A", "Construction")
+    user_b, profile_b = _team(db, "B", "IT")
+    for tender_id in ("x", "y"):
+        db.add(WorkspaceTender(tender_id=tender_id, title=tender_id, user_id=1, company_id=1))
+    db.commit()
+    match_score_store.upsert_many(db, profile_a.id, {"x": _result(90), "y": _result(10)})
+    match_score_store.upsert_many(db, profile_b.id, {"x": _result(5), "y": _result(80)})
+
+    assert _listed(user_a) == [("x", 90), ("y", 10)]
+    assert _listed(user_b) == [("y", 80), ("x", 5)]
+
+
+def test_saved_score_is_served_until_the_team_has_its_own(db):
+    user, profile = _team(db, "A", "Construction")
+    db.add_all([
+        WorkspaceTender(tender_id="saved", title="saved", user_id=1, company_id=1, match_score=70),
+        WorkspaceTender(tender_id="scored", title="scored", user_id=1, company_id=1, match_score=20),
+        WorkspaceTender(tender_id="unscored", title="unscored", user_id=1, company_id=1),
+    ])
+    db.commit()
+    match_score_store.upsert(db, "scored", profile.id, _result(95))
+
+    assert _listed(user) == [("scored", 95), ("saved", 70), ("unscored", None)]
+
+
+def test_match_all_stores_the_team_scores_without_touching_shared_rows(db):
+    user, profile = _team(db, "A", "Construction")
+    db.add(WorkspaceTender(tender_id="x", title="Road construction in Gauteng", user_id=1, company_id=1,
+                           ai_summary="Construction of roads in Gauteng. Minimum 5 years experience."))
+    db.commit()
+
+    response = route_client(workspace.router, user=user).post(f"{workspace.router.prefix}/tenders/match-all")
+
+    assert response.json()["matched"] == 1
+    db.expire_all()
+    assert db.query(WorkspaceTender.match_score).scalar() is None
+    stored = match_score_store.get(db, "x", profile.id)
+    assert _listed(user) == [("x", stored["suitability_score"])]